@@ -33,6 +33,7 @@ setup(
     install_require=[
         'asyncssh'
         'requests',
+        'aiohttp',
         'PyYAML',
         'cython',
         'ansible',
@@ -5,6 +5,10 @@ from typing import List
 from iqa.abstract.destination.address import Address
 from iqa.abstract.destination.queue import Queue
 from iqa.abstract.server.messaging_server import MessagingServer
+from iqa.utils.plugins import PluginRegistry
+
+# Broker implementations by name (built-in ones are listed in iqa.components.brokers)
+BROKERS: PluginRegistry = PluginRegistry('iqa.brokers')
 
 
 class Broker(MessagingServer):
@@ -14,6 +18,10 @@ class Broker(MessagingServer):
 
     supported_protocols: list = []
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        BROKERS.register_class(cls)
+
     def __init__(self, **kwargs) -> None:
         super(Broker, self).__init__()
 
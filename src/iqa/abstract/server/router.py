@@ -1,5 +1,9 @@
 from iqa.abstract.listener import Listener
 from iqa.abstract.server.messaging_server import MessagingServer
+from iqa.utils.plugins import PluginRegistry
+
+# Router implementations by name (built-in ones are listed in iqa.components.routers)
+ROUTERS: PluginRegistry = PluginRegistry('iqa.routers')
 
 
 class Router(MessagingServer):
@@ -7,6 +11,10 @@ class Router(MessagingServer):
     Abstract abstract Router
     """
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        ROUTERS.register_class(cls)
+
     def get_url(self, port: int = None, listener: Listener = None) -> str:
         return NotImplemented
 
@@ -0,0 +1,116 @@
+"""
+Content hashes of rendered configuration files, used to write only the files
+whose content changed and to push to the node only the files it does not
+have yet.
+"""
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from typing import Callable, Dict, List, Optional
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def hash_file(path: str) -> Optional[str]:
+    """
+    Returns the sha256 digest of the file content, or None if it does not exist.
+    :param path:
+    :return:
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(65536), b''):
+                digest.update(block)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+class ConfigSync(object):
+    """
+    Tracks the configuration rendered into a local directory (relative
+    path -> content hash) and the content pushed to the node.
+    """
+
+    def __init__(self, local_dir: str) -> None:
+        """
+        :param local_dir: directory the configuration is rendered into
+        """
+        self.local_dir: str = local_dir
+        self.rendered: Dict[str, str] = {}
+        self.pushed: Dict[str, str] = {}
+        self.profile_hash: Optional[str] = None
+
+    def render(self, render: Callable[[str], None], profile_path: str) -> List[str]:
+        """
+        Renders the given profile into a staging directory and moves into
+        the local directory only the files whose content has changed.
+        Nothing is rendered if the profile and the rendered files are unchanged.
+        :param render: renders the profile into the given directory
+        :param profile_path:
+        :return: relative paths of the files that changed
+        """
+        profile_hash: Optional[str] = hash_file(profile_path)
+        if profile_hash is not None and profile_hash == self.profile_hash and self._intact():
+            logger.debug('Profile %s unchanged, rendering skipped' % profile_path)
+            return []
+
+        changed: List[str] = []
+        staging: str = tempfile.mkdtemp(prefix='iqa-render-')
+        try:
+            render(staging)
+            rendered: Dict[str, str] = {}
+            for root, _dirs, files in os.walk(staging):
+                for file_name in files:
+                    staged: str = os.path.join(root, file_name)
+                    relative: str = os.path.relpath(staged, staging)
+                    content_hash: str = hash_file(staged)  # type: ignore
+                    rendered[relative] = content_hash
+
+                    target: str = os.path.join(self.local_dir, relative)
+                    if hash_file(target) == content_hash:
+                        continue
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    shutil.move(staged, target)
+                    changed.append(relative)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        self.rendered = rendered
+        self.profile_hash = profile_hash
+        logger.debug(
+            'Rendered %s: %d of %d files changed'
+            % (profile_path, len(changed), len(rendered))
+        )
+        return changed
+
+    def delta(self) -> List[str]:
+        """
+        Returns the rendered files (relative paths) the node does not have yet.
+        :return:
+        """
+        return sorted(
+            relative
+            for relative, content_hash in self.rendered.items()
+            if self.pushed.get(relative) != content_hash
+        )
+
+    def mark_pushed(self, files: List[str]) -> None:
+        for relative in files:
+            self.pushed[relative] = self.rendered[relative]
+
+    def forget_pushed(self) -> None:
+        """
+        Forces the next push to send all files (i.e. node was reinstalled).
+        :return:
+        """
+        self.pushed.clear()
+
+    def _intact(self) -> bool:
+        return bool(self.rendered) and all(
+            hash_file(os.path.join(self.local_dir, relative)) == content_hash
+            for relative, content_hash in self.rendered.items()
+        )
@@ -1,21 +1,71 @@
 import abc
+import functools
 import logging
 import os
 import posixpath
-from typing import Union, Optional
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import dpath.util
 import yaml
 
+from iqa.components.abstract.config_sync import ConfigSync
 from iqa.system.command.command_ansible import CommandBaseAnsible
 from iqa.system.command.command_base import CommandBase
 from iqa.system.executor import ExecutionBase
 from iqa.system.node import NodeAnsible, NodeLocal
-from iqa.system.node.node_docker import NodeDocker
 from iqa.utils.exceptions import IQAConfigurationException
+from iqa.utils.runtime import resolve
 
 LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# libyaml based loader, when available
+YAML_LOADER: type = getattr(yaml, 'CFullLoader', yaml.FullLoader)
+
+# Parsed files by real path, along with the (mtime, size) they were parsed at
+_yaml_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+_yaml_cache_lock: threading.Lock = threading.Lock()
+
+
+def load_yaml(path: str) -> Any:
+    """
+    Returns the parsed content of a YAML file. Files are parsed once per
+    process (until they are modified), so the returned data is shared
+    and must not be modified.
+    :param path:
+    :return:
+    """
+    real_path: str = os.path.realpath(path)
+    stat: os.stat_result = os.stat(real_path)
+    version: Tuple[int, int] = (stat.st_mtime_ns, stat.st_size)
+
+    with _yaml_cache_lock:
+        cached: Optional[Tuple[Tuple[int, int], Any]] = _yaml_cache.get(real_path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with open(real_path, 'r') as f:
+        data: Any = yaml.load(f, Loader=YAML_LOADER)
+
+    with _yaml_cache_lock:
+        _yaml_cache[real_path] = (version, data)
+    return data
+
+
+@functools.lru_cache(maxsize=None)
+def compile_key_path(path: str) -> Optional[Tuple[Union[str, int], ...]]:
+    """
+    Returns the keys of the given path (i.e. broker_xml/acceptors), or None
+    if it contains glob characters (so it must be searched using dpath).
+    :param path:
+    :return:
+    """
+    if any(char in path for char in '*?['):
+        return None
+    return tuple(
+        int(key) if key.isdigit() else key for key in path.strip('/').split('/')
+    )
+
 
 class Configuration(object):
     """Placeholder class of read configuration details from provided input file.
@@ -55,6 +105,9 @@ class Configuration(object):
         else:
             self.local_config_dir = os.getcwd()
 
+        # Content of the configuration rendered and pushed to the node
+        self.config_sync: ConfigSync = ConfigSync(self.local_config_dir)
+
     def _data_getter(
         self, path: str, default: Optional[Union[int, str, list, dict]]
     ) -> Optional[Union[int, str, list, dict]]:
@@ -67,10 +120,22 @@ class Configuration(object):
         :return: found value from provided key path
         :rtype: int | str | list | dict
         """
+        keys: Optional[Tuple[Union[str, int], ...]] = compile_key_path(path)
+        if keys is None:
+            try:
+                return dpath.util.get(self.yaml_data, path)
+            except (KeyError, ValueError):
+                LOGGER.debug('Unknown key or value %s', path)
+                return default
+
+        output: Any = self.yaml_data
         try:
-            output: Union[int, str, list, dict] = dpath.util.get(self.yaml_data, path)
-            # LOGGER.debug('Dpath_search=%s\n%s' % (path, output))
-        except (KeyError, ValueError):
+            for key in keys:
+                if isinstance(output, list):
+                    output = output[int(key)]
+                else:
+                    output = output[key if key in output else str(key)]
+        except (KeyError, IndexError, TypeError, ValueError):
             LOGGER.debug('Unknown key or value %s', path)
             return default
         return output
@@ -83,19 +148,17 @@ class Configuration(object):
         :return: List of initialized abstract servers (as objects)
         :rtype: list
         """
-        with open(path, 'r') as f:
-            try:
-                self.yaml_data = yaml.full_load(f)
-            except yaml.YAMLError:
-                raise IQAConfigurationException(
-                    'Unable to load file "%s" for "%s"'
-                    % (path, self.__class__.__name__)
-                )
+        try:
+            self.yaml_data = load_yaml(path)
+        except yaml.YAMLError:
+            raise IQAConfigurationException(
+                'Unable to load file "%s" for "%s"' % (path, self.__class__.__name__)
+            )
 
-            if 'artemis' not in self.yaml_data['render']['template']:
-                raise IQAConfigurationException(
-                    'Incompatible data structure for %s !' % self.__class__.__name__
-                )
+        if 'artemis' not in self.yaml_data['render']['template']:
+            raise IQAConfigurationException(
+                'Incompatible data structure for %s !' % self.__class__.__name__
+            )
 
     @abc.abstractmethod
     def load_configuration(self) -> None:
@@ -116,13 +179,27 @@ class Configuration(object):
     def restore_config(self) -> None:
         self.apply_config(self.original_config_file)
 
-    def copy_configuration_files(self) -> ExecutionBase:
+    def copy_configuration_files(self, files: Optional[List[str]] = None) -> ExecutionBase:
+        """
+        Copies the local configuration directory to the node.
+        :param files: relative paths of the files to copy (all files if None)
+        :return:
+        """
+        from iqa.system.node.node_docker import NodeDocker
+
         cmd_copy_files: CommandBase = CommandBase(args=[])
         if isinstance(self.component.node, NodeAnsible):
+            ansible_args: str = 'src=%s dest=%s' % (
+                self.local_config_dir,
+                self.node_config_dir,
+            )
+            if files is not None:
+                ansible_args += ' rsync_opts=--files-from=%s' % self._write_files_list(
+                    files
+                )
             cmd_copy_files = CommandBaseAnsible(
                 ansible_module='synchronize',
-                ansible_args='src=%s dest=%s'
-                % (self.local_config_dir, self.node_config_dir),
+                ansible_args=ansible_args,
                 stdout=True,
                 stderr=True,
                 timeout=20,
@@ -135,3 +212,38 @@ class Configuration(object):
             )
 
         return self.component.node.execute(cmd_copy_files)
+
+    def push_configuration(self) -> List[str]:
+        """
+        Copies to the node only the rendered files it does not have yet.
+        :return: relative paths of the copied files (empty if node is up to date)
+        """
+        files: List[str] = self.config_sync.delta()
+        if not files:
+            LOGGER.debug('Configuration of %s is up to date' % self.component.instance_name)
+            return files
+
+        execution: ExecutionBase = self.copy_configuration_files(files)
+        resolve(execution.wait())
+        if not execution.completed_successfully():
+            LOGGER.error(execution.read_stderr())
+            raise IQAConfigurationException('Unable to copy config files to node.')
+
+        self.config_sync.mark_pushed(files)
+        LOGGER.debug(
+            'Copied %d configuration files to %s'
+            % (len(files), self.component.instance_name)
+        )
+        return files
+
+    def _write_files_list(self, files: List[str]) -> str:
+        """
+        Writes the list of files to copy (rsync --files-from) next to the
+        local configuration directory, so it is not copied itself.
+        :param files:
+        :return: path of the list
+        """
+        path: str = '%s.files' % self.local_config_dir.rstrip('/')
+        with open(path, 'w') as f:
+            f.write('\n'.join(files) + '\n')
+        return path
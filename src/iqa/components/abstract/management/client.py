@@ -24,3 +24,9 @@ class ManagementClient(ABC):
         :param remove_consumers:
         :return:
         """
+
+    def close(self) -> None:
+        """
+        Releases resources (i.e. connections) held by the client.
+        :return:
+        """
@@ -1,10 +1,12 @@
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 from iqa.abstract.listener import Listener
 from iqa.components.abstract.component import Component
 from iqa.components.abstract.configuration import Configuration
 from iqa.components.abstract.management.client import ManagementClient
 from iqa.system.node.node import Node
+from iqa.system.service.liveness import LivenessWatcher
+from iqa.system.service.probe import Probe, TcpProbe
 from iqa.system.service.service import Service
 
 
@@ -28,6 +30,60 @@ class ServerComponent(Component):
         self.configuration: Optional[Configuration] = configuration
         self.listeners: Optional[List[Listener]] = listeners
         self.management_client: ManagementClient = self.get_management_client()
+        self._liveness: Optional[LivenessWatcher] = None
+
+        # Services with no readiness check of their own (systemd, system init
+        # and docker) are ready once the component ports accept connections
+        if self.service is not None and self.service.probe is None:
+            self.service.probe = self.default_probe()
+
+    def get_ports(self) -> List[int]:
+        """
+        Ports the component listens on, used by the default readiness probe.
+        :return:
+        """
+        return [
+            int(listener.port)  # type: ignore
+            for listener in self.listeners or []
+            if getattr(listener, 'port', None)
+        ]
+
+    def default_probe(self) -> Optional[Probe]:
+        """
+        Readiness probe requiring all ports of the component to accept
+        TCP connections (None when no port is known).
+        :return:
+        """
+        host: str = self.node.ip or self.node.hostname
+        probe: Optional[Probe] = None
+        for port in sorted(set(self.get_ports())):
+            tcp_probe: TcpProbe = TcpProbe(host, port)
+            probe = tcp_probe if probe is None else probe & tcp_probe
+        return probe
+
+    def watch_liveness(self) -> LivenessWatcher:
+        """
+        Starts (if not yet started) watching the main process of the service,
+        so crashes are detected as they happen and downtime windows recorded.
+        :return: the liveness watcher of the component
+        """
+        if self._liveness is None:
+            self._liveness = LivenessWatcher(self.service)
+        return self._liveness.start()
+
+    def close(self) -> None:
+        """
+        Stops watching the service and closes the management client connections.
+        :return:
+        """
+        if self._liveness is not None:
+            self._liveness.stop()
+
+        close: Optional[Callable[[], None]] = getattr(
+            self.management_client, 'close', None
+        )
+        if close is not None:
+            close()
 
     def get_management_client(self) -> ManagementClient:
         raise NotImplementedError
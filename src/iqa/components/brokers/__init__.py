@@ -1,8 +1,17 @@
-from iqa.abstract.server.broker import Broker
+from iqa.abstract.server.broker import BROKERS
 from iqa.system.executor import ExecutorBase
 from iqa.system.node.node import Node
 from iqa.system.service.service import Service
 
+# Built-in broker implementations, only imported when first used
+BROKERS.update(
+    {
+        'activemq': 'iqa.components.brokers.activemq.activemq:Activemq',
+        'artemis': 'iqa.components.brokers.artemis.artemis:Artemis',
+        'qpid': 'iqa.components.brokers.qpid.qpid:Qpid',
+    },
+)
+
 
 class BrokerFactory(object):
     @staticmethod
@@ -14,14 +23,11 @@ class BrokerFactory(object):
         **kwargs
     ):
 
-        for broker in Broker.__subclasses__():
-
-            # Ignore broker with different implementation
-            if broker.implementation != implementation:
-                continue
-
-            name: str = '%s-%s-%s' % ('broker', broker.__name__, node.hostname)
+        try:
+            broker = BROKERS.get(implementation)
+        except ValueError:
+            raise ValueError('Invalid broker implementation: %s' % implementation)
 
-            return broker(name=name, node=node, service=service_impl, **kwargs)  # type: ignore
+        name: str = '%s-%s-%s' % ('broker', broker.__name__, node.hostname)
 
-        raise ValueError('Invalid broker implementation: %s' % implementation)
+        return broker(name=name, node=node, service=service_impl, **kwargs)  # type: ignore
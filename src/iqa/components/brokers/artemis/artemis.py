@@ -1,5 +1,6 @@
+import asyncio
 import logging
-from typing import List, Optional
+from typing import Callable, Iterable, List, Optional, Sequence, Union
 
 from iqa.abstract.destination.address import Address
 from iqa.abstract.destination.queue import Queue
@@ -10,7 +11,18 @@ from iqa.components.abstract.server.server_component import ServerComponent
 from iqa.components.brokers.artemis.artemis_config import ArtemisConfig
 from iqa.components.brokers.artemis.management.jolokia_client import (
     ArtemisJolokiaClient,
+    ArtemisJolokiaClientResult,
 )
+from iqa.components.brokers.artemis.management.jolokia_client_async import (
+    AsyncArtemisJolokiaClient,
+)
+from iqa.components.brokers.artemis.metrics import BrokerMetricsSampler
+from iqa.components.brokers.artemis.provisioning import (
+    Destination,
+    DestinationProvisioner,
+    ProvisioningReport,
+)
+from iqa.components.brokers.artemis.topology import ArtemisTopology
 from iqa.components.protocols.amqp import AMQP10
 from iqa.components.protocols.mqtt import MQTT
 from iqa.components.protocols.openwire import Openwire
@@ -35,40 +47,133 @@ class Artemis(ServerComponent, Broker):
         **kwargs
     ) -> None:
         self.instance_name = name
-        self._queues: List[Queue] = list()
-        self._addresses: List[Address] = list()
-        self._addresses_dict: dict = {}
+        self.topology: ArtemisTopology = ArtemisTopology(
+            float(kwargs.get('broker_topology_ttl', 0))
+        )
         self.configuration: ArtemisConfig = ArtemisConfig(self, **kwargs)
         self.configuration.create_configuration(
             kwargs.get('inventory_file', 'inventory.yml')
         )
         super(Artemis, self).__init__(name, node, listeners, self.configuration, **kwargs)  # type: ignore
         self.management_client: ArtemisJolokiaClient = self.get_management_client()  # type: ignore
+        self._async_management_client: Optional[AsyncArtemisJolokiaClient] = None
+        self.metrics: Optional[BrokerMetricsSampler] = None
         self.users = self.configuration.users
 
-    def queues(self, refresh: bool = True) -> List[Queue]:
+    def get_ports(self) -> List[int]:
         """
-        Retrieves and lists all queues
-        :param refresh:
+        Ports the broker is known to serve: the web console and the listeners
+        from the inventory. Other acceptors of the configuration are not
+        included, as they may be disabled or not bound, in which case the
+        default readiness probe would never pass.
         :return:
         """
-        if self._queues and not refresh:
-            return self._queues
+        ports: List[int] = super(Artemis, self).get_ports()
+        if self.configuration.ports.get('web'):
+            ports.append(int(self.configuration.ports['web']))
+        return ports
 
-        self._refresh_addresses_and_queues()
-        return self._queues
+    def queues(self, refresh: Optional[bool] = None) -> List[Queue]:
+        """
+        Retrieves and lists all queues
+        :param refresh: True forces a refresh, False uses the cached topology
+                        (if loaded), None refreshes once broker_topology_ttl expired
+        :return:
+        """
+        if self._topology_expired(refresh):
+            self._refresh_addresses_and_queues()
+        return self.topology.queues
 
-    def addresses(self, refresh: bool = True) -> List[Address]:
+    def addresses(self, refresh: Optional[bool] = None) -> List[Address]:
         """
         Retrieves and lists all addresses
-        :param refresh:
+        :param refresh: see queues
         :return:
         """
-        if self._addresses and not refresh:
-            return self._addresses
+        if self._topology_expired(refresh):
+            self._refresh_addresses_and_queues()
+        return self.topology.addresses
 
-        self._refresh_addresses_and_queues()
-        return self._addresses
+    def get_queue(self, name: str, refresh: Optional[bool] = None) -> Optional[Queue]:
+        """
+        Returns the queue with the given name or FQQN (address::queue)
+        :param name:
+        :param refresh: see queues
+        :return:
+        """
+        if self._topology_expired(refresh):
+            self._refresh_addresses_and_queues()
+        return self.topology.get_queue(name)
+
+    def get_address(self, name: str, refresh: Optional[bool] = None) -> Optional[Address]:
+        """
+        Returns the address with the given name
+        :param name:
+        :param refresh: see queues
+        :return:
+        """
+        if self._topology_expired(refresh):
+            self._refresh_addresses_and_queues()
+        return self.topology.get_address(name)
+
+    def create_destinations(
+        self,
+        destinations: Iterable[Destination],
+        durable: bool = True,
+        if_missing: bool = True,
+        chunk_size: int = 500,
+        progress: Optional[Callable[[ProvisioningReport], None]] = None,
+    ) -> ProvisioningReport:
+        """
+        Creates many addresses and queues (list or generator) through
+        concurrent bulk requests
+        :param destinations: Address and Queue instances
+        :param durable: whether queues are durable
+        :param if_missing: skip the ones already present on the broker
+        :param chunk_size: requests sent in each bulk request
+        :param progress: called with the report after each bulk request
+        :return:
+        """
+        return DestinationProvisioner(self, chunk_size, progress=progress).create(
+            destinations, durable, if_missing
+        )
+
+    def delete_destinations(
+        self,
+        destinations: Iterable[Destination],
+        force: bool = True,
+        remove_consumers: bool = True,
+        if_present: bool = True,
+        chunk_size: int = 500,
+        progress: Optional[Callable[[ProvisioningReport], None]] = None,
+    ) -> ProvisioningReport:
+        """
+        Deletes many addresses and queues through concurrent bulk requests
+        :param destinations: Address and Queue instances
+        :param force: remove addresses along with their queues
+        :param remove_consumers: remove queues even if they have consumers
+        :param if_present: skip the ones not present on the broker
+        :param chunk_size: requests sent in each bulk request
+        :param progress: called with the report after each bulk request
+        :return:
+        """
+        return DestinationProvisioner(self, chunk_size, progress=progress).delete(
+            destinations, force, remove_consumers, if_present
+        )
+
+    def invalidate_topology(self) -> None:
+        """
+        Discards the cached addresses and queues, so they are retrieved
+        again on next read. Addresses and queues created or deleted through
+        this broker instance invalidate it automatically.
+        :return:
+        """
+        self.topology.invalidate()
+
+    def _topology_expired(self, refresh: Optional[bool]) -> bool:
+        if refresh is None:
+            return self.topology.expired()
+        return refresh or not self.topology.loaded
 
     def create_address(self, address: Address):
         """
@@ -77,6 +182,7 @@ class Artemis(ServerComponent, Broker):
         :return:
         """
         routing_type = self._get_routing_type(address.routing_type)
+        self.topology.invalidate()
         return self.management_client.create_address(address.name, routing_type)
 
     def create_queue(self, queue: Queue, address: Address, durable: bool = True):
@@ -89,6 +195,7 @@ class Artemis(ServerComponent, Broker):
         """
         if queue.routing_type == RoutingType.BOTH:
             raise ValueError('Queues can only use ANYCAST or MULTICAST routing type')
+        self.topology.invalidate()
         return self.management_client.create_queue(
             address.name, queue.name, durable, queue.routing_type.name
         )
@@ -100,6 +207,7 @@ class Artemis(ServerComponent, Broker):
         :param force:
         :return:
         """
+        self.topology.invalidate()
         return self.management_client.delete_address(name, force)
 
     def delete_queue(self, name: str, remove_consumers: bool = False):
@@ -109,6 +217,7 @@ class Artemis(ServerComponent, Broker):
         :param remove_consumers:
         :return:
         """
+        self.topology.invalidate()
         return self.management_client.delete_queue(name, remove_consumers)
 
     def _refresh_addresses_and_queues(self):
@@ -117,69 +226,144 @@ class Artemis(ServerComponent, Broker):
         and vice-versa.
         :return:
         """
-        # Retrieving queues
-        queues: list = list()
-        addresses: list = list()
+        # Both lists are retrieved in a single request
+        with self.management_client.batch() as batch:
+            queues_result = batch.list_queues()
+            addresses_result = batch.list_addresses()
 
-        # Get a new client instance
-        queues_result = self.management_client.list_queues()
-        addresses_result = self.management_client.list_addresses()
+        self._update_addresses_and_queues(queues_result, addresses_result)
 
-        # In case of errors, return empty list
+    def _update_addresses_and_queues(
+        self,
+        queues_result: ArtemisJolokiaClientResult,
+        addresses_result: ArtemisJolokiaClientResult,
+    ) -> None:
+        """
+        Applies the retrieved queues and addresses to the cached topology.
+        :param queues_result:
+        :param addresses_result:
+        :return:
+        """
+        # In case of errors, keep the current topology
         if not queues_result.success:
             logging.getLogger().warning('Unable to retrieve queues')
             return
 
-        # In case of errors, return empty list
         if not addresses_result.success:
             logging.getLogger().warning('Unable to retrieve addresses')
             return
 
-        # Dictionary containing retrieved addresses
-        addresses_dict = {}
-
-        # If no address found, skip it
         if not addresses_result.data:
             logging.debug('No addresses available')
-        else:
-            # Parsing returned addresses
-            for addr_info in addresses_result.data:
-                logging.debug(
-                    'Address found: %s - routingType: %s'
-                    % (addr_info['name'], addr_info['routingTypes'])
-                )
-                address: Address = Address(
-                    name=addr_info['name'],
-                    routing_type=RoutingType.from_value(addr_info['routingTypes']),
-                )
-                addresses_dict[address.name] = address
-                addresses.append(address)
-
-        # If no queues returned
+
         if not queues_result.data:
             logging.debug('No queues available')
-        else:
-            # Parsing returned queues
-            for queue_info in queues_result.data:
-                logging.debug(
-                    'Queue found: %s - routingType: %s'
-                    % (queue_info['name'], queue_info['routingType'])
-                )
-                routing_type: RoutingType = RoutingType.from_value(
-                    queue_info['routingType']
-                )
-                address: Address = addresses_dict[queue_info['address']]
-                queue: Queue = Queue(
-                    name=queue_info['name'], routing_type=routing_type, address=address
-                )
-                queue.message_count = queue_info['messageCount']
-                address.queues.append(queue)
-                queues.append(queue)
-
-        # Updating broker data
-        self._addresses_dict = addresses_dict
-        self._addresses = addresses
-        self._queues = queues
+
+        self.topology.update(addresses_result.data or [], queues_result.data or [])
+
+    async def queues_async(self, refresh: Optional[bool] = None) -> List[Queue]:
+        """
+        Awaitable variant of queues.
+        :param refresh:
+        :return:
+        """
+        if self._topology_expired(refresh):
+            await self._refresh_addresses_and_queues_async()
+        return self.topology.queues
+
+    async def addresses_async(self, refresh: Optional[bool] = None) -> List[Address]:
+        """
+        Awaitable variant of addresses.
+        :param refresh:
+        :return:
+        """
+        if self._topology_expired(refresh):
+            await self._refresh_addresses_and_queues_async()
+        return self.topology.addresses
+
+    async def create_address_async(self, address: Address) -> ArtemisJolokiaClientResult:
+        routing_type = self._get_routing_type(address.routing_type)
+        self.topology.invalidate()
+        return await self.async_management_client.create_address(
+            address.name, routing_type
+        )
+
+    async def create_queue_async(
+        self, queue: Queue, address: Address, durable: bool = True
+    ) -> ArtemisJolokiaClientResult:
+        if queue.routing_type == RoutingType.BOTH:
+            raise ValueError('Queues can only use ANYCAST or MULTICAST routing type')
+        self.topology.invalidate()
+        return await self.async_management_client.create_queue(
+            address.name, queue.name, durable, queue.routing_type.name
+        )
+
+    async def delete_address_async(
+        self, name: str, force: bool = False
+    ) -> ArtemisJolokiaClientResult:
+        self.topology.invalidate()
+        return await self.async_management_client.delete_address(name, force)
+
+    async def delete_queue_async(
+        self, name: str, remove_consumers: bool = False
+    ) -> ArtemisJolokiaClientResult:
+        self.topology.invalidate()
+        return await self.async_management_client.delete_queue(name, remove_consumers)
+
+    async def read_attribute_async(
+        self, attribute: Union[str, List[str]], mbean: Optional[str] = None
+    ) -> ArtemisJolokiaClientResult:
+        return await self.async_management_client.read_attribute(attribute, mbean)
+
+    async def _refresh_addresses_and_queues_async(self) -> None:
+        queues_result, addresses_result = await asyncio.gather(
+            self.async_management_client.list_queues(),
+            self.async_management_client.list_addresses(),
+        )
+        self._update_addresses_and_queues(queues_result, addresses_result)
+
+    @property
+    def async_management_client(self) -> AsyncArtemisJolokiaClient:
+        """
+        Asyncio Jolokia client (created on first use), used by the awaitable
+        variants of the management operations.
+        :return:
+        """
+        if self._async_management_client is None:
+            self._async_management_client = AsyncArtemisJolokiaClient(
+                self.configuration.instance_name,  # type: ignore
+                self.node.ip,
+                self.configuration.ports['web'],
+                'admin',
+                self.configuration.get_user_password('admin'),
+            )
+        return self._async_management_client
+
+    def sample_metrics(
+        self,
+        interval: float = 1.0,
+        queues: Optional[Sequence[str]] = None,
+        capacity: int = 86400,
+    ) -> BrokerMetricsSampler:
+        """
+        Starts sampling broker (and queue) metrics in background,
+        replacing the sampler previously started (if any).
+        :param interval: seconds between samples
+        :param queues: names (or FQQNs) of the queues to sample, None for all of them
+        :param capacity: max number of samples kept per series
+        :return:
+        """
+        if self.metrics is not None:
+            self.metrics.stop()
+        self.metrics = BrokerMetricsSampler(self, interval, queues, capacity)
+        return self.metrics.start()
+
+    def close(self) -> None:
+        if self.metrics is not None:
+            self.metrics.stop()
+        super(Artemis, self).close()
+        if self._async_management_client is not None:
+            self._async_management_client.close_threadsafe()
 
     def get_management_client(self) -> ArtemisJolokiaClient:  # type: ignore
         """
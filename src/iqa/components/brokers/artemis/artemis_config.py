@@ -1,6 +1,8 @@
 import logging
 import posixpath
-from typing import Optional, Union
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple, Union
 
 from amqcfg import amqcfg
 
@@ -8,11 +10,14 @@ from iqa.abstract.user import User
 from iqa.components.abstract.server.server_component import ServerComponent
 from iqa.components.brokers.broker_config import BrokerConfiguration
 from iqa.system.executor import ExecutorBase
-from iqa.system.executor import ExecutionBase
 from iqa.system.service import ServiceFakeArtemis
 from iqa.utils.exceptions import IQAConfigurationException
 from iqa.utils.utils import remove_prefix
 
+# amqcfg may not be thread-safe, profiles are rendered one at a time
+# (by all brokers of the process, not only within an apply_configs call)
+_render_lock: threading.Lock = threading.Lock()
+
 
 class ArtemisConfig(BrokerConfiguration):
     """Placeholder class of read configuration details for Artemis/AMQ 7
@@ -176,38 +181,98 @@ class ArtemisConfig(BrokerConfiguration):
     def get_user_password(self, username: str) -> str:
         return self._get_user(username).password
 
-    def apply_config(self, yaml_configuration_path: str, restart: bool = True):
-        # self.store_configuration()
-        self.component.service = ServiceFakeArtemis(None, ExecutorBase())
-
-        try:
-            # Todo hacky way to turn off debug logging from amqcfg module
+    def render_config(self, yaml_configuration_path: str) -> List[str]:
+        """
+        Renders the given profile into the local configuration directory,
+        writing only the files whose content has changed.
+        :param yaml_configuration_path:
+        :return: relative paths of the changed files
+        """
+        # Todo hacky way to turn off debug logging from amqcfg module
+        amqcfg.LOG.setLevel(logging.WARN)
+        if self.LOGGER.level != logging.DEBUG:
             amqcfg.LOG.setLevel(logging.WARN)
-            if self.LOGGER.level != logging.DEBUG:
-                amqcfg.LOG.setLevel(logging.WARN)
-            amqcfg.generate(
+        return self.config_sync.render(
+            lambda output_path: amqcfg.generate(
                 profile=yaml_configuration_path,
-                output_path=self.local_config_dir,
+                output_path=output_path,
                 write_profile_data=True,
-            )
-            execution: ExecutionBase = self.copy_configuration_files()
-
-            if execution.completed_successfully():
-                self.load_configuration_yaml(yaml_configuration_path)
-                self.load_configuration()
-            else:
-                self.LOGGER.error(execution.read_stderr())
-                raise IQAConfigurationException('Unable to copy config files to node.')
+            ),
+            yaml_configuration_path,
+        )
+
+    def apply_config(self, yaml_configuration_path: str, restart: bool = True) -> bool:
+        """
+        Renders the given profile, copies the changed files to the node and
+        restarts the broker (nothing is done if the configuration is unchanged).
+        :param yaml_configuration_path:
+        :param restart:
+        :return: True if the configuration of the node changed
+        """
+        return apply_configs([(self, yaml_configuration_path)], restart)[0]
+
+    def _update_config(self, yaml_configuration_path: str) -> bool:
+        self.component.service = ServiceFakeArtemis(None, ExecutorBase())
+
+        try:
+            with _render_lock:
+                self.render_config(yaml_configuration_path)
+            if not self.push_configuration():
+                self.LOGGER.info(
+                    'Configuration from "%s" already applied.' % yaml_configuration_path
+                )
+                return False
+
+            self.load_configuration_yaml(yaml_configuration_path)
+            self.load_configuration()
         except Exception:
             self.restore_config()
             raise IQAConfigurationException(
                 'Unable to apply new configuration. Original config kept.'
             )
-        finally:
-            self.LOGGER.info(
-                'Configuration from "%s" successfully applied.'
-                % yaml_configuration_path
+
+        self.LOGGER.info(
+            'Configuration from "%s" successfully applied.' % yaml_configuration_path
+        )
+        return True
+
+
+def apply_configs(
+    configurations: Sequence[Tuple[ArtemisConfig, str]], restart: bool = True
+) -> List[bool]:
+    """
+    Applies configuration profiles to many brokers (i.e. a cluster): profiles
+    are rendered one at a time, while changed files are copied to the nodes
+    and the brokers restarted in parallel. Brokers whose configuration
+    did not change are not restarted.
+    :param configurations: broker configuration and profile to apply
+    :param restart:
+    :return: whether the configuration of each broker changed
+    """
+    if not configurations:
+        return []
+
+    with ThreadPoolExecutor(max_workers=len(configurations)) as pool:
+        changed: List[bool] = list(
+            pool.map(
+                lambda configuration: configuration[0]._update_config(
+                    configuration[1]
+                ),
+                configurations,
+            )
+        )
+
+        if restart:
+            services: list = [
+                config.component.service
+                for (config, _path), config_changed in zip(configurations, changed)
+                if config_changed and config.component.service is not None
+            ]
+            list(
+                pool.map(
+                    lambda service: service.restart(wait=True, wait_for_messaging=True),
+                    services,
+                )
             )
 
-        if restart and self.component.service is not None:
-            self.component.service.restart(wait_for_messaging=True)
+    return changed
@@ -2,13 +2,20 @@
 Generic client for communicating with Jolokia API through POST requests.
 """
 
-import copy
+import base64
 import json
 import logging
-from typing import Optional
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import requests
 from requests import RequestException
+from requests.adapters import HTTPAdapter
+
+# Key property of an MBean name (value may be quoted)
+MBEAN_PROPERTY = re.compile(r'([^,=]+)=("(?:[^"\\]|\\.)*"|[^,]*)')
 
 
 class ArtemisJolokiaClientResult(Exception):
@@ -21,15 +28,12 @@ class ArtemisJolokiaClientResult(Exception):
         self.error: Optional[str] = None
         self.error_type: Optional[str] = None
         self.data: Optional[list] = None
-        self.response: requests.Response
+        self.value: Any = None
+        self.response: Optional[requests.Response] = None
 
     @staticmethod
     def from_jolokia_response(jolokia_response):
         res = ArtemisJolokiaClientResult()
-        res.success = False
-        res.error = None
-        res.error_type = None
-        res.data = None
         res.response = jolokia_response
 
         # If no jolokia_response provided
@@ -41,26 +45,40 @@ class ArtemisJolokiaClientResult(Exception):
             return res
 
         # If not a valid JSON returned
-        json_response: Optional[requests.Response] = None
+        json_response: Optional[dict] = None
         try:
             json_response = jolokia_response.json()
         except ValueError:
             logging.getLogger().exception('Invalid JSON returned')
 
+        return res.load(json_response)
+
+    def load(self, json_response: Optional[dict]) -> 'ArtemisJolokiaClientResult':
+        """
+        Loads the given (parsed) response of a single Jolokia request.
+        :param json_response:
+        :return: self
+        """
+        if not isinstance(json_response, dict):
+            self.error = 'Invalid Jolokia Response'
+            return self
+
         if 'error' in json_response:
-            res.error = json_response['error']
-            res.error_type = json_response['error_type']
+            self.error = json_response['error']
+            self.error_type = json_response.get('error_type')
             logging.getLogger().debug(
-                'Jolokia error_type = "%s" - error = "%s"' % (res.error_type, res.error)
+                'Jolokia error_type = "%s" - error = "%s"'
+                % (self.error_type, self.error)
             )
-            return res
+            return self
 
         # At this point, response looks positive
-        res.success = True
-        return res
+        self.success = True
+        self.value = json_response.get('value')
+        return self
 
     @staticmethod
-    def from_exception(exception: RequestException):
+    def from_exception(exception: Exception):
         res: ArtemisJolokiaClientResult = ArtemisJolokiaClientResult()
         res.success = False
         res.error = exception.__str__()
@@ -69,27 +87,373 @@ class ArtemisJolokiaClientResult(Exception):
         return res
 
 
-class ArtemisJolokiaClient(object):
+class JolokiaRequest(object):
     """
-    Provides a generic mechanism to query Jolokia API exposed by ActiveMQ Artemis.
+    A single Jolokia request: its JSON payload, built once and posted
+    as is, and the (optional) parser of its result.
     """
 
+    __slots__ = ('payload', 'parser')
+
     def __init__(
-        self, broker_name: str, ip: Optional[str], port: str, user: str, password: str
+        self,
+        payload: dict,
+        parser: Optional[Callable[['ArtemisJolokiaClientResult'], None]] = None,
     ) -> None:
+        self.payload: dict = payload
+        self.parser: Optional[Callable[['ArtemisJolokiaClientResult'], None]] = parser
+
+    @staticmethod
+    def read(
+        mbean: str,
+        attribute: Union[str, List[str]],
+        config: Optional[dict] = None,
+        parser: Optional[Callable[['ArtemisJolokiaClientResult'], None]] = None,
+    ) -> 'JolokiaRequest':
+        """
+        Returns a request reading the given attribute(s) of an MBean (or pattern).
+        :param mbean:
+        :param attribute:
+        :param config: Jolokia processing parameters
+        :param parser:
+        :return:
+        """
+        payload: dict = {'type': 'read', 'mbean': mbean, 'attribute': attribute}
+        if config:
+            payload['config'] = config
+        return JolokiaRequest(payload, parser)
+
+    @property
+    def arguments(self) -> list:
+        return self.payload.get('arguments', [])
+
+    def to_json(self) -> dict:
+        return self.payload
+
+
+class JolokiaOperation(object):
+    """
+    Precompiled exec request of an MBean operation (MBean name, operation
+    signature and encoder of its arguments), so each call only builds the
+    payload from the given arguments.
+    """
+
+    __slots__ = ('mbean', 'operation', 'encoder')
+
+    def __init__(
+        self, mbean: str, operation: str, encoder: Optional[Callable[..., list]] = None
+    ) -> None:
+        """
+        :param mbean:
+        :param operation: signature, i.e. deleteAddress(java.lang.String,boolean)
+        :param encoder: returns the operation arguments from the given ones
+        """
+        self.mbean: str = mbean
+        self.operation: str = operation
+        self.encoder: Optional[Callable[..., list]] = encoder
+
+    def request(self, *arguments: Any) -> JolokiaRequest:
+        return JolokiaRequest(
+            {
+                'type': 'exec',
+                'mbean': self.mbean,
+                'operation': self.operation,
+                'arguments': self.encoder(*arguments) if self.encoder else list(arguments),
+            }
+        )
+
+
+def encode_name_filter(name: str, exact: bool, page: int, page_size: int) -> list:
+    """
+    Encodes the arguments of the listing operations (JSON filter by name and paging).
+    :param name:
+    :param exact:
+    :param page:
+    :param page_size:
+    :return:
+    """
+    name_filter: str = json.dumps(
+        {'field': 'NAME', 'operation': 'EQUALS' if exact else 'CONTAINS', 'value': name}
+    )
+    return [name_filter, page, page_size]
+
+
+def parse_mbean_properties(mbean: str) -> Dict[str, str]:
+    """
+    Returns the key properties of an MBean name (unquoting their values), i.e.
+    org.apache.activemq.artemis:broker="amq",component=addresses,address="a1"
+    :param mbean:
+    :return:
+    """
+    properties: Dict[str, str] = {}
+    for match in MBEAN_PROPERTY.finditer(mbean.split(':', 1)[-1]):
+        value: str = match.group(2)
+        if value.startswith('"'):
+            value = re.sub(r'\\(.)', r'\1', value[1:-1])
+        properties[match.group(1)] = value
+    return properties
+
+
+class ArtemisJolokiaClientBase(object):
+    """
+    Request building and paging shared by the Jolokia clients of ActiveMQ
+    Artemis, which only differ on how requests are posted (blocking or asyncio).
+    """
+
+    # Size of the first page of listings (which tells the total count)
+    PAGE_SIZE: int = 100
+    # Max size of the pages used to retrieve the remaining results
+    MAX_PAGE_SIZE: int = 1000
+    # Pages requested together in each bulk request
+    PAGES_PER_REQUEST: int = 10
+
+    def __init__(
+        self,
+        broker_name: str,
+        ip: Optional[str],
+        port: str,
+        user: str,
+        password: str,
+        pool_size: int = 4,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 60.0,
+    ) -> None:
+        """
+        :param broker_name:
+        :param ip:
+        :param port:
+        :param user:
+        :param password:
+        :param pool_size: max number of (keep-alive) connections kept to the broker
+        :param connect_timeout: seconds to wait for a connection to be established
+        :param read_timeout: seconds to wait for a response
+        """
         # Internal only
         self._ip: Optional[str] = ip
         self._port: str = port
         self._user: str = user
         self._password: str = password
+        self._url: str = 'http://%s:%s/console/jolokia' % (ip, port)
+
+        # HTTP connections are reused by all requests to the broker
+        self.pool_size: int = pool_size
+        self.timeout: Tuple[float, float] = (connect_timeout, read_timeout)
+        self._authorization: str = 'Basic %s' % base64.b64encode(
+            ('%s:%s' % (user, password)).encode('latin1')
+        ).decode('ascii')
 
-        # Request info (generic)
-        self.type: str = 'exec'
+        # Requests are sent to the broker MBean
         self.mbean: str = 'org.apache.activemq.artemis:broker="%s"' % broker_name
+        self._list_queues: JolokiaOperation = JolokiaOperation(
+            self.mbean, 'listQueues(java.lang.String,int,int)', encode_name_filter
+        )
+        self._list_addresses: JolokiaOperation = JolokiaOperation(
+            self.mbean, 'listAddresses(java.lang.String,int,int)', encode_name_filter
+        )
+        self._delete_address: JolokiaOperation = JolokiaOperation(
+            self.mbean, 'deleteAddress(java.lang.String,boolean)'
+        )
+        self._delete_queue: JolokiaOperation = JolokiaOperation(
+            self.mbean, 'destroyQueue(java.lang.String,boolean)'
+        )
+        self._create_address: JolokiaOperation = JolokiaOperation(
+            self.mbean, 'createAddress(java.lang.String,java.lang.String)'
+        )
+        self._create_queue: JolokiaOperation = JolokiaOperation(
+            self.mbean,
+            'createQueue(java.lang.String,java.lang.String,boolean,java.lang.String)',
+        )
+
+    def _queue_metrics_request(
+        self, attributes: List[str], address: str = '*'
+    ) -> JolokiaRequest:
+        """
+        Returns the pattern read of the given attributes of all queues
+        (or of the queues of the given address), see read_queue_metrics.
+        :param attributes:
+        :param address:
+        :return:
+        """
+        mbean: str = (
+            '%s,component=addresses,address=%s,subcomponent=queues,routing-type=*,queue=*'
+            % (self.mbean, '*' if address == '*' else '"%s"' % address)
+        )
+        # Queues not having some attribute must not fail the whole read
+        request: JolokiaRequest = JolokiaRequest.read(
+            mbean, list(attributes), {'ignoreErrors': True}, self._parse_queue_metrics
+        )
+        return request
+
+    @staticmethod
+    def _parse_queue_metrics(result: ArtemisJolokiaClientResult) -> None:
+        """
+        Maps the values read by MBean (pattern read) to the name of the queues.
+        :param result:
+        :return:
+        """
+        if not result.success:
+            return
+
+        metrics: Dict[str, dict] = {}
+        rows: List[dict] = []
+        for mbean, attributes in (result.value or {}).items():
+            properties: Dict[str, str] = parse_mbean_properties(mbean)
+            if 'queue' not in properties or not isinstance(attributes, dict):
+                continue
+            metrics[properties['queue']] = attributes
+            row: dict = {
+                'name': properties['queue'],
+                'address': properties.get('address'),
+                'routingType': properties.get('routing-type', '').upper(),
+            }
+            row.update(attributes)
+            rows.append(row)
+
+        result.value = metrics
+        result.data = rows
+
+    @staticmethod
+    def _merge_pages(
+        result: ArtemisJolokiaClientResult,
+        all_data: list,
+        pages: List[ArtemisJolokiaClientResult],
+    ) -> ArtemisJolokiaClientResult:
+        """
+        Sets the data of all pages (in order) to the result of the first one.
+        :param result:
+        :param all_data: data of the first page
+        :param pages: remaining pages
+        :return: result
+        """
+        for page in pages:
+            if page.error:
+                result.success = False
+                result.error, result.error_type = page.error, page.error_type
+                break
+            all_data.extend(page.data or [])
+
+        if all_data and result:
+            result.data = all_data
+
+        return result
+
+    def _plan_pages(
+        self,
+        request: JolokiaRequest,
+        page_arg_index: int,
+        total: int,
+        retrieved: int,
+        max_page_size: Optional[int] = None,
+    ) -> Tuple[List[List[dict]], int]:
+        """
+        Page requests needed to retrieve the results after the first "retrieved" ones,
+        grouped in bulk requests of PAGES_PER_REQUEST pages.
+        Page size is increased (as a multiple of the current one, so that
+        page boundaries are kept), so results already retrieved may be returned again.
+        :param request:
+        :param page_arg_index:
+        :param total:
+        :param retrieved:
+        :param max_page_size: defaults to MAX_PAGE_SIZE
+        :return: bulk requests and number of results to skip from the first page
+        """
+        page_size: int = request.arguments[page_arg_index + 1]
+        if max_page_size is not None:
+            page_size = min(page_size, max_page_size)
+        remaining: int = total - retrieved
+        size: int = max(page_size, min(max_page_size or self.MAX_PAGE_SIZE, remaining))
+        size = -(-size // page_size) * page_size
+
+        first: int = retrieved // size + 1
+        skip: int = retrieved - (first - 1) * size
+        last: int = -(-total // size)
+
+        json_requests: List[dict] = []
+        for page in range(first, last + 1):
+            arguments: list = list(request.arguments)
+            arguments[page_arg_index] = page
+            arguments[page_arg_index + 1] = size
+            json_requests.append(dict(request.to_json(), arguments=arguments))
+
+        chunks: List[List[dict]] = [
+            json_requests[index:index + self.PAGES_PER_REQUEST]
+            for index in range(0, len(json_requests), self.PAGES_PER_REQUEST)
+        ]
+        return chunks, skip
+
+    @staticmethod
+    def _pages_capped(
+        pages: List[ArtemisJolokiaClientResult], total: int, retrieved: int
+    ) -> bool:
+        """
+        Returns True if the server returned fewer results than requested
+        (its page size is limited), so pages must be retrieved again
+        using the size of the first page.
+        """
+        if any(page.error for page in pages):
+            return False
+        capped: bool = retrieved + sum(len(page.data or []) for page in pages) < total
+        if capped:
+            logging.getLogger().debug('Page size limited by the server: %d' % retrieved)
+        return capped
+
+    @staticmethod
+    def _skip_retrieved(
+        pages: List[ArtemisJolokiaClientResult], skip: int
+    ) -> List[ArtemisJolokiaClientResult]:
+        if pages and pages[0].data:
+            pages[0].data = pages[0].data[skip:]
+        return pages
+
+    @staticmethod
+    def _parse_pages(json_responses: Any) -> List[ArtemisJolokiaClientResult]:
+        """
+        Parses the responses of a bulk request of pages.
+        :param json_responses:
+        :return:
+        """
+        if not isinstance(json_responses, list):
+            json_responses = [json_responses]
+
+        pages: List[ArtemisJolokiaClientResult] = []
+        for json_response in json_responses:
+            page: ArtemisJolokiaClientResult = ArtemisJolokiaClientResult().load(
+                json_response
+            )
+            if page.success and page.value is not None:
+                page.data = json.loads(page.value)['data']
+            pages.append(page)
+        return pages
 
-        # Must be defined by concrete requests
-        self.operation: Optional[str] = None
-        self.arguments: Optional[list] = None
+
+class ArtemisJolokiaClient(ArtemisJolokiaClientBase):
+    """
+    Provides a generic mechanism to query Jolokia API exposed by ActiveMQ Artemis.
+    """
+
+    def __init__(
+        self,
+        broker_name: str,
+        ip: Optional[str],
+        port: str,
+        user: str,
+        password: str,
+        pool_size: int = 4,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 60.0,
+    ) -> None:
+        super(ArtemisJolokiaClient, self).__init__(
+            broker_name,
+            ip,
+            port,
+            user,
+            password,
+            pool_size,
+            connect_timeout,
+            read_timeout,
+        )
+        self._session: Optional[requests.Session] = None
+        self._session_lock: threading.Lock = threading.Lock()
 
     def list_queues(
         self, queue_name: str = '', exact: bool = False
@@ -102,16 +466,9 @@ class ArtemisJolokiaClient(object):
         :rtype: ArtemisJolokiaClientResult
         :return:
         """
-        request: ArtemisJolokiaClient = copy.copy(self)
-        request.operation = 'listQueues(java.lang.String,int,int)'
-        filter_operation: str = '"CONTAINS" if not exact else "EQUALS"'
-        request.arguments = [
-            '{"field": "NAME", "operation": "%s", "value": "%s"}'
-            % (filter_operation, queue_name),
-            1,
-            100,
-        ]
-
+        request: JolokiaRequest = self._list_queues.request(
+            queue_name, exact, 1, self.PAGE_SIZE
+        )
         return self._get_all_pages(request, 1)
 
     def list_addresses(
@@ -124,15 +481,9 @@ class ArtemisJolokiaClient(object):
         :param exact:
         :return:
         """
-        request: ArtemisJolokiaClient = copy.copy(self)
-        request.operation = 'listAddresses(java.lang.String,int,int)'
-        filter_operation: str = '"CONTAINS" if not exact else "EQUALS"'
-        request.arguments = [
-            '{"field": "NAME", "operation": "%s", "value": "%s"}'
-            % (filter_operation, address_name),
-            1,
-            100,
-        ]
+        request: JolokiaRequest = self._list_addresses.request(
+            address_name, exact, 1, self.PAGE_SIZE
+        )
         return self._get_all_pages(request, 1)
 
     def delete_address(
@@ -144,10 +495,7 @@ class ArtemisJolokiaClient(object):
         :param force: Force address removal
         :return:
         """
-        request: ArtemisJolokiaClient = copy.copy(self)
-        request.operation = 'deleteAddress(java.lang.String,boolean)'
-        request.arguments = [name, force]
-        return self._execute(request)
+        return self._execute(self._delete_address.request(name, force))
 
     def delete_queue(
         self, name: str, remove_consumers: bool = False
@@ -158,10 +506,7 @@ class ArtemisJolokiaClient(object):
         :param remove_consumers: Whether or not to remove connected consumers.
         :return:
         """
-        request: ArtemisJolokiaClient = copy.copy(self)
-        request.operation = 'destroyQueue(java.lang.String,boolean)'
-        request.arguments = [name, remove_consumers]
-        return self._execute(request)
+        return self._execute(self._delete_queue.request(name, remove_consumers))
 
     def create_address(
         self, name: str, routing_type: str = 'ANYCAST'
@@ -172,10 +517,7 @@ class ArtemisJolokiaClient(object):
         :param routing_type:
         :return:
         """
-        request: ArtemisJolokiaClient = copy.copy(self)
-        request.operation = 'createAddress(java.lang.String,java.lang.String)'
-        request.arguments = [name, routing_type]
-        return self._execute(request)
+        return self._execute(self._create_address.request(name, routing_type))
 
     def create_queue(
         self,
@@ -192,21 +534,59 @@ class ArtemisJolokiaClient(object):
         :param routing_type:
         :return:
         """
-        request: ArtemisJolokiaClient = copy.copy(self)
-        request.operation = (
-            "createQueue(java.lang.String,java.lang.String,boolean,java.lang.String)"
+        return self._execute(
+            self._create_queue.request(address_name, queue_name, durable, routing_type)
         )
-        request.arguments = [address_name, queue_name, durable, routing_type]
-        return self._execute(request)
 
-    def to_json(self):
+    def read_attribute(
+        self, attribute: Union[str, List[str]], mbean: Optional[str] = None
+    ) -> ArtemisJolokiaClientResult:
+        """
+        Reads an attribute of the broker (or of the given MBean), returned
+        through the value property of the returned object.
+        :param attribute: i.e. Version, AddressMemoryUsage (or a list of
+                          attributes, returned as a dict)
+        :param mbean: defaults to the broker MBean
+        :return:
+        """
+        return self._execute(JolokiaRequest.read(mbean or self.mbean, attribute))
+
+    def read_queue_metrics(
+        self, attributes: List[str], address: str = '*'
+    ) -> ArtemisJolokiaClientResult:
+        """
+        Reads the given attributes of all queues (or of the queues of the
+        given address) in a single request, using an MBean pattern. Metrics
+        are returned through the value property of the returned object,
+        as a dictionary of queue name to attributes, and through the data
+        property as a list of rows, including address and routingType:
+
+            result = client.read_queue_metrics(['MessageCount', 'ConsumerCount'])
+            result.value['orders']['MessageCount']
+
+        :param attributes: i.e. MessageCount, MessagesAdded
+        :param address: name of the address (or pattern)
+        :return:
+        """
+        return self._execute(self._queue_metrics_request(attributes, address))
+
+    def batch(self) -> 'ArtemisJolokiaBatch':
         """
-        Returns a JSON representation of the object.
+        Returns a batch, which queues the requests issued through its methods
+        (same as the ones of this client) and sends all of them in a single
+        HTTP call (Jolokia bulk request) when send() is called or the
+        with block ends. Results are only available after that:
+
+            with client.batch() as batch:
+                queues = batch.list_queues()
+                addresses = batch.list_addresses()
+            print(queues.data, addresses.data)
+
         :return:
         """
-        return json.loads(json.dumps(self, default=lambda x: x.__dict__))
+        return ArtemisJolokiaBatch(self)
 
-    def _execute(self, request) -> ArtemisJolokiaClientResult:
+    def _execute(self, request: JolokiaRequest) -> ArtemisJolokiaClientResult:
         """
         Posts to the Jolokia API using the initialization arguments and
         returns a parsed ArtemisJolokiaClientResult object.
@@ -214,68 +594,208 @@ class ArtemisJolokiaClient(object):
         :rtype: ArtemisJolokiaClientResult
         :return:
         """
+        try:
+            response = self._post(request.to_json())
+            result = ArtemisJolokiaClientResult.from_jolokia_response(response)
+        except RequestException as ex:
+            return ArtemisJolokiaClientResult.from_exception(ex)
 
-        # Converts request to JSON representation
-        json_request = request.to_json()
+        if request.parser is not None:
+            request.parser(result)
+        return result
 
+    def _post(self, json_request: Any) -> requests.Response:
+        """
+        Posts the given request (or list of requests) to the Jolokia API.
+        :param json_request:
+        :return:
+        """
         # Debug info
-        logging.getLogger().info(
-            "Posting to Jolokia API at: http://%s:%s/console/jolokia"
-            % (self._ip, self._port)
-        )
+        logging.getLogger().info("Posting to Jolokia API at: %s" % self._url)
         logging.getLogger().debug('Request => %s' % json_request)
 
         # Calling the Jolokia API
-        try:
-            response = requests.post(
-                'http://%s:%s/console/jolokia' % (self._ip, self._port),
-                json=json_request,
-                auth=(self._user, self._password),
-            )
-            return ArtemisJolokiaClientResult.from_jolokia_response(response)
-        except RequestException as ex:
-            return ArtemisJolokiaClientResult.from_exception(ex)
+        return self.session.post(self._url, json=json_request, timeout=self.timeout)
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        HTTP session (connection pool) used to reach the broker, created on first use.
+        :return:
+        """
+        with self._session_lock:
+            if self._session is None:
+                session: requests.Session = requests.Session()
+                adapter: HTTPAdapter = HTTPAdapter(
+                    pool_connections=1, pool_maxsize=self.pool_size
+                )
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers['Authorization'] = self._authorization
+                self._session = session
+            return self._session
+
+    def close(self) -> None:
+        """
+        Closes the connections kept to the broker.
+        :return:
+        """
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
 
     def _get_all_pages(
-        self, request, page_arg_index: int
+        self,
+        request: JolokiaRequest,
+        page_arg_index: int,
+        first_page: Optional[ArtemisJolokiaClientResult] = None,
     ) -> ArtemisJolokiaClientResult:
         """
         Common private method to retrieve paged results from Jolokia API.
+        The first page tells the total count, then remaining pages are retrieved
+        using larger pages, in bulk requests sent concurrently (up to pool_size).
+        The page size argument is expected right after the page number.
         :param request:
         :param page_arg_index:
+        :param first_page: result of the first page (if already retrieved)
         :return:
         """
+        result: ArtemisJolokiaClientResult = first_page or self._execute(request)
 
-        all_data: list = []
-        result: ArtemisJolokiaClientResult = ArtemisJolokiaClientResult()
+        # If something wrong happened, or no value returned, stop processing
+        if result.error or result.value is None:
+            return result
 
-        # Process all pages
-        while True:
-            result = self._execute(request)
+        # Returned value must have count and data
+        value: dict = json.loads(result.value)
+        total: int = value['count']
+        all_data: list = value['data']
 
-            # If something wrong happened, stop processing
-            if result.error:
-                break
+        pages: List[ArtemisJolokiaClientResult] = []
+        if all_data and total > len(all_data):
+            pages = self._get_remaining_pages(
+                request, page_arg_index, total, len(all_data)
+            )
+            if self._pages_capped(pages, total, len(all_data)):
+                pages = self._get_remaining_pages(
+                    request, page_arg_index, total, len(all_data), len(all_data)
+                )
 
-            json_res = result.response.json()
+        return self._merge_pages(result, all_data, pages)
 
-            # Expect 'value' key to be present
-            if "value" not in json_res:
-                break
+    def _get_remaining_pages(
+        self,
+        request: JolokiaRequest,
+        page_arg_index: int,
+        total: int,
+        retrieved: int,
+        max_page_size: Optional[int] = None,
+    ) -> List[ArtemisJolokiaClientResult]:
+        """
+        Retrieves the results after the first "retrieved" ones, in bulk requests
+        sent concurrently.
+        :param request:
+        :param page_arg_index:
+        :param total:
+        :param retrieved:
+        :param max_page_size: defaults to MAX_PAGE_SIZE
+        :return: results of each page, in order
+        """
+        chunks, skip = self._plan_pages(
+            request, page_arg_index, total, retrieved, max_page_size
+        )
+        with ThreadPoolExecutor(max_workers=min(self.pool_size, len(chunks))) as pool:
+            pages: List[ArtemisJolokiaClientResult] = [
+                page for chunk in pool.map(self._post_pages, chunks) for page in chunk
+            ]
+        return self._skip_retrieved(pages, skip)
 
-            # Returned value must have count and data
-            value = json.loads(json_res['value'])
-            total_queues = value['count']
-            all_data.extend(value['data'])
+    def _post_pages(self, json_requests: List[dict]) -> List[ArtemisJolokiaClientResult]:
+        """
+        Retrieves the given pages in a single bulk request.
+        :param json_requests:
+        :return: result of each page (with the parsed data)
+        """
+        try:
+            json_responses: Any = self._post(json_requests).json()
+        except (RequestException, ValueError) as ex:
+            return [ArtemisJolokiaClientResult.from_exception(ex)]
+        return self._parse_pages(json_responses)
 
-            # In case all queues retrieve, skip
-            if total_queues == 0 or total_queues == len(all_data):
-                break
 
-            # Increase page size and execute again
-            request.arguments[page_arg_index] += 1
+class ArtemisJolokiaBatch(ArtemisJolokiaClient):
+    """
+    Requests issued through a batch are sent together (Jolokia bulk request).
+    Each returned result is filled in once the batch is sent.
+    """
 
-        if all_data and result:
-            result.data = all_data
+    def __init__(self, client: ArtemisJolokiaClient) -> None:
+        self.__dict__.update(client.__dict__)
+        self._client: ArtemisJolokiaClient = client
+        self._pending: List[
+            Tuple[JolokiaRequest, ArtemisJolokiaClientResult, Optional[int]]
+        ] = []
+
+    def __enter__(self) -> 'ArtemisJolokiaBatch':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        # Requests are not sent if the block has failed
+        if exc_type is None:
+            self.send()
 
+    def send(self) -> List[ArtemisJolokiaClientResult]:
+        """
+        Sends all pending requests in a single HTTP call and fills in their results.
+        Remaining pages of paged results (if any) are retrieved afterwards.
+        :return: results in the same order requests were issued
+        """
+        pending, self._pending = self._pending, []
+        if not pending:
+            return []
+
+        try:
+            response = self._post([request.to_json() for request, _res, _idx in pending])
+            json_responses: Any = response.json()
+        except (RequestException, ValueError) as ex:
+            logging.getLogger().debug('Jolokia bulk request failed: %s' % ex)
+            for _request, result, _idx in pending:
+                result.error = str(ex)
+            return [result for _request, result, _idx in pending]
+
+        if not isinstance(json_responses, list) or len(json_responses) != len(pending):
+            json_responses = [json_responses] * len(pending)
+
+        for (request, result, page_arg_index), json_response in zip(
+            pending, json_responses
+        ):
+            result.response = response
+            result.load(json_response)
+            if request.parser is not None:
+                request.parser(result)
+            if page_arg_index is not None:
+                self._client._get_all_pages(request, page_arg_index, result)
+
+        return [result for _request, result, _idx in pending]
+
+    def _post(self, json_request: Any) -> requests.Response:
+        return self._client._post(json_request)
+
+    def close(self) -> None:
+        pass
+
+    def _execute(self, request: JolokiaRequest) -> ArtemisJolokiaClientResult:
+        result: ArtemisJolokiaClientResult = ArtemisJolokiaClientResult()
+        self._pending.append((request, result, None))
+        return result
+
+    def _get_all_pages(
+        self,
+        request: JolokiaRequest,
+        page_arg_index: int,
+        first_page: Optional[ArtemisJolokiaClientResult] = None,
+    ) -> ArtemisJolokiaClientResult:
+        result: ArtemisJolokiaClientResult = ArtemisJolokiaClientResult()
+        self._pending.append((request, result, page_arg_index))
         return result
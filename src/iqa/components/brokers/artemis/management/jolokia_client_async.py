@@ -0,0 +1,309 @@
+"""
+Asyncio client for the Jolokia API exposed by ActiveMQ Artemis.
+
+It provides the same operations as ArtemisJolokiaClient (sharing the request
+building and paging from ArtemisJolokiaClientBase), but they are coroutines,
+so management calls to many brokers can be made concurrently from a single
+event loop:
+
+    results = await asyncio.gather(*[client.list_queues() for client in clients])
+"""
+import asyncio
+import json
+import logging
+from typing import Any, List, Optional, Union
+
+import aiohttp
+
+from iqa.components.brokers.artemis.management.jolokia_client import (
+    ArtemisJolokiaClientBase,
+    ArtemisJolokiaClientResult,
+    JolokiaRequest,
+)
+
+
+class AsyncArtemisJolokiaClient(ArtemisJolokiaClientBase):
+    """
+    Jolokia client whose operations are coroutines (using aiohttp).
+    The HTTP session is bound to the event loop where it is first used.
+    Bulk requests are not needed, calls can be gathered instead.
+    """
+
+    def __init__(
+        self,
+        broker_name: str,
+        ip: Optional[str],
+        port: str,
+        user: str,
+        password: str,
+        pool_size: int = 4,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 60.0,
+    ) -> None:
+        super(AsyncArtemisJolokiaClient, self).__init__(
+            broker_name,
+            ip,
+            port,
+            user,
+            password,
+            pool_size,
+            connect_timeout,
+            read_timeout,
+        )
+        self._async_session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def async_session(self) -> aiohttp.ClientSession:
+        """
+        HTTP session (connection pool) used to reach the broker from the running loop.
+        :return:
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if self._async_session is None or self._async_session.closed or self._loop is not loop:
+            connect_timeout, read_timeout = self.timeout
+            self._async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=connect_timeout, sock_read=read_timeout
+                ),
+                headers={'Authorization': self._authorization},
+            )
+            self._loop = loop
+        return self._async_session
+
+    async def list_queues(
+        self, queue_name: str = '', exact: bool = False
+    ) -> ArtemisJolokiaClientResult:
+        """
+        Calls listQueues operation and returns queues matching filtering arguments
+        through the data property of the returned object.
+        :param queue_name:
+        :param exact:
+        :return:
+        """
+        request: JolokiaRequest = self._list_queues.request(
+            queue_name, exact, 1, self.PAGE_SIZE
+        )
+        return await self._get_all_pages(request, 1)
+
+    async def list_addresses(
+        self, address_name: str = '', exact: bool = False
+    ) -> ArtemisJolokiaClientResult:
+        """
+        Calls listAddresses operation and returns addresses matching filtering arguments
+        through the data property of the returned object.
+        :param address_name:
+        :param exact:
+        :return:
+        """
+        request: JolokiaRequest = self._list_addresses.request(
+            address_name, exact, 1, self.PAGE_SIZE
+        )
+        return await self._get_all_pages(request, 1)
+
+    async def delete_address(
+        self, name: str, force: bool = False
+    ) -> ArtemisJolokiaClientResult:
+        """
+        Deletes the given address.
+        :param name: Address name
+        :param force: Force address removal
+        :return:
+        """
+        return await self._execute(self._delete_address.request(name, force))
+
+    async def delete_queue(
+        self, name: str, remove_consumers: bool = False
+    ) -> ArtemisJolokiaClientResult:
+        """
+        Deletes the given queue.
+        :param name: Queue name
+        :param remove_consumers: Whether or not to remove connected consumers.
+        :return:
+        """
+        return await self._execute(self._delete_queue.request(name, remove_consumers))
+
+    async def create_address(
+        self, name: str, routing_type: str = 'ANYCAST'
+    ) -> ArtemisJolokiaClientResult:
+        """
+        Creates a new address
+        :param name:
+        :param routing_type:
+        :return:
+        """
+        return await self._execute(self._create_address.request(name, routing_type))
+
+    async def create_queue(
+        self,
+        address_name: str,
+        queue_name: str,
+        durable: bool = True,
+        routing_type: str = 'ANYCAST',
+    ) -> ArtemisJolokiaClientResult:
+        """
+        Creates a new queue nested to the provided Address
+        :param address_name:
+        :param queue_name:
+        :param durable:
+        :param routing_type:
+        :return:
+        """
+        return await self._execute(
+            self._create_queue.request(address_name, queue_name, durable, routing_type)
+        )
+
+    async def read_attribute(
+        self, attribute: Union[str, List[str]], mbean: Optional[str] = None
+    ) -> ArtemisJolokiaClientResult:
+        """
+        Reads an attribute of the broker (or of the given MBean).
+        :param attribute: i.e. Version (or a list of attributes, returned as a dict)
+        :param mbean: defaults to the broker MBean
+        :return:
+        """
+        return await self._execute(JolokiaRequest.read(mbean or self.mbean, attribute))
+
+    async def read_queue_metrics(
+        self, attributes: List[str], address: str = '*'
+    ) -> ArtemisJolokiaClientResult:
+        """
+        Reads the given attributes of all queues (or of the queues of the
+        given address) in a single request, see ArtemisJolokiaClient.read_queue_metrics.
+        :param attributes: i.e. MessageCount, MessagesAdded
+        :param address: name of the address (or pattern)
+        :return:
+        """
+        return await self._execute(self._queue_metrics_request(attributes, address))
+
+    async def close(self) -> None:
+        """
+        Closes the connections kept to the broker.
+        :return:
+        """
+        session, self._async_session = self._async_session, None
+        if session is not None and not session.closed:
+            await session.close()
+
+    def close_threadsafe(self) -> None:
+        """
+        Closes the connections from any thread (i.e. on teardown),
+        scheduling it on the event loop the session belongs to.
+        :return:
+        """
+        loop: Optional[asyncio.AbstractEventLoop] = self._loop
+        if self._async_session is None or loop is None or loop.is_closed():
+            self._async_session = None
+            return
+
+        try:
+            running: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is loop:
+            loop.create_task(self.close())
+        elif loop.is_running():
+            asyncio.run_coroutine_threadsafe(self.close(), loop)
+        else:
+            loop.run_until_complete(self.close())
+
+    async def _execute(self, request: JolokiaRequest) -> ArtemisJolokiaClientResult:
+        """
+        Posts to the Jolokia API and returns a parsed ArtemisJolokiaClientResult object.
+        :param request:
+        :return:
+        """
+        try:
+            json_response: Any = await self._post(request.to_json())
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as ex:
+            return ArtemisJolokiaClientResult.from_exception(ex)
+
+        result: ArtemisJolokiaClientResult = ArtemisJolokiaClientResult().load(
+            json_response
+        )
+        if request.parser is not None:
+            request.parser(result)
+        return result
+
+    async def _post(self, json_request: Any) -> Any:
+        """
+        Posts the given request (or list of requests) to the Jolokia API.
+        :param json_request:
+        :return: the parsed JSON response
+        """
+        logging.getLogger().info("Posting to Jolokia API at: %s" % self._url)
+        logging.getLogger().debug('Request => %s' % json_request)
+
+        async with self.async_session.post(self._url, json=json_request) as response:
+            return await response.json(content_type=None)
+
+    async def _get_remaining_pages(
+        self,
+        request: JolokiaRequest,
+        page_arg_index: int,
+        total: int,
+        retrieved: int,
+        max_page_size: Optional[int] = None,
+    ) -> List[ArtemisJolokiaClientResult]:
+        """
+        Retrieves the results after the first "retrieved" ones, in bulk requests
+        sent concurrently (up to pool_size).
+        :param request:
+        :param page_arg_index:
+        :param total:
+        :param retrieved:
+        :param max_page_size: defaults to MAX_PAGE_SIZE
+        :return: results of each page, in order
+        """
+        chunks, skip = self._plan_pages(
+            request, page_arg_index, total, retrieved, max_page_size
+        )
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(self.pool_size)
+
+        async def post_pages(chunk: List[dict]) -> List[ArtemisJolokiaClientResult]:
+            async with semaphore:
+                try:
+                    return self._parse_pages(await self._post(chunk))
+                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as ex:
+                    return [ArtemisJolokiaClientResult.from_exception(ex)]
+
+        pages: List[ArtemisJolokiaClientResult] = []
+        for chunk_pages in await asyncio.gather(*[post_pages(chunk) for chunk in chunks]):
+            pages.extend(chunk_pages)
+        return self._skip_retrieved(pages, skip)
+
+    async def _get_all_pages(
+        self,
+        request: JolokiaRequest,
+        page_arg_index: int,
+        first_page: Optional[ArtemisJolokiaClientResult] = None,
+    ) -> ArtemisJolokiaClientResult:
+        """
+        Retrieves paged results, requesting the remaining pages concurrently
+        once the first one tells the total count.
+        :param request:
+        :param page_arg_index:
+        :param first_page:
+        :return:
+        """
+        result: ArtemisJolokiaClientResult = first_page or await self._execute(request)
+        if result.error or result.value is None:
+            return result
+
+        value: dict = json.loads(result.value)
+        total: int = value['count']
+        all_data: list = value['data']
+
+        pages: List[ArtemisJolokiaClientResult] = []
+        if all_data and total > len(all_data):
+            pages = await self._get_remaining_pages(
+                request, page_arg_index, total, len(all_data)
+            )
+            if self._pages_capped(pages, total, len(all_data)):
+                pages = await self._get_remaining_pages(
+                    request, page_arg_index, total, len(all_data), len(all_data)
+                )
+
+        return self._merge_pages(result, all_data, pages)
@@ -0,0 +1,493 @@
+"""
+Local stand-in for the Jolokia API of an Artemis broker.
+
+It implements the requests issued by ArtemisJolokiaClient (listQueues,
+listAddresses, createAddress, createQueue, deleteAddress, destroyQueue,
+attribute and pattern reads, bulk requests) on top of an in-memory
+model of addresses and queues, so the management layer can be tested
+and benchmarked without a broker:
+
+    with ArtemisJolokiaServer(latency=0.001) as server:
+        server.populate(queues=100000)
+        client = ArtemisJolokiaClient('amq', server.host, str(server.port), 'admin', 'admin')
+        client.list_queues()
+"""
+import base64
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+
+from iqa.components.brokers.artemis.management.jolokia_client import (
+    parse_mbean_properties,
+)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+EXCEPTION_PACKAGE: str = 'org.apache.activemq.artemis.api.core.'
+
+# Queue attributes and the key of the queue model they are taken from
+QUEUE_ATTRIBUTES: Dict[str, str] = {
+    'Name': 'name',
+    'Address': 'address',
+    'RoutingType': 'routingType',
+    'Durable': 'durable',
+    'MessageCount': 'messageCount',
+    'MessagesAdded': 'messagesAdded',
+    'MessagesAcknowledged': 'messagesAcked',
+    'ConsumerCount': 'consumerCount',
+}
+
+
+class JolokiaError(Exception):
+    """
+    Error returned to the client as the response of a single request.
+    """
+
+    def __init__(self, status: int, error_type: str, error: str) -> None:
+        super(JolokiaError, self).__init__(error)
+        self.status: int = status
+        self.error_type: str = error_type
+        self.error: str = error
+
+    def to_json(self) -> dict:
+        return {'status': self.status, 'error_type': self.error_type, 'error': self.error}
+
+
+class ArtemisJolokiaServer(object):
+    """
+    HTTP server (in a background thread) answering Jolokia requests for
+    a single broker, with configurable latency and page size limit.
+    """
+
+    def __init__(
+        self,
+        broker_name: str = 'amq',
+        host: str = '127.0.0.1',
+        port: int = 0,
+        user: Optional[str] = 'admin',
+        password: Optional[str] = 'admin',
+        latency: float = 0.0,
+        request_latency: float = 0.0,
+        max_page_size: Optional[int] = None,
+    ) -> None:
+        """
+        :param broker_name:
+        :param host:
+        :param port: 0 to listen on a free port
+        :param user: None to accept requests without credentials
+        :param password:
+        :param latency: seconds added to each HTTP call
+        :param request_latency: seconds added to each Jolokia request (also in bulk)
+        :param max_page_size: max results returned in a page of listings
+        """
+        self.broker_name: str = broker_name
+        self.mbean: str = 'org.apache.activemq.artemis:broker="%s"' % broker_name
+        self.host: str = host
+        self.port: int = port
+        self.latency: float = latency
+        self.request_latency: float = request_latency
+        self.max_page_size: Optional[int] = max_page_size
+        self._authorization: Optional[str] = None
+        if user is not None:
+            self._authorization = 'Basic %s' % base64.b64encode(
+                ('%s:%s' % (user, password)).encode('latin1')
+            ).decode('ascii')
+
+        # Broker model
+        self.addresses: Dict[str, dict] = {}
+        self.queues: Dict[str, dict] = {}
+        self._lock: threading.RLock = threading.RLock()
+        self._listings: Dict[str, List[dict]] = {}
+
+        # Statistics
+        self.http_calls: int = 0
+        self.requests: int = 0
+
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._operations: Dict[str, Callable[..., Any]] = {
+            'listQueues(java.lang.String,int,int)': self._list_queues,
+            'listAddresses(java.lang.String,int,int)': self._list_addresses,
+            'createAddress(java.lang.String,java.lang.String)': self._create_address,
+            'createQueue(java.lang.String,java.lang.String,boolean,java.lang.String)': (
+                self._create_queue
+            ),
+            'deleteAddress(java.lang.String,boolean)': self._delete_address,
+            'destroyQueue(java.lang.String,boolean)': self._destroy_queue,
+        }
+
+    @property
+    def url(self) -> str:
+        return 'http://%s:%s/console/jolokia' % (self.host, self.port)
+
+    def start(self) -> 'ArtemisJolokiaServer':
+        if self._server is None:
+            self._server = ThreadingHTTPServer(
+                (self.host, self.port), JolokiaRequestHandler
+            )
+            self._server.daemon_threads = True
+            self._server.jolokia = self  # type: ignore
+            self.port = self._server.server_address[1]
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, name='iqa-jolokia-server', daemon=True
+            )
+            self._thread.start()
+            logger.debug('Jolokia stand-in server listening at %s' % self.url)
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread = None
+
+    def __enter__(self) -> 'ArtemisJolokiaServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def add_address(self, name: str, routing_type: str = 'ANYCAST') -> dict:
+        with self._lock:
+            if name in self.addresses:
+                raise JolokiaError(
+                    500,
+                    EXCEPTION_PACKAGE + 'ActiveMQAddressExistsException',
+                    'AMQ229204: Address already exists: %s' % name,
+                )
+            address: dict = {
+                'id': len(self.addresses) + 1,
+                'name': name,
+                'routingTypes': routing_type,
+                'queueCount': 0,
+            }
+            self.addresses[name] = address
+            self._listings.pop('addresses', None)
+            return address
+
+    def add_queue(
+        self,
+        name: str,
+        address: Optional[str] = None,
+        routing_type: str = 'ANYCAST',
+        durable: bool = True,
+        message_count: int = 0,
+    ) -> dict:
+        """
+        Adds a queue (and its address, if it does not exist).
+        :param name:
+        :param address: defaults to the queue name
+        :param routing_type:
+        :param durable:
+        :param message_count:
+        :return:
+        """
+        address = address or name
+        with self._lock:
+            if name in self.queues:
+                raise JolokiaError(
+                    500,
+                    EXCEPTION_PACKAGE + 'ActiveMQQueueExistsException',
+                    'AMQ229019: Queue %s already exists on address %s'
+                    % (name, self.queues[name]['address']),
+                )
+            if address not in self.addresses:
+                self.add_address(address, routing_type)
+            queue: dict = {
+                'id': len(self.queues) + 1,
+                'name': name,
+                'address': address,
+                'routingType': routing_type,
+                'durable': durable,
+                'messageCount': message_count,
+                'messagesAdded': message_count,
+                'messagesAcked': 0,
+                'consumerCount': 0,
+            }
+            self.queues[name] = queue
+            self.addresses[address]['queueCount'] += 1
+            self._listings.pop('queues', None)
+            return queue
+
+    def populate(
+        self, queues: int, queues_per_address: int = 1, prefix: str = 'queue'
+    ) -> None:
+        """
+        Adds the given number of queues (i.e. queue.0 .. queue.N-1),
+        grouped in addresses of queues_per_address queues.
+        :param queues:
+        :param queues_per_address:
+        :param prefix:
+        :return:
+        """
+        with self._lock:
+            for index in range(queues):
+                address: str = '%s.%d' % (prefix, index - index % queues_per_address)
+                self.add_queue('%s.%d' % (prefix, index), address)
+
+    def handle(self, json_request: Any) -> Any:
+        """
+        Returns the response to the given (single or bulk) Jolokia request.
+        :param json_request:
+        :return:
+        """
+        if isinstance(json_request, list):
+            return [self._handle_request(request) for request in json_request]
+        return self._handle_request(json_request)
+
+    def _handle_request(self, request: Any) -> dict:
+        self.requests += 1
+        if self.request_latency:
+            time.sleep(self.request_latency)
+
+        try:
+            if not isinstance(request, dict):
+                raise JolokiaError(
+                    400, 'java.lang.IllegalArgumentException', 'Invalid request'
+                )
+            if request.get('type') == 'exec':
+                value: Any = self._exec(request)
+            elif request.get('type') == 'read':
+                value = self._read(request)
+            else:
+                raise JolokiaError(
+                    400,
+                    'java.lang.IllegalArgumentException',
+                    'Unsupported request type: %s' % request.get('type'),
+                )
+        except (TypeError, ValueError) as ex:
+            response: dict = JolokiaError(
+                400, 'java.lang.IllegalArgumentException', str(ex)
+            ).to_json()
+            response['request'] = request
+            return response
+        except JolokiaError as ex:
+            response = ex.to_json()
+            response['request'] = request
+            return response
+
+        return {
+            'request': request,
+            'value': value,
+            'timestamp': int(time.time()),
+            'status': 200,
+        }
+
+    def _exec(self, request: dict) -> Any:
+        if request.get('mbean') != self.mbean:
+            raise JolokiaError(
+                404,
+                'javax.management.InstanceNotFoundException',
+                request.get('mbean', ''),
+            )
+
+        operation: Optional[Callable[..., Any]] = self._operations.get(
+            request.get('operation', '')
+        )
+        if operation is None:
+            raise JolokiaError(
+                400,
+                'java.lang.IllegalArgumentException',
+                'No operation %s found on MBean %s'
+                % (request.get('operation'), self.mbean),
+            )
+        return operation(*request.get('arguments', []))
+
+    def _read(self, request: dict) -> Any:
+        mbean: str = request.get('mbean', '')
+        attribute: Any = request.get('attribute')
+        if mbean == self.mbean:
+            return self._attributes(self._broker_attributes(), attribute, mbean)
+
+        properties: Dict[str, str] = parse_mbean_properties(mbean)
+        if (
+            not mbean.startswith(self.mbean + ',')
+            or properties.get('subcomponent') != 'queues'
+        ):
+            raise JolokiaError(404, 'javax.management.InstanceNotFoundException', mbean)
+
+        with self._lock:
+            queues: List[dict] = [
+                queue
+                for queue in self.queues.values()
+                if self._matches(properties, 'address', queue['address'])
+                and self._matches(properties, 'queue', queue['name'])
+                and self._matches(
+                    properties, 'routing-type', queue['routingType'].lower()
+                )
+            ]
+
+        # Pattern reads return the attributes by MBean name
+        if '*' in mbean:
+            return {
+                self._queue_mbean(queue): self._attributes(
+                    self._queue_attributes(queue), attribute, mbean
+                )
+                for queue in queues
+            }
+        if not queues:
+            raise JolokiaError(404, 'javax.management.InstanceNotFoundException', mbean)
+        return self._attributes(self._queue_attributes(queues[0]), attribute, mbean)
+
+    def _list_queues(self, name_filter: str, page: int, page_size: int) -> str:
+        return self._list('queues', self.queues, name_filter, page, page_size)
+
+    def _list_addresses(self, name_filter: str, page: int, page_size: int) -> str:
+        return self._list('addresses', self.addresses, name_filter, page, page_size)
+
+    def _create_address(self, name: str, routing_types: str) -> None:
+        self.add_address(name, routing_types)
+
+    def _create_queue(
+        self, address: str, name: str, durable: bool, routing_type: str
+    ) -> None:
+        self.add_queue(name, address, routing_type, durable)
+
+    def _delete_address(self, name: str, force: bool) -> None:
+        with self._lock:
+            if name not in self.addresses:
+                raise JolokiaError(
+                    500,
+                    EXCEPTION_PACKAGE + 'ActiveMQAddressDoesNotExistException',
+                    'AMQ229203: Address Does Not Exist: %s' % name,
+                )
+            queues: List[str] = [
+                queue['name'] for queue in self.queues.values() if queue['address'] == name
+            ]
+            if queues and not force:
+                raise JolokiaError(
+                    500,
+                    EXCEPTION_PACKAGE + 'ActiveMQDeleteAddressException',
+                    'AMQ229205: Address %s has bindings' % name,
+                )
+            for queue in queues:
+                del self.queues[queue]
+            del self.addresses[name]
+            self._listings.clear()
+
+    def _destroy_queue(self, name: str, remove_consumers: bool) -> None:
+        with self._lock:
+            queue: Optional[dict] = self.queues.pop(name, None)
+            if queue is None:
+                raise JolokiaError(
+                    500,
+                    EXCEPTION_PACKAGE + 'ActiveMQNonExistentQueueException',
+                    'AMQ229017: Queue %s does not exist' % name,
+                )
+            self.addresses[queue['address']]['queueCount'] -= 1
+            self._listings.pop('queues', None)
+
+    def _list(
+        self,
+        kind: str,
+        items: Dict[str, dict],
+        name_filter: str,
+        page: int,
+        page_size: int,
+    ) -> str:
+        """
+        Returns a page of the items matching the filter, the same way
+        the broker does (JSON string with count and data).
+        """
+        name_filter_json: dict = json.loads(name_filter) if name_filter else {}
+        value: str = name_filter_json.get('value', '')
+        with self._lock:
+            if not value:
+                # Unfiltered listings are kept till the items change
+                listing: Optional[List[dict]] = self._listings.get(kind)
+                if listing is None:
+                    listing = self._listings[kind] = list(items.values())
+            elif name_filter_json.get('operation') == 'EQUALS':
+                listing = [items[value]] if value in items else []
+            else:
+                listing = [item for name, item in items.items() if value in name]
+
+        if self.max_page_size is not None:
+            page_size = min(page_size, self.max_page_size)
+        start: int = (max(page, 1) - 1) * page_size
+        return json.dumps({'count': len(listing), 'data': listing[start:start + page_size]})
+
+    def _broker_attributes(self) -> Dict[str, Any]:
+        with self._lock:
+            queues: List[dict] = list(self.queues.values())
+        return {
+            'AddressMemoryUsage': 0,
+            'ConnectionCount': 0,
+            'TotalConsumerCount': sum(queue['consumerCount'] for queue in queues),
+            'TotalMessageCount': sum(queue['messageCount'] for queue in queues),
+            'TotalMessagesAdded': sum(queue['messagesAdded'] for queue in queues),
+            'TotalMessagesAcknowledged': sum(queue['messagesAcked'] for queue in queues),
+            'Version': 'stand-in',
+        }
+
+    @staticmethod
+    def _queue_attributes(queue: dict) -> Dict[str, Any]:
+        return {attribute: queue[key] for attribute, key in QUEUE_ATTRIBUTES.items()}
+
+    @staticmethod
+    def _attributes(attributes: Dict[str, Any], attribute: Any, mbean: str) -> Any:
+        if isinstance(attribute, list):
+            return {name: attributes[name] for name in attribute if name in attributes}
+        if attribute is None:
+            return attributes
+        if attribute not in attributes:
+            raise JolokiaError(
+                404,
+                'javax.management.AttributeNotFoundException',
+                'No such attribute: %s on %s' % (attribute, mbean),
+            )
+        return attributes[attribute]
+
+    @staticmethod
+    def _matches(properties: Dict[str, str], key: str, value: str) -> bool:
+        return properties.get(key, '*') in ('*', value)
+
+    def _queue_mbean(self, queue: dict) -> str:
+        return (
+            '%s,component=addresses,address="%s",subcomponent=queues,'
+            'routing-type="%s",queue="%s"'
+        ) % (self.mbean, queue['address'], queue['routingType'].lower(), queue['name'])
+
+
+class JolokiaRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handles the HTTP calls of ArtemisJolokiaServer (keep-alive connections).
+    """
+
+    protocol_version: str = 'HTTP/1.1'
+    # Headers and body are written separately (no delayed ACK wait on keep-alive)
+    disable_nagle_algorithm: bool = True
+
+    def do_POST(self) -> None:
+        jolokia: ArtemisJolokiaServer = self.server.jolokia  # type: ignore
+        jolokia.http_calls += 1
+        body: bytes = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+        authorization: Optional[str] = jolokia._authorization
+        if authorization and self.headers.get('Authorization') != authorization:
+            self._reply(401, b'')
+            return
+
+        if jolokia.latency:
+            time.sleep(jolokia.latency)
+
+        try:
+            json_request: Any = json.loads(body)
+        except ValueError:
+            self._reply(400, b'')
+            return
+        self._reply(200, json.dumps(jolokia.handle(json_request)).encode('utf-8'))
+
+    def _reply(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/plain;charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(format % args)
@@ -0,0 +1,307 @@
+"""
+Background sampling of Artemis broker metrics through Jolokia.
+
+Samples are stored in fixed-capacity ring buffers backed by array('d')
+(8 bytes per value), so memory stays bounded during long soak tests:
+
+    sampler = broker.sample_metrics(interval=1.0, queues=['orders'])
+    ...
+    sampler.get_queue_series('orders').rate('MessagesAdded', window=60)
+    sampler.broker_series.percentile('AddressMemoryUsage', 99)
+    sampler.save('/tmp/metrics')
+"""
+import csv
+import logging
+import math
+import os
+import re
+import threading
+import time
+from array import array
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, TYPE_CHECKING
+
+from iqa.system.service.timing import percentile
+
+if TYPE_CHECKING:
+    from iqa.components.brokers.artemis.artemis import Artemis
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+BROKER_ATTRIBUTES: Tuple[str, ...] = (
+    'AddressMemoryUsage',
+    'ConnectionCount',
+    'TotalConsumerCount',
+    'TotalMessageCount',
+    'TotalMessagesAdded',
+    'TotalMessagesAcknowledged',
+)
+
+QUEUE_ATTRIBUTES: Tuple[str, ...] = (
+    'MessageCount',
+    'MessagesAdded',
+    'MessagesAcknowledged',
+    'ConsumerCount',
+)
+
+
+class TimeSeries(object):
+    """
+    Ring buffer of samples: a timestamp column plus one float64 column per metric.
+    Once capacity is reached, the oldest samples are overwritten.
+    """
+
+    def __init__(self, columns: Sequence[str], capacity: int = 86400) -> None:
+        """
+        :param columns: metric names
+        :param capacity: max number of samples kept
+        """
+        if capacity < 1:
+            raise ValueError('Capacity must be at least 1')
+
+        self.columns: Tuple[str, ...] = tuple(columns)
+        self.capacity: int = capacity
+        self._timestamps: array = array('d')
+        self._values: Dict[str, array] = {column: array('d') for column in self.columns}
+        self._next: int = 0
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def append(self, timestamp: float, values: Mapping[str, float]) -> None:
+        """
+        Adds a sample (missing metrics are stored as NaN).
+        :param timestamp:
+        :param values:
+        :return:
+        """
+        if len(self._timestamps) < self.capacity:
+            self._timestamps.append(timestamp)
+            for column in self.columns:
+                self._values[column].append(values.get(column, math.nan))
+            return
+
+        self._timestamps[self._next] = timestamp
+        for column in self.columns:
+            self._values[column][self._next] = values.get(column, math.nan)
+        self._next = (self._next + 1) % self.capacity
+
+    def timestamps(self) -> array:
+        return self._ordered(self._timestamps)
+
+    def values(self, column: str) -> array:
+        return self._ordered(self._values[column])
+
+    def window(
+        self, column: str, window: Optional[float] = None
+    ) -> List[Tuple[float, float]]:
+        """
+        Returns the (timestamp, value) samples of a metric, skipping NaN values.
+        :param column:
+        :param window: only samples taken in the last seconds (relative to the newest one)
+        :return:
+        """
+        timestamps: array = self.timestamps()
+        if not timestamps:
+            return []
+
+        since: float = timestamps[-1] - window if window is not None else -math.inf
+        return [
+            (timestamp, value)
+            for timestamp, value in zip(timestamps, self.values(column))
+            if timestamp >= since and not math.isnan(value)
+        ]
+
+    def last(self, column: str) -> Optional[float]:
+        samples: List[Tuple[float, float]] = self.window(column)
+        return samples[-1][1] if samples else None
+
+    def rate(self, column: str, window: Optional[float] = None) -> Optional[float]:
+        """
+        Returns the average increase per second of a metric (i.e. the
+        enqueue rate from MessagesAdded), or None with less than two samples.
+        :param column:
+        :param window: seconds
+        :return:
+        """
+        samples: List[Tuple[float, float]] = self.window(column, window)
+        if len(samples) < 2 or samples[-1][0] == samples[0][0]:
+            return None
+        return (samples[-1][1] - samples[0][1]) / (samples[-1][0] - samples[0][0])
+
+    def percentile(
+        self, column: str, pct: float, window: Optional[float] = None
+    ) -> Optional[float]:
+        """
+        Returns the given percentile (0-100) of a metric, or None with no samples.
+        :param column:
+        :param pct:
+        :param window: seconds
+        :return:
+        """
+        values: List[float] = [value for _ts, value in self.window(column, window)]
+        return percentile(values, pct) if values else None
+
+    def to_csv(self, path: str) -> None:
+        """
+        Writes the samples to a CSV file (timestamp column first).
+        :param path:
+        :return:
+        """
+        columns: List[array] = [self.timestamps()] + [
+            self.values(column) for column in self.columns
+        ]
+        with open(path, 'w', newline='') as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(('timestamp',) + self.columns)
+            writer.writerows(zip(*columns))
+
+    def _ordered(self, values: array) -> array:
+        if len(values) < self.capacity or not self._next:
+            return values[:]
+        return values[self._next:] + values[: self._next]
+
+
+def _to_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class BrokerMetricsSampler(object):
+    """
+    Periodically reads broker and queue attributes of an Artemis broker
+    (a single Jolokia bulk request per sample) from a background thread.
+    """
+
+    def __init__(
+        self,
+        broker: 'Artemis',
+        interval: float = 1.0,
+        queues: Optional[Sequence[str]] = None,
+        capacity: int = 86400,
+    ) -> None:
+        """
+        :param broker:
+        :param interval: seconds between samples
+        :param queues: names (or FQQNs) of the queues to sample, None for all of them
+        :param capacity: max number of samples kept per series
+        """
+        self.broker: 'Artemis' = broker
+        self.interval: float = interval
+        self.queues: Optional[Sequence[str]] = queues
+        self.capacity: int = capacity
+        self.broker_series: TimeSeries = TimeSeries(BROKER_ATTRIBUTES, capacity)
+        self.queue_series: Dict[str, TimeSeries] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._stopped: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> 'BrokerMetricsSampler':
+        if not self.running:
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run,
+                name='iqa-metrics-%s' % self.broker.instance_name,
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def get_queue_series(self, name: str) -> Optional[TimeSeries]:
+        """
+        Returns the samples of the given queue (name or FQQN).
+        :param name:
+        :return:
+        """
+        with self._lock:
+            if name in self.queue_series:
+                return self.queue_series[name]
+            for fqqn, series in self.queue_series.items():
+                if fqqn.split('::', 1)[1] == name:
+                    return series
+        return None
+
+    def sample(self) -> None:
+        """
+        Takes a single sample of all metrics. Queue metrics are read through
+        an MBean pattern, so a sample is a single HTTP call whatever the
+        number of queues.
+        :return:
+        """
+        with self.broker.management_client.batch() as batch:
+            broker_result = batch.read_attribute(list(BROKER_ATTRIBUTES))
+            queues_result = batch.read_queue_metrics(list(QUEUE_ATTRIBUTES))
+        timestamp: float = time.time()
+
+        with self._lock:
+            if broker_result.success:
+                self.broker_series.append(timestamp, self._parse(broker_result.value))
+            else:
+                logger.debug('Unable to sample broker metrics: %s' % broker_result.error)
+
+            if not queues_result.success:
+                logger.debug('Unable to sample queue metrics: %s' % queues_result.error)
+                return
+
+            for row in queues_result.data or []:
+                fqqn: str = '%s::%s' % (row['address'], row['name'])
+                if self.queues is not None and not (
+                    row['name'] in self.queues or fqqn in self.queues
+                ):
+                    continue
+                series: Optional[TimeSeries] = self.queue_series.get(fqqn)
+                if series is None:
+                    series = TimeSeries(QUEUE_ATTRIBUTES, self.capacity)
+                    self.queue_series[fqqn] = series
+                series.append(timestamp, self._parse(queues_result.value[row['name']]))
+
+    def save(self, directory: str) -> List[str]:
+        """
+        Exports the samples as CSV files (one for the broker and one per queue).
+        :param directory:
+        :return: paths of the written files
+        """
+        os.makedirs(directory, exist_ok=True)
+        name: str = self.broker.instance_name
+        paths: List[str] = []
+        with self._lock:
+            series: Dict[str, TimeSeries] = {name: self.broker_series}
+            for fqqn, queue_series in self.queue_series.items():
+                series['%s-%s' % (name, fqqn)] = queue_series
+
+            for file_name, time_series in series.items():
+                path: str = os.path.join(
+                    directory, '%s.csv' % re.sub(r'[^\w.-]+', '_', file_name)
+                )
+                time_series.to_csv(path)
+                paths.append(path)
+        return paths
+
+    @staticmethod
+    def _parse(value: Optional[dict]) -> Dict[str, float]:
+        return {
+            attribute: _to_float(attribute_value)
+            for attribute, attribute_value in (value or {}).items()
+        }
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            started: float = time.monotonic()
+            try:
+                self.sample()
+            except Exception:
+                logger.exception(
+                    'Unable to sample metrics of %s' % self.broker.instance_name
+                )
+            self._stopped.wait(max(0.0, self.interval - (time.monotonic() - started)))
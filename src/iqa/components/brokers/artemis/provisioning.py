@@ -0,0 +1,337 @@
+"""
+Bulk creation and removal of Artemis addresses and queues.
+
+Destinations are consumed lazily (lists or generators), grouped in chunks
+sent as Jolokia bulk requests and several chunks are in flight at once:
+
+    report = broker.create_destinations(
+        (Queue('q%d' % i, RoutingType.ANYCAST, address) for i in range(10000)),
+        progress=lambda report: print(report),
+    )
+"""
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+
+from iqa.abstract.destination.address import Address
+from iqa.abstract.destination.queue import Queue
+from iqa.abstract.destination.routing_type import RoutingType
+
+if TYPE_CHECKING:
+    from iqa.components.brokers.artemis.artemis import Artemis
+    from iqa.components.brokers.artemis.management.jolokia_client import (
+        ArtemisJolokiaBatch,
+        ArtemisJolokiaClientResult,
+    )
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+Destination = Union[Address, Queue]
+
+
+class ProvisioningReport(object):
+    """
+    Progress (and final outcome) of a bulk operation.
+    """
+
+    def __init__(self) -> None:
+        self.done: int = 0
+        self.skipped: int = 0
+        self.failed: List[Tuple[str, Optional[str]]] = []
+        self.started_at: float = time.monotonic()
+        self.elapsed: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return not self.failed
+
+    @property
+    def processed(self) -> int:
+        return self.done + self.skipped + len(self.failed)
+
+    def __repr__(self) -> str:
+        return 'ProvisioningReport(done=%d, skipped=%d, failed=%d, elapsed=%.3fs)' % (
+            self.done,
+            self.skipped,
+            len(self.failed),
+            self.elapsed,
+        )
+
+
+class DestinationProvisioner(object):
+    """
+    Creates or deletes addresses and queues of a broker in chunks, each one
+    sent as a single bulk request, keeping up to concurrency chunks in flight.
+    """
+
+    def __init__(
+        self,
+        broker: 'Artemis',
+        chunk_size: int = 500,
+        concurrency: Optional[int] = None,
+        progress: Optional[Callable[[ProvisioningReport], None]] = None,
+    ) -> None:
+        """
+        :param broker:
+        :param chunk_size: requests sent in each bulk request
+        :param concurrency: bulk requests in flight (defaults to the client pool size)
+        :param progress: called with the report after each chunk completes
+        """
+        self.broker: 'Artemis' = broker
+        self.chunk_size: int = chunk_size
+        self.concurrency: int = concurrency or broker.management_client.pool_size
+        self.progress: Optional[Callable[[ProvisioningReport], None]] = progress
+
+    def create(
+        self,
+        destinations: Iterable[Destination],
+        durable: bool = True,
+        if_missing: bool = True,
+    ) -> ProvisioningReport:
+        """
+        Creates the given addresses and queues. The address of each queue
+        is created too (before it), unless it exists or was already created.
+        :param destinations:
+        :param durable: whether queues are durable
+        :param if_missing: skip destinations already present on the broker
+        :return:
+        """
+        addresses: Set[str] = set()
+        queues: Set[str] = set()
+        if if_missing:
+            queues.update(queue.name for queue in self.broker.queues())
+            # Both listings are loaded by queues(), no need for another refresh
+            addresses.update(
+                address.name for address in self.broker.addresses(refresh=False)
+            )
+
+        # Chunk creating each address, so its queues are only sent once it completes
+        creating: Dict[str, Future] = {}
+
+        def requests(
+            chunk: List[Destination], skipped: List[Destination]
+        ) -> Tuple[List[Tuple[str, Callable]], Set[Future]]:
+            pending: List[Tuple[str, Callable]] = []
+            depends_on: Set[Future] = set()
+            for destination in chunk:
+                if isinstance(destination, Queue):
+                    if destination.name in queues:
+                        skipped.append(destination)
+                        continue
+                    address: Address = destination.address
+                    if address.name in creating:
+                        depends_on.add(creating[address.name])
+                    elif address.name not in addresses:
+                        pending.append(self._create_address(address))
+                    addresses.add(address.name)
+                    queues.add(destination.name)
+                    pending.append(self._create_queue(destination, durable))
+                else:
+                    if destination.name in addresses:
+                        skipped.append(destination)
+                        continue
+                    addresses.add(destination.name)
+                    pending.append(self._create_address(destination))
+            return pending, depends_on
+
+        def submitted(chunk: List[Destination], future: Future) -> None:
+            for destination in chunk:
+                name: str = (
+                    destination.address.name
+                    if isinstance(destination, Queue)
+                    else destination.name
+                )
+                creating.setdefault(name, future)
+
+        try:
+            return self._run(destinations, requests, submitted)
+        finally:
+            self.broker.invalidate_topology()
+
+    def delete(
+        self,
+        destinations: Iterable[Destination],
+        force: bool = True,
+        remove_consumers: bool = True,
+        if_present: bool = True,
+    ) -> ProvisioningReport:
+        """
+        Deletes the given addresses and queues.
+        :param destinations:
+        :param force: remove addresses even if they have queues (which are removed too)
+        :param remove_consumers: remove queues even if they have consumers
+        :param if_present: skip destinations not present on the broker
+        :return:
+        """
+        addresses: Optional[Set[str]] = None
+        queues: Optional[Dict[str, str]] = None
+        queues_by_address: Dict[str, Set[str]] = {}
+        if if_present:
+            queues = {queue.name: queue.address.name for queue in self.broker.queues()}
+            # Both listings are loaded by queues(), no need for another refresh
+            addresses = set(
+                address.name for address in self.broker.addresses(refresh=False)
+            )
+            for queue_name, address_name in queues.items():
+                queues_by_address.setdefault(address_name, set()).add(queue_name)
+
+        # Chunks deleting queues of each address, so it is only deleted once they complete
+        deleting: Dict[str, Set[Future]] = {}
+
+        def requests(
+            chunk: List[Destination], skipped: List[Destination]
+        ) -> Tuple[List[Tuple[str, Callable]], Set[Future]]:
+            pending: List[Tuple[str, Callable]] = []
+            depends_on: Set[Future] = set()
+            for destination in chunk:
+                if isinstance(destination, Queue):
+                    if queues is not None and queues.pop(destination.name, None) is None:
+                        skipped.append(destination)
+                        continue
+                    pending.append(
+                        (
+                            destination.name,
+                            lambda batch, name=destination.name: batch.delete_queue(
+                                name, remove_consumers
+                            ),
+                        )
+                    )
+                    continue
+
+                if addresses is not None:
+                    if destination.name not in addresses:
+                        skipped.append(destination)
+                        continue
+                    addresses.discard(destination.name)
+                if queues is not None and force:
+                    # Queues removed along with the address are not deleted again
+                    for queue_name in queues_by_address.pop(destination.name, set()):
+                        queues.pop(queue_name, None)
+                depends_on.update(deleting.get(destination.name, set()))
+                pending.append(
+                    (
+                        destination.name,
+                        lambda batch, name=destination.name: batch.delete_address(
+                            name, force
+                        ),
+                    )
+                )
+            return pending, depends_on
+
+        def submitted(chunk: List[Destination], future: Future) -> None:
+            for destination in chunk:
+                if isinstance(destination, Queue):
+                    deleting.setdefault(destination.address.name, set()).add(future)
+
+        try:
+            return self._run(destinations, requests, submitted)
+        finally:
+            self.broker.invalidate_topology()
+
+    def _create_address(self, address: Address) -> Tuple[str, Callable]:
+        routing_type: str = self.broker._get_routing_type(address.routing_type)
+        return (
+            address.name,
+            lambda batch: batch.create_address(address.name, routing_type),
+        )
+
+    @staticmethod
+    def _create_queue(queue: Queue, durable: bool) -> Tuple[str, Callable]:
+        if queue.routing_type == RoutingType.BOTH:
+            raise ValueError('Queues can only use ANYCAST or MULTICAST routing type')
+        return (
+            queue.fqqn,
+            lambda batch: batch.create_queue(
+                queue.address.name, queue.name, durable, queue.routing_type.name
+            ),
+        )
+
+    def _run(
+        self,
+        destinations: Iterable[Destination],
+        requests: Callable,
+        submitted: Optional[Callable[[List[Destination], Future], None]] = None,
+    ) -> ProvisioningReport:
+        report: ProvisioningReport = ProvisioningReport()
+        lock: threading.Lock = threading.Lock()
+        iterator: Iterator[Destination] = iter(destinations)
+        in_flight: Set[Future] = set()
+
+        def completed(future: Future) -> None:
+            in_flight.discard(future)
+            try:
+                future.result()
+            except Exception:
+                logger.exception('Bulk request failed')
+            if self.progress is not None:
+                self.progress(report)
+
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix='iqa-provisioning'
+        ) as executor:
+            while True:
+                chunk: List[Destination] = list(islice(iterator, self.chunk_size))
+                if not chunk:
+                    break
+
+                skipped: List[Destination] = []
+                pending, depends_on = requests(chunk, skipped)
+                with lock:
+                    report.skipped += len(skipped)
+
+                # Requests depending on chunks still in flight wait for them
+                if depends_on & in_flight:
+                    wait(depends_on)
+                while len(in_flight) >= self.concurrency:
+                    for future in wait(in_flight, return_when=FIRST_COMPLETED).done:
+                        completed(future)
+
+                future = executor.submit(self._send, pending, report, lock)
+                in_flight.add(future)
+                if submitted is not None:
+                    submitted(chunk, future)
+
+            for future in list(in_flight):
+                future.exception()
+                completed(future)
+
+        report.elapsed = time.monotonic() - report.started_at
+        logger.debug('Bulk provisioning of %s: %s' % (self.broker.instance_name, report))
+        return report
+
+    def _send(
+        self,
+        pending: List[Tuple[str, Callable]],
+        report: ProvisioningReport,
+        lock: threading.Lock,
+    ) -> None:
+        if not pending:
+            return
+
+        batch: 'ArtemisJolokiaBatch' = self.broker.management_client.batch()
+        results: List[Tuple[str, 'ArtemisJolokiaClientResult']] = [
+            (name, request(batch)) for name, request in pending
+        ]
+        batch.send()
+
+        with lock:
+            for name, result in results:
+                if result.success:
+                    report.done += 1
+                else:
+                    logger.debug('Unable to provision %s: %s' % (name, result.error))
+                    report.failed.append((name, result.error))
@@ -0,0 +1,122 @@
+"""
+Cached view of the addresses and queues of an Artemis broker.
+"""
+import logging
+import time
+from typing import Dict, List, Optional
+
+from iqa.abstract.destination.address import Address
+from iqa.abstract.destination.queue import Queue
+from iqa.abstract.destination.routing_type import RoutingType
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class ArtemisTopology(object):
+    """
+    Addresses and queues retrieved from the broker, kept for ttl seconds.
+    Each refresh is applied incrementally: Address and Queue instances
+    already known are updated in place (so references held by tests remain
+    valid), new ones are added and the ones no longer listed are removed.
+    """
+
+    def __init__(self, ttl: float = 0) -> None:
+        """
+        :param ttl: seconds the topology is valid for (0 means always refreshed)
+        """
+        self.ttl: float = ttl
+        self.updated_at: Optional[float] = None
+        self._addresses: Dict[str, Address] = {}
+        self._queues: Dict[str, Queue] = {}
+        self._fqqns: Dict[str, Queue] = {}
+
+    @property
+    def loaded(self) -> bool:
+        return self.updated_at is not None
+
+    @property
+    def addresses(self) -> List[Address]:
+        return list(self._addresses.values())
+
+    @property
+    def queues(self) -> List[Queue]:
+        return list(self._queues.values())
+
+    def expired(self) -> bool:
+        """
+        Returns True if the topology must be refreshed.
+        :return:
+        """
+        return (
+            self.updated_at is None
+            or self.ttl <= 0
+            or time.monotonic() - self.updated_at > self.ttl
+        )
+
+    def invalidate(self) -> None:
+        """
+        Forces the next read to refresh the topology (i.e. after creating
+        or deleting addresses and queues).
+        :return:
+        """
+        self.updated_at = None
+
+    def get_address(self, name: str) -> Optional[Address]:
+        return self._addresses.get(name)
+
+    def get_queue(self, name: str) -> Optional[Queue]:
+        """
+        Returns the queue with the given name or FQQN (address::queue).
+        :param name:
+        :return:
+        """
+        if '::' in name:
+            return self._fqqns.get(name)
+        return self._queues.get(name)
+
+    def update(self, addresses_data: List[dict], queues_data: List[dict]) -> None:
+        """
+        Applies the addresses and queues listed by the broker.
+        :param addresses_data:
+        :param queues_data:
+        :return:
+        """
+        addresses: Dict[str, Address] = {}
+        for addr_info in addresses_data:
+            logger.debug(
+                'Address found: %s - routingType: %s'
+                % (addr_info['name'], addr_info['routingTypes'])
+            )
+            routing_type: RoutingType = RoutingType.from_value(addr_info['routingTypes'])
+            address: Optional[Address] = self._addresses.get(addr_info['name'])
+            if address is None:
+                address = Address(name=addr_info['name'], routing_type=routing_type)
+            else:
+                address.routing_type = routing_type
+                del address.queues[:]
+            addresses[address.name] = address
+
+        queues: Dict[str, Queue] = {}
+        for queue_info in queues_data:
+            logger.debug(
+                'Queue found: %s - routingType: %s'
+                % (queue_info['name'], queue_info['routingType'])
+            )
+            routing_type = RoutingType.from_value(queue_info['routingType'])
+            address = addresses[queue_info['address']]
+            queue: Optional[Queue] = self._queues.get(queue_info['name'])
+            if queue is None:
+                queue = Queue(
+                    name=queue_info['name'], routing_type=routing_type, address=address
+                )
+            else:
+                queue.routing_type = routing_type
+                queue.address = address
+            queue.message_count = queue_info['messageCount']
+            address.queues.append(queue)
+            queues[queue.name] = queue
+
+        self._addresses = addresses
+        self._queues = queues
+        self._fqqns = {queue.fqqn: queue for queue in queues.values()}
+        self.updated_at = time.monotonic()
@@ -1,60 +1,71 @@
 import logging
 
-from iqa.components.clients.external.client_external import ClientExternal
+from iqa.components.clients.external.client_external import CLIENT_TYPES, CLIENTS, ClientExternal
 from iqa.system.executor import ExecutorBase
 from iqa.system.node.node import Node
 
+# Built-in external client implementations, only imported when first used.
+# Importing each package also loads its concrete clients (sender, receiver, connector).
+CLIENTS.update(
+    {
+        'java': 'iqa.components.clients.external.java:ClientJava',
+        'nodejs': 'iqa.components.clients.external.nodejs:ClientNodeJS',
+        'python': 'iqa.components.clients.external.python:ClientPython',
+    },
+)
 
-class ClientFactory(object):
-    # Static element to store all available implementations
-    _implementations: list = []
 
+class ClientFactory(object):
     @staticmethod
     def create_clients(
         implementation: str, node: Node, executor: ExecutorBase, **kwargs
     ) -> list:
-        for cl in ClientExternal.__subclasses__():
-
-            # Ignore clients with different implementation
-            if cl.implementation != implementation:
-                continue
-
-            # Now loop through concrete client types (sender, receiver, connector)
-            clients: list = []
-            if cl.__subclasses__():
-                for client_impl in cl.__subclasses__():
-                    name: str = '%s-%s-%s' % (
-                        implementation,
-                        client_impl.__name__.lower(),
-                        node.hostname,
-                    )
-                    clients.append(
-                        client_impl(name=name, node=node, executor=executor, **kwargs)
-                    )
-            else:
-                name = '%s-%s-%s' % (implementation, cl.implementation, node.hostname)
-                clients.append(cl(name=name, node=node, executor=executor, **kwargs))
-
-            return clients
-
-        exception: ValueError = ValueError(
-            'Invalid client implementation: %s' % implementation
-        )
-        logging.getLogger(ClientFactory.__module__).error(exception)
-        raise exception
-
-    @staticmethod
-    def get_available_implementations() -> list:
+        try:
+            cl = CLIENTS.get(implementation)
+        except ValueError:
+            exception: ValueError = ValueError(
+                'Invalid client implementation: %s' % implementation
+            )
+            logging.getLogger(ClientFactory.__module__).error(exception)
+            raise exception
 
-        # If implementations list has already been loaded, use it
-        if ClientFactory._implementations:
-            return ClientFactory._implementations
+        # Now loop through concrete client types (sender, receiver, connector)
+        clients: list = []
+        client_types: list = ClientFactory.get_client_types(implementation)
+        if client_types:
+            for client_impl in client_types:
+                name: str = '%s-%s-%s' % (
+                    implementation,
+                    client_impl.__name__.lower(),
+                    node.hostname,
+                )
+                clients.append(
+                    client_impl(name=name, node=node, executor=executor, **kwargs)
+                )
+        else:
+            name = '%s-%s-%s' % (implementation, cl.implementation, node.hostname)
+            clients.append(cl(name=name, node=node, executor=executor, **kwargs))
 
-        result: list = []
+        return clients
 
-        for cl in ClientExternal.__subclasses__():
-            result.append(cl.implementation)
-
-        ClientFactory._implementations = result
+    @staticmethod
+    def get_client_types(implementation: str) -> list:
+        """
+        Returns the most specialized concrete client types registered for
+        the given implementation (a subclass of a concrete client replaces it).
+        :param implementation:
+        :return:
+        """
+        registered: list = CLIENT_TYPES.get(implementation, [])
+        return [
+            client_type
+            for client_type in registered
+            if not any(
+                other is not client_type and issubclass(other, client_type)
+                for other in registered
+            )
+        ]
 
-        return result
+    @staticmethod
+    def get_available_implementations() -> list:
+        return CLIENTS.names()
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, List, Optional
 
 from iqa.abstract.client.messaging_client import MessagingClient
 from iqa.abstract.listener import Listener
@@ -6,6 +6,14 @@ from iqa.components.abstract.component import Component
 from iqa.components.clients.external.command.client_command import ClientCommandBase
 from iqa.system.executor import ExecutionBase
 from iqa.system.node.node import Node
+from iqa.utils.plugins import PluginRegistry
+
+# External client implementations by name (built-in ones are listed in
+# iqa.components.clients.external)
+CLIENTS: PluginRegistry = PluginRegistry('iqa.clients')
+
+# Concrete client types (sender, receiver, connector, ...) of each implementation
+CLIENT_TYPES: Dict[str, List[type]] = {}
 
 
 class ClientExternal(Component, MessagingClient):
@@ -17,6 +25,14 @@ class ClientExternal(Component, MessagingClient):
     # As mixing --timeout with --count is causing issues
     TIMEOUT: int = 90
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        implementation = cls.__dict__.get('implementation')
+        if isinstance(implementation, str):
+            CLIENTS.register(implementation, cls)
+        elif isinstance(getattr(cls, 'implementation', None), str):
+            CLIENT_TYPES.setdefault(cls.implementation, []).append(cls)
+
     def __init__(self, name: str, node: Node, **kwargs) -> None:
         super(ClientExternal, self).__init__(name, node)
         self.execution: Optional[ExecutionBase] = None
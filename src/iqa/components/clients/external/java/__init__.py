@@ -0,0 +1,4 @@
+from .client import ClientJava
+from .connector import ConnectorJava
+from .receiver import ReceiverJava
+from .sender import SenderJava
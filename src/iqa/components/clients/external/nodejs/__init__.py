@@ -0,0 +1,4 @@
+from .client import ClientNodeJS
+from .connector import ConnectorNodeJS
+from .receiver import ReceiverNodeJS
+from .sender import SenderNodeJS
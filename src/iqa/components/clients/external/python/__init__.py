@@ -0,0 +1,4 @@
+from .client import ClientPython
+from .connector import ConnectorPython
+from .receiver import ReceiverPython
+from .sender import SenderPython
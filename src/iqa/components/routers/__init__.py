@@ -1,7 +1,7 @@
 import logging
 from typing import TYPE_CHECKING
 
-from iqa.abstract.server.router import Router
+from iqa.abstract.server.router import ROUTERS
 from iqa.system.executor import ExecutorBase
 from iqa.system.node.node import Node
 from iqa.system.service.service import Service
@@ -9,6 +9,13 @@ from iqa.system.service.service import Service
 if TYPE_CHECKING:
     from iqa.utils.types import RouterType
 
+# Built-in router implementations, only imported when first used
+ROUTERS.update(
+    {
+        'dispatch': 'iqa.components.routers.dispatch.dispatch:Dispatch',
+    },
+)
+
 
 class RouterFactory(object):
     @staticmethod
@@ -20,19 +27,16 @@ class RouterFactory(object):
         **kwargs
     ) -> 'RouterType':
 
-        for router in Router.__subclasses__():
-
-            # Ignore router with different implementation
-            if router.implementation != implementation:
-                continue
-
-            name: str = '%s-%s-%s' % ('router', router.__name__, node.hostname)
-            return router(
-                name=name, node=node, executor=executor, service=service_impl, **kwargs
+        try:
+            router = ROUTERS.get(implementation)
+        except ValueError:
+            exception: ValueError = ValueError(
+                'Invalid router implementation: %s' % implementation
             )
+            logging.getLogger(RouterFactory.__module__).error(exception)
+            raise exception
 
-        exception: ValueError = ValueError(
-            'Invalid router implementation: %s' % implementation
+        name: str = '%s-%s-%s' % ('router', router.__name__, node.hostname)
+        return router(
+            name=name, node=node, executor=executor, service=service_impl, **kwargs
         )
-        logging.getLogger(RouterFactory.__module__).error(exception)
-        raise exception
@@ -28,6 +28,8 @@ class Dispatch(ServerComponent, Router):
         listeners: Optional[List[Listener]] = None,
         **kwargs
     ) -> None:  # type: ignore
+        # Needed by the default readiness probe of the service
+        self.port: str = kwargs.get('router_port', 5672)
         super(Dispatch, self).__init__(name, node, listeners, **kwargs)
 
         self.qdmanage: QDManage = QDManage()
@@ -36,7 +38,6 @@ class Dispatch(ServerComponent, Router):
         self.log: Log = Log()
         self._version: Optional[str] = None
 
-        self.port: str = kwargs.get('router_port', 5672)
         self.config = kwargs.get('router_config', None)
         self.user: Optional[str] = None
         self.password: Optional[str] = None
@@ -48,6 +49,9 @@ class Dispatch(ServerComponent, Router):
         for func in [self.set_credentials, self.set_ssl_auth]:
             self.call_if_all_arguments_in_kwargs(func, **kwargs)
 
+    def get_ports(self) -> List[int]:
+        return super(Dispatch, self).get_ports() + [int(self.port)]
+
     @staticmethod
     def config_refresh_remote_to_testsuite() -> None:
         # TODO - This seems like a candidate to be part of Configuration class
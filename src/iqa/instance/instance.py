@@ -1,8 +1,9 @@
 """
 IQA instance which is populated based on an ansible compatible inventory file.
 """
+import copy
 import logging
-from typing import List, Optional, Union, TYPE_CHECKING
+from typing import Callable, List, Optional, Union, TYPE_CHECKING
 
 from iqa.abstract.client.client import Client
 from iqa.abstract.server.broker import Broker
@@ -11,7 +12,7 @@ from iqa.components.abstract.component import Component
 from iqa.components.brokers import BrokerFactory
 from iqa.components.clients.external import ClientFactory
 from iqa.components.routers import RouterFactory
-from iqa.system.ansible.ansible_inventory import AnsibleInventory
+from iqa.instance.snapshot import SNAPSHOT_VERSION, validate_snapshot
 from iqa.system.executor import create_executor
 from iqa.system.executor import ExecutorBase
 from iqa.system.node import NodeFactory
@@ -21,6 +22,7 @@ from iqa.system.service import ServiceFactory
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from iqa.system.ansible.ansible_inventory import AnsibleInventory
     from iqa.utils.types import (
         BrokerType,
         ClientType,
@@ -39,18 +41,68 @@ class Instance:
     Store variables, node and related things
     """
 
-    def __init__(self, inventory: str = '', cli_args: dict = None) -> None:
+    def __init__(
+        self, inventory: str = '', cli_args: dict = None, snapshot: dict = None
+    ) -> None:
+        """
+        :param inventory: Ansible inventory file
+        :param cli_args: extra variables for the inventory
+        :param snapshot: previously taken snapshot (see snapshot()), used instead
+                         of parsing the inventory and probing nodes and services
+        """
         self._logger: logging.Logger = logging.getLogger(self.__class__.__module__)
         self.inventory: str = inventory
-        self._inv_mgr: AnsibleInventory = AnsibleInventory(
-            inventory=self.inventory, extra_vars=cli_args
-        )
+        self._inv_mgr: Optional['AnsibleInventory'] = None
         self.nodes: List['NodeType'] = []
         self.components: List[
             Optional[Union['ComponentType', 'ClientType', 'BrokerType', 'RouterType']]
         ] = []
 
-        self._load_components()
+        # Resolved variables and probed facts of each loaded host
+        self._hosts: List[dict] = []
+
+        if snapshot is not None:
+            self._load_snapshot(snapshot)
+        else:
+            from iqa.system.ansible import ansible_inventory
+
+            self._inv_mgr = ansible_inventory.AnsibleInventory(
+                inventory=self.inventory, extra_vars=cli_args
+            )
+            self._load_components()
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict) -> 'Instance':
+        """
+        Creates an instance from a snapshot, without parsing the inventory
+        and probing nodes and services again. Connections are only opened
+        when first used.
+        :param snapshot:
+        :return:
+        """
+        return cls(inventory=snapshot.get('inventory', ''), snapshot=snapshot)
+
+    def snapshot(self) -> dict:
+        """
+        Returns a JSON serializable snapshot of this instance, with the resolved
+        variables of all hosts and the facts probed when they were loaded.
+        :return:
+        """
+        return {
+            'version': SNAPSHOT_VERSION,
+            'inventory': self.inventory,
+            'hosts': copy.deepcopy(self._hosts),
+        }
+
+    def _load_snapshot(self, snapshot: dict) -> None:
+        """
+        Loads all components described by the given snapshot.
+        :param snapshot:
+        :return:
+        """
+        validate_snapshot(snapshot)
+        for host in snapshot['hosts']:
+            self._load_host(host['name'], host['vars'], host.get('facts'))
 
     def _load_components(self) -> None:
         """
@@ -58,6 +110,23 @@ class Instance:
         messaging components.
         :return:
         """
+        # Loading all hosts that provide the component variable
+        inventory_hosts: list = self._inv_mgr.get_hosts_containing(var='component')
+
+        for cmp in inventory_hosts:
+            # Make a shallow copy (important as retrieved keys are deleted)
+            # print('ansible host = %s' % cmp)
+            self._load_host(cmp.name, dict(self._inv_mgr.get_host_vars(host=cmp)))
+
+    def _load_host(self, hostname: str, host_vars: dict, facts: dict = None) -> None:
+        """
+        Creates the executor, node and components of an inventory host.
+        When facts are provided (snapshot), nodes and services are not probed.
+        :param hostname:
+        :param host_vars:
+        :param facts:
+        :return:
+        """
 
         def get_and_remove_key(vars_dict: dict, key: str, default: str = None) -> str:
             val: str = vars_dict.get(key, default)
@@ -65,74 +134,79 @@ class Instance:
                 del vars_dict[key]
             return val
 
-        # Loading all hosts that provide the component variable
-        inventory_hosts: list = self._inv_mgr.get_hosts_containing(var='component')
-        nodes: List['NodeType'] = []
+        facts = facts or {}
+        host: dict = {'name': hostname, 'vars': dict(host_vars), 'facts': {}}
 
-        for cmp in inventory_hosts:
-            component: Optional[Union[Component, Client, Broker, Router]]
-            # Make a shallow copy (important as retrieved keys are deleted)
-            # print('ansible host = %s' % cmp)
-            cmp_vars: dict = dict(self._inv_mgr.get_host_vars(host=cmp))
+        component: Optional[Union[Component, Client, Broker, Router]]
+        cmp_vars: dict = dict(host_vars)
+
+        # Common variables across all component types
+        cmp_type: str = get_and_remove_key(cmp_vars, 'component')
+        cmp_impl: str = get_and_remove_key(cmp_vars, 'implementation')
+        cmp_exec: str = get_and_remove_key(cmp_vars, 'executor', 'ansible')
+        cmp_ip: str = facts.get('ip', cmp_vars.get('ansible_host', None))
 
-            # Common variables across all component types
-            cmp_type: str = get_and_remove_key(cmp_vars, 'component')
-            cmp_impl: str = get_and_remove_key(cmp_vars, 'implementation')
-            cmp_exec: str = get_and_remove_key(cmp_vars, 'executor', 'ansible')
-            cmp_ip: str = cmp_vars.get('ansible_host', None)
+        # Getting the executor instance
+        executor: 'ExecutorType' = create_executor(
+            implementation=cmp_exec, **cmp_vars
+        )
 
-            # Getting the executor instance
-            executor: 'ExecutorType' = create_executor(
-                exec_impl=cmp_exec, **cmp_vars
+        # Create the Node for current client
+        node: Node = NodeFactory.create_node(
+            hostname=hostname,
+            executor=executor,
+            ip=cmp_ip,
+            reachable=facts.get('reachable'),
+        )
+        self.nodes.append(node)
+        host['facts'].update(ip=node.ip, reachable=node.reachable)
+
+        # Now loading variables that are specific to each component
+        if cmp_type == 'client':
+            # Add list of clients into component list
+            cmp_list: List[
+                Union[Component, Client, Broker, Router]
+            ] = ClientFactory.create_clients(
+                implementation=cmp_impl, node=node, executor=executor, **cmp_vars
             )
 
-            # Create the Node for current client
-            node: Node = NodeFactory.create_node(
-                hostname=cmp.name, executor=executor, ip=cmp_ip
+            for client in cmp_list:
+                self.new_component(client)
+
+        elif cmp_type in ['router', 'broker']:
+            component = None
+            # A service name is expected
+            cmp_svc: str = get_and_remove_key(cmp_vars, 'service')
+            svc = ServiceFactory.create_service(
+                executor=executor,
+                service_name=cmp_svc,
+                implementation=facts.get('service'),
+                **cmp_vars
             )
-            nodes.append(node)
-
-            # Now loading variables that are specific to each component
-            if cmp_type == 'client':
-                # Add list of clients into component list
-                cmp_list: List[
-                    Union[Component, Client, Broker, Router]
-                ] = ClientFactory.create_clients(
-                    implementation=cmp_impl, node=node, executor=executor, **cmp_vars
+            host['facts']['service'] = svc.implementation
+            svc.component_type = cmp_type
+
+            if cmp_type == 'router':
+                component = RouterFactory.create_router(
+                    implementation=cmp_impl,
+                    node=node,
+                    executor=executor,
+                    service_impl=svc,
+                    **cmp_vars
                 )
 
-                for client in cmp_list:
-                    self.new_component(client)
-
-            elif cmp_type in ['router', 'broker']:
-                component = None
-                # A service name is expected
-                cmp_svc: str = get_and_remove_key(cmp_vars, 'service')
-                svc = ServiceFactory.create_service(
-                    executor=executor, service_name=cmp_svc, **cmp_vars
+            elif cmp_type == 'broker':
+                component = BrokerFactory.create_broker(
+                    implementation=cmp_impl,
+                    node=node,
+                    executor=executor,
+                    service_impl=svc,
+                    **cmp_vars
                 )
 
-                if cmp_type == 'router':
-                    component = RouterFactory.create_router(
-                        implementation=cmp_impl,
-                        node=node,
-                        executor=executor,
-                        service_impl=svc,
-                        **cmp_vars
-                    )
-
-                elif cmp_type == 'broker':
-                    component = BrokerFactory.create_broker(
-                        implementation=cmp_impl,
-                        node=node,
-                        executor=executor,
-                        service_impl=svc,
-                        **cmp_vars
-                    )
+            self.new_component(component)
 
-                self.new_component(component)
-
-        self.nodes = nodes
+        self._hosts.append(host)
 
     # TODO: @dlenoch re-implement node logic
     def new_node(
@@ -174,6 +248,20 @@ class Instance:
         self.components.append(component)
         return component
 
+    def close(self) -> None:
+        """
+        Releases resources held by the components (i.e. management connections).
+        :return:
+        """
+        for component in self.components:
+            close: Optional[Callable[[], None]] = getattr(component, 'close', None)
+            if close is None:
+                continue
+            try:
+                close()
+            except Exception as ex:
+                logger.warning('Unable to close component %s: %s' % (component, ex))
+
     @property
     def brokers(self) -> List['BrokerType']:
         """
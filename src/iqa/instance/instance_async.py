@@ -0,0 +1,233 @@
+"""
+Asyncio native IQA instance, opening and closing the connections of all
+executors concurrently, plus a blocking facade for synchronous callers.
+"""
+import asyncio
+import inspect
+import logging
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, List, Sequence, TYPE_CHECKING
+
+from iqa.instance.instance import Instance
+from iqa.system.command.command_base import CommandBase
+from iqa.system.executor import ExecutionBase
+from iqa.system.node.node import Node
+from iqa.utils.runtime import run_sync
+
+if TYPE_CHECKING:
+    from iqa.utils.types import ComponentType, ExecutorType
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncInstance(Instance):
+    """
+    IQA instance to be used as an async context manager:
+
+        async with AsyncInstance(inventory='inventory.yml') as instance:
+            await instance.restart(*instance.brokers)
+    """
+
+    async def __aenter__(self) -> 'AsyncInstance':
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.disconnect()
+
+    @property
+    def executors(self) -> List['ExecutorType']:
+        """
+        Executors used by the nodes of this instance (each one listed once).
+        :return:
+        """
+        executors: dict = {}
+        for node in self.nodes:
+            if node.executor is not None:
+                executors.setdefault(id(node.executor), node.executor)
+        return list(executors.values())
+
+    async def connect(self) -> None:
+        """
+        Opens the connections of all executors concurrently. If any of them
+        fails, the connections already opened are closed and the first error is raised.
+        :return:
+        """
+        executors: List['ExecutorType'] = self.executors
+        results: list = await asyncio.gather(
+            *[executor.connect() for executor in executors], return_exceptions=True
+        )
+
+        errors: List[BaseException] = []
+        for executor, result in zip(executors, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    'Unable to connect executor %s: %s'
+                    % (executor.__class__.__name__, result)
+                )
+                errors.append(result)
+
+        if errors:
+            await self.disconnect()
+            raise errors[0]
+
+    async def disconnect(self) -> None:
+        """
+        Closes the connections of all executors concurrently, and the ones of components.
+        Errors are logged, so that all executors get a chance to disconnect.
+        :return:
+        """
+        executors: List['ExecutorType'] = self.executors
+        results: list = await asyncio.gather(
+            *[executor.disconnect() for executor in executors], return_exceptions=True
+        )
+
+        for executor, result in zip(executors, results):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    'Unable to disconnect executor %s: %s'
+                    % (executor.__class__.__name__, result)
+                )
+
+        # Management connections (i.e. Jolokia) are closed as well
+        await self._call_all([self.close])
+
+    async def execute(self, node: Node, command: CommandBase) -> ExecutionBase:
+        """
+        Executes the given command using the executor of the given node.
+        :param node:
+        :param command:
+        :return:
+        """
+        return await node.executor.execute(command)
+
+    async def start(self, *components: 'ComponentType') -> list:
+        """
+        Starts the services of the given components (all server components
+        when none is given) concurrently.
+        :param components:
+        :return: the result of each service operation
+        """
+        return await self._service_operation('start', components)
+
+    async def stop(self, *components: 'ComponentType') -> list:
+        """
+        Stops the services of the given components (all server components
+        when none is given) concurrently.
+        :param components:
+        :return: the result of each service operation
+        """
+        return await self._service_operation('stop', components)
+
+    async def restart(self, *components: 'ComponentType') -> list:
+        """
+        Restarts the services of the given components (all server components
+        when none is given) concurrently.
+        :param components:
+        :return: the result of each service operation
+        """
+        return await self._service_operation('restart', components)
+
+    async def status(self, *components: 'ComponentType') -> list:
+        """
+        Returns the service status of the given components (all server
+        components when none is given).
+        :param components:
+        :return: list of ServiceStatus
+        """
+        return await self._service_operation('status', components)
+
+    async def _service_operation(self, operation: str, components: tuple) -> list:
+        if not components:
+            components = tuple(
+                component
+                for component in self.components
+                if getattr(component, 'service', None) is not None
+            )
+
+        return await self._call_all(
+            [getattr(component.service, operation) for component in components]
+        )
+
+    async def _call_all(self, funcs: Sequence[Callable[[], Any]]) -> list:
+        """
+        Runs the given (possibly blocking) functions concurrently, each one
+        in its own worker thread.
+
+        Service operations block on execute_sync, whose blocking executors
+        run their commands in the default executor of the runtime loop. Running
+        the operations in that same pool would deadlock once they use all of
+        its workers, so they get a dedicated pool sized to their number.
+        :param funcs:
+        :return: the result of each function
+        """
+        pool: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=max(1, len(funcs)), thread_name_prefix='iqa-instance'
+        )
+        try:
+            return list(await asyncio.gather(*[self._call(pool, func) for func in funcs]))
+        finally:
+            # Not waiting, not to block the loop if an operation failed early
+            pool.shutdown(wait=False)
+
+    @staticmethod
+    async def _call(pool: Executor, func: Callable, *args) -> Any:
+        """
+        Runs a (possibly blocking) function in a worker thread of the given
+        pool, awaiting its result when it returns an awaitable (async executors).
+        :param pool:
+        :param func:
+        :param args:
+        :return:
+        """
+        result: Any = await asyncio.get_running_loop().run_in_executor(pool, func, *args)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+
+class SyncInstance(object):
+    """
+    Blocking facade of AsyncInstance. All operations run on the shared
+    runtime event loop (iqa.utils.runtime), so no loop is created per call.
+
+        with SyncInstance(inventory='inventory.yml') as instance:
+            instance.restart(*instance.brokers)
+    """
+
+    def __init__(self, inventory: str = '', cli_args: dict = None) -> None:
+        self.instance: AsyncInstance = AsyncInstance(inventory, cli_args)
+
+    def __enter__(self) -> 'SyncInstance':
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.disconnect()
+
+    def connect(self) -> None:
+        run_sync(self.instance.connect())
+
+    def disconnect(self) -> None:
+        run_sync(self.instance.disconnect())
+
+    def execute(self, node: Node, command: CommandBase) -> ExecutionBase:
+        return run_sync(self.instance.execute(node, command))
+
+    def start(self, *components: 'ComponentType') -> list:
+        return run_sync(self.instance.start(*components))
+
+    def stop(self, *components: 'ComponentType') -> list:
+        return run_sync(self.instance.stop(*components))
+
+    def restart(self, *components: 'ComponentType') -> list:
+        return run_sync(self.instance.restart(*components))
+
+    def status(self, *components: 'ComponentType') -> list:
+        return run_sync(self.instance.status(*components))
+
+    def __getattr__(self, name: str) -> Any:
+        # Nodes, components and lookups are delegated to the wrapped instance
+        if name == 'instance':
+            raise AttributeError(name)
+        return getattr(self.instance, name)
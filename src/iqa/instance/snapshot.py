@@ -0,0 +1,94 @@
+"""
+Serializable snapshot of an IQA Instance.
+
+A snapshot holds, for every inventory host, the resolved variables and the
+facts probed while loading it (node address and reachability, service
+implementation). Restoring an instance from a snapshot does not parse the
+inventory nor probe nodes and services again, which allows the pytest-xdist
+controller to load the instance once and share it with all of its workers.
+
+Format (JSON):
+
+    {
+        "version": 1,
+        "inventory": "inventory.yml",
+        "hosts": [
+            {
+                "name": "broker1",
+                "vars": {"component": "broker", "implementation": "artemis", ...},
+                "facts": {"ip": "10.0.0.1", "reachable": true, "service": "systemd"}
+            }
+        ]
+    }
+"""
+import json
+from typing import TYPE_CHECKING, Optional, Type
+
+if TYPE_CHECKING:
+    from iqa.instance.instance import Instance
+
+SNAPSHOT_VERSION: int = 1
+
+
+def validate_snapshot(snapshot: dict) -> None:
+    """
+    Raises a ValueError if the given snapshot is not supported.
+    :param snapshot:
+    :return:
+    """
+    if not isinstance(snapshot, dict) or 'hosts' not in snapshot:
+        raise ValueError('Invalid instance snapshot')
+
+    if snapshot.get('version') != SNAPSHOT_VERSION:
+        raise ValueError(
+            'Unsupported instance snapshot version: %s (expected %d)'
+            % (snapshot.get('version'), SNAPSHOT_VERSION)
+        )
+
+
+def dumps(instance: 'Instance') -> str:
+    """
+    Serializes a snapshot of the given instance as JSON.
+    :param instance:
+    :return:
+    """
+    # Values not supported by JSON (coming from inventory variables) are stored as strings
+    return json.dumps(instance.snapshot(), default=str)
+
+
+def loads(data: str, instance_class: Optional[Type['Instance']] = None) -> 'Instance':
+    """
+    Creates an instance (of the given class, Instance by default)
+    from a JSON serialized snapshot.
+    :param data:
+    :param instance_class:
+    :return:
+    """
+    if instance_class is None:
+        from iqa.instance.instance import Instance
+
+        instance_class = Instance
+
+    return instance_class.from_snapshot(json.loads(data))
+
+
+def save(instance: 'Instance', path: str) -> None:
+    """
+    Writes a snapshot of the given instance to a file.
+    :param instance:
+    :param path:
+    :return:
+    """
+    with open(path, 'w') as snapshot_file:
+        snapshot_file.write(dumps(instance))
+
+
+def load(path: str, instance_class: Optional[Type['Instance']] = None) -> 'Instance':
+    """
+    Creates an instance from a snapshot file.
+    :param path:
+    :param instance_class:
+    :return:
+    """
+    with open(path) as snapshot_file:
+        return loads(snapshot_file.read(), instance_class)
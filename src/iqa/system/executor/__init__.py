@@ -1,23 +1,49 @@
 import logging
-from typing import Any
-
-from iqa.system.executor.ansible import *
-from iqa.system.executor.asyncssh import *
-from iqa.system.executor.docker import *
-from iqa.system.executor.kubernetes import *
-from iqa.system.executor.localhost import *
-from iqa.system.executor.ssh import *
+from typing import Any, TYPE_CHECKING
+
 from iqa.system.executor.execution import ExecutionBase
-from iqa.system.executor.executor import ExecutorBase
-from iqa.utils.types import ExecutorType
-from iqa.utils.utils import get_subclasses
+from iqa.system.executor.executor import EXECUTORS, ExecutorBase
+from iqa.utils.plugins import import_reference
+
+if TYPE_CHECKING:
+    from iqa.utils.types import ExecutorType
 
 logger = logging.getLogger(__name__)
 
+# Built-in executor implementations, only imported when first used
+EXECUTORS.update(
+    {
+        'ansible': 'iqa.system.executor.ansible.executor_ansible:ExecutorAnsible',
+        'asyncio': 'iqa.system.executor.asyncio_localhost.executor:ExecutorAsyncio',
+        'asyncssh': 'iqa.system.executor.asyncssh.executor:ExecutorAsyncSsh',
+        'docker': 'iqa.system.executor.docker.executor_docker:ExecutorDocker',
+        'kubernetes': 'iqa.system.executor.kubernetes.executor_kubernetes:ExecutorKubernetes',
+        'local': 'iqa.system.executor.localhost.executor_local:ExecutorLocal',
+        'ssh': 'iqa.system.executor.ssh.executor_ssh_old:ExecutorSshOld',
+    },
+)
+
+# Names previously star-imported from the executor packages (resolved lazily)
+_LAZY_ATTRIBUTES: dict = {
+    'ExecutorAnsible': 'iqa.system.executor.ansible.executor_ansible:ExecutorAnsible',
+    'ExecutorAsyncSsh': 'iqa.system.executor.asyncssh.executor:ExecutorAsyncSsh',
+    'ExecutionAsyncSsh': 'iqa.system.executor.asyncssh.execution_asyncssh:ExecutionAsyncSsh',
+    'ConnectionAsyncSsh': 'iqa.system.executor.asyncssh.connection:ConnectionAsyncSsh',
+    'ExecutorSshOld': 'iqa.system.executor.ssh.executor_ssh_old:ExecutorSshOld',
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        value: Any = import_reference(_LAZY_ATTRIBUTES[name])
+        globals()[name] = value
+        return value
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
 
-def create_executor(implementation: str, **kwargs) -> ExecutorType:
+def create_executor(implementation: str, **kwargs) -> 'ExecutorType':
     """
-        Loops through all implementations of the Executor class
+        Looks up the given implementation in the executors registry
         and returns an instance of the executor initialized from kwargs.
 
     Args:
@@ -28,11 +54,7 @@ def create_executor(implementation: str, **kwargs) -> ExecutorType:
 
     """
     try:
-        ex: Any = get_subclasses(
-            given_name=implementation,
-            in_class=ExecutorBase,
-            in_class_property='implementation'
-        )
+        ex: Any = EXECUTORS.get(implementation)
         return ex(**kwargs)  # type: ExecutorType
     except ValueError:
         logger.error('Implementation of "%s" executor was not found!' % implementation)
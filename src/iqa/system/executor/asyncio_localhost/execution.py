@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import os
 from asyncio.subprocess import Process
 from typing import Optional, Union
 
@@ -51,16 +52,31 @@ class ExecutionAsyncio(ExecutionBase):
         :return:
         """
 
-        _stdout = asyncio.subprocess.PIPE if self.command.stdout else None
-        _stderr = asyncio.subprocess.PIPE if self.command.stderr else None
+        _stdout = asyncio.subprocess.PIPE if self.command.stdout else asyncio.subprocess.DEVNULL
+        _stderr = asyncio.subprocess.PIPE if self.command.stderr else asyncio.subprocess.DEVNULL
 
-        self._proc = await asyncio.create_subprocess_shell(
-            str(self.command),
-            stdin=asyncio.subprocess.PIPE,
-            stdout=_stdout,
-            stderr=_stderr)
+        # Variables defined by the executor (i.e. DOCKER_HOST) extend current environment
+        env: Optional[dict] = None
+        if self.env:
+            env = dict(os.environ)
+            env.update(self.env)
 
-        self.stdout, self.stderr = await self._proc.communicate()
+        # Executors may have modified the arguments (i.e. docker exec <container> ...)
+        self._proc = await asyncio.create_subprocess_exec(
+            *self.args,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=_stdout,
+            stderr=_stderr,
+            env=env)
+
+        try:
+            self.stdout, self.stderr = await self._proc.communicate()
+        except asyncio.CancelledError:
+            # Do not leave the process behind if the caller has given up
+            self.terminate()
+            raise
+        finally:
+            self.cancel_timer()
 
     async def wait(self) -> None:
         """
@@ -78,7 +94,7 @@ class ExecutionAsyncio(ExecutionBase):
         Returns True if execution is still running and False otherwise.
         :return:
         """
-        return False if self.return_code else True
+        return self._proc is not None and self.return_code is None
 
     def completed_successfully(self) -> bool:
         """
@@ -88,16 +104,17 @@ class ExecutionAsyncio(ExecutionBase):
         return True if self.return_code == 0 else False
 
     def on_timeout(self) -> None:
-        raise NotImplementedError
+        self.terminate()
 
     def terminate(self) -> None:
         """
         Terminates the execution.
         :return:
         """
-        self._proc.terminate()
+        if self.is_running():
+            self._proc.terminate()
 
-    async def read_stdout(self, lines: bool = False) -> Optional[Union[str, list]]:
+    def read_stdout(self, lines: bool = False) -> Optional[Union[str, list]]:
         """
         Returns a string with the whole STDOUT content if the original
         command has stdout property defined as True. Otherwise
@@ -106,9 +123,9 @@ class ExecutionAsyncio(ExecutionBase):
         :type lines: bool
         :return: Stdout content as str if lines is False, or as a list
         """
-        raise NotImplementedError
+        return self._decode(self.stdout, lines)
 
-    async def read_stderr(self, lines: bool = False) -> Optional[Union[str, list]]:
+    def read_stderr(self, lines: bool = False) -> Optional[Union[str, list]]:
         """
         Returns a string with the whole STDERR content if the original
         command has stderr property defined as True. Otherwise
@@ -117,7 +134,16 @@ class ExecutionAsyncio(ExecutionBase):
         :type lines: bool
         :return: Stderr content as str if lines is False, or as a list
        """
-        raise NotImplementedError
+        return self._decode(self.stderr, lines)
+
+    def _decode(self, data: Optional[bytes], lines: bool) -> Optional[Union[str, list]]:
+        if data is None:
+            return None
+
+        content: str = data.decode(self.command.encoding)
+        if lines:
+            return content.splitlines(keepends=True)
+        return content
 
     def _on_timeout(self) -> None:
         """
@@ -9,6 +9,9 @@ from iqa.system.command import CommandBase
 class ExecutorAsyncio(ExecutorBase):
     """ Executor implementation for localhost AsyncIO executions
     """
+
+    implementation: str = 'asyncio'
+
     def __init__(self, user: str = 'root', password: str = None, **kwargs) -> None:
 
         super().__init__(**kwargs)
@@ -8,6 +8,9 @@ from iqa.system.command import CommandBase
 class ExecutorAsyncSsh(ExecutorBase):
     """ Executor implementation for AsyncSSH client
     """
+
+    implementation: str = 'asyncssh'
+
     def __init__(self, host: str, port: int = 22, user: str = 'root', password: str = None, **kwargs) -> None:
 
         super().__init__(**kwargs)
@@ -18,11 +21,20 @@ class ExecutorAsyncSsh(ExecutorBase):
         self.connection: Optional[ConnectionAsyncSsh] = None
 
     async def __aenter__(self):
-        await self._connect()
+        await self.connect()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self._disconnect()
+        await self.disconnect()
+
+    async def connect(self) -> None:
+        if self.connection is None:
+            await self._connect()
+
+    async def disconnect(self) -> None:
+        if self.connection is not None:
+            await self._disconnect()
+            self.connection = None
 
     async def _disconnect(self) -> None:
         """ Close connection """
@@ -40,7 +52,8 @@ class ExecutorAsyncSsh(ExecutorBase):
             known_hosts=None,
             client_keys=None
         )
-        self.connection = await con.connect()
+        await con.connect()
+        self.connection = con
 
     def _execute(self, command: CommandBase):
         cmd = " ".join(command.args)
@@ -54,4 +67,4 @@ class ExecutorAsyncSsh(ExecutorBase):
     @property
     def host(self) -> str:
         """ Return the host address """
-        return self.connection.host
+        return self._host
@@ -1,11 +1,19 @@
+import asyncio
+import inspect
 import logging
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from iqa.system.command.command_base import CommandBase
 from iqa.system.executor.execution import ExecutionBase
+from iqa.utils.plugins import PluginRegistry
+from iqa.utils.runtime import run_sync
 
 from iqa.logger import logger
 
+# Executor implementations by name (built-in ones are listed in iqa.system.executor)
+EXECUTORS: PluginRegistry = PluginRegistry('iqa.executors')
+
 
 class ExecutorBase(ABC):
     """
@@ -15,9 +23,26 @@ class ExecutorBase(ABC):
     """
     name = NotImplementedError
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        EXECUTORS.register_class(cls)
+
     def __init__(self, **kwargs) -> None:
         self._logger: logging.Logger = logger
 
+    async def connect(self) -> None:
+        """
+        Opens the connection used by this executor (if any).
+        Executors that do not keep a connection open have nothing to do here.
+        :return:
+        """
+
+    async def disconnect(self) -> None:
+        """
+        Closes the connection opened by connect (if any).
+        :return:
+        """
+
     async def execute(self, command: CommandBase) -> ExecutionBase:
         """
         Executes the given command differently based on
@@ -36,7 +61,15 @@ class ExecutorBase(ABC):
         self._logger.debug(
             'Executing command with [%s] - %s' % (self.__class__.__name__, command.args)
         )
-        execution: ExecutionBase = await self._execute(command)
+        if inspect.iscoroutinefunction(self._execute):
+            execution: ExecutionBase = await self._execute(command)
+        else:
+            # Blocking implementations run in a worker thread, not to stall the loop
+            execution = await asyncio.get_running_loop().run_in_executor(
+                None, self._execute, command
+            )
+            if inspect.isawaitable(execution):
+                execution = await execution
 
         # # If command is a not a daemon, wait for it
         # if command.wait_for:
@@ -48,6 +81,18 @@ class ExecutorBase(ABC):
         # returning execution
         return execution
 
+    def execute_sync(
+        self, command: CommandBase, timeout: Optional[float] = None
+    ) -> ExecutionBase:
+        """
+        Blocking version of execute, for synchronous callers. The command
+        runs on the shared runtime event loop (see iqa.utils.runtime).
+        :param command:
+        :param timeout: max seconds to wait for the execution to be returned
+        :return:
+        """
+        return run_sync(self.execute(command), timeout=timeout)
+
     @abstractmethod
     async def _execute(self, command: CommandBase) -> ExecutionBase:
         """
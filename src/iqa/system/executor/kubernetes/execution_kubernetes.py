@@ -5,9 +5,7 @@ import threading
 from typing import IO
 
 import urllib3
-from kubernetes import config, client
-from kubernetes.client import Configuration, CoreV1Api
-from kubernetes.client.apis import core_v1_api
+from kubernetes.client import CoreV1Api
 from kubernetes.stream import stream
 from kubernetes.stream.ws_client import WSClient
 
@@ -58,26 +56,8 @@ class ExecutionKubernetes(Execution):
                 mode='w+t', encoding=command.encoding
             )
 
-        # Set the config and get Api instance
-        client_config: Configuration = client.Configuration()
-        client_config.verify_ssl = False
-        client_config.assert_hostname = False
-        client_config.host = executor.host
-
-        # If a token has been provided use it
-        if executor.token:
-            client_config.api_key = {'authorization': 'Bearer' + executor.token}
-
-        # Loading kubernetes config when config and context provided
-        if executor.config and executor.context:
-            config.load_kube_config(
-                config_file=executor.config,
-                client_configuration=client_config,
-                context=executor.context,
-            )
-
-        # Kubernetes API instance
-        self.api: CoreV1Api = core_v1_api.CoreV1Api(client.ApiClient(client_config))
+        # Kubernetes API instance (shared by all executions of the executor)
+        self.api: CoreV1Api = executor.get_api()
 
         # Kubernetes response (internal execution)
         self.response: WSClient
@@ -1,4 +1,6 @@
+import asyncio
 import os
+from typing import Any, Optional
 
 from iqa.system.command.command_base import CommandBase
 from iqa.system.executor import ExecutorBase
@@ -10,6 +12,8 @@ class ExecutorKubernetes(ExecutorBase):
     This Executor uses the ExecutionKubernetes to run commands through the Kubernetes Client API.
     """
 
+    implementation: str = 'kubernetes'
+
     def __init__(self, **kwargs) -> None:
         """
         :param kwargs:
@@ -61,9 +65,54 @@ class ExecutorKubernetes(ExecutorBase):
         # If your selector returns multiple pods, only the first matching one will be used.
         self.selector: str = kwargs.get('executor_kubernetes_selector', None)
 
-    @property
-    def implementation(self) -> str:
-        return 'kubernetes'
+        # Kubernetes API instance (created once and shared by all executions)
+        self._api: Optional[Any] = None
+
+    async def connect(self) -> None:
+        """
+        Creates the Kubernetes API client (loading config files is blocking,
+        so it is done in a worker thread).
+        :return:
+        """
+        if self._api is None:
+            await asyncio.get_running_loop().run_in_executor(None, self.get_api)
+
+    async def disconnect(self) -> None:
+        if self._api is not None:
+            self._api.api_client.close()
+            self._api = None
+
+    def get_api(self) -> Any:
+        """
+        Returns the CoreV1Api instance for this executor, creating it on first use.
+        :return:
+        """
+        if self._api is not None:
+            return self._api
+
+        from kubernetes import client, config
+        from kubernetes.client import Configuration, CoreV1Api
+
+        # Set the config and get Api instance
+        client_config: Configuration = client.Configuration()
+        client_config.verify_ssl = False
+        client_config.assert_hostname = False
+        client_config.host = self.host
+
+        # If a token has been provided use it
+        if self.token:
+            client_config.api_key = {'authorization': 'Bearer ' + self.token}
+
+        # Loading kubernetes config when config and context provided
+        if self.config and self.context:
+            config.load_kube_config(
+                config_file=self.config,
+                client_configuration=client_config,
+                context=self.context,
+            )
+
+        self._api = CoreV1Api(client.ApiClient(client_config))
+        return self._api
 
     def _execute(self, command: CommandBase):
         from iqa.system.executor.kubernetes.execution_kubernetes import ExecutionKubernetes
@@ -1,38 +1,51 @@
 import logging
-from typing import TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 
 from iqa.system.executor.ansible.executor_ansible import ExecutorAnsible
 from iqa.system.executor.docker.executor_docker import ExecutorDocker
 from iqa.system.node.node_ansible import NodeAnsible
-from iqa.system.node.node_docker import NodeDocker
 from iqa.system.node.node_localhost import NodeLocal
 
 if TYPE_CHECKING:
     from iqa.utils.types import ExecutorType, NodeType
 
 
+def __getattr__(name: str) -> Any:
+    # NodeDocker depends on the docker library, so it is only imported when needed
+    if name == 'NodeDocker':
+        from iqa.system.node.node_docker import NodeDocker
+        return NodeDocker
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+
 class NodeFactory(object):
     logger: logging.Logger = logging.getLogger(__name__)
 
     @staticmethod
     def create_node(
-        hostname: str, executor: 'ExecutorType', ip: str = None, **kwargs
+        hostname: str,
+        executor: 'ExecutorType',
+        ip: str = None,
+        reachable: Optional[bool] = None,
+        **kwargs
     ) -> 'NodeType':
         """
         Creates a Node object based on provided arguments.
         :param hostname:
         :param executor:
         :param ip:
+        :param reachable: if already known, the node is not probed
         :param kwargs:
         :return:
         """
         new_node: 'NodeType'
         if isinstance(executor, ExecutorAnsible):
-            new_node = NodeAnsible(hostname, executor, ip)
+            new_node = NodeAnsible(hostname, executor, ip, reachable=reachable)
         elif isinstance(executor, ExecutorDocker):
-            new_node = NodeDocker(hostname, executor, ip)
+            from iqa.system.node.node_docker import NodeDocker
+            new_node = NodeDocker(hostname, executor, ip=ip, reachable=reachable)
         else:
-            new_node = NodeLocal(hostname, executor, ip)
+            new_node = NodeLocal(hostname, executor, ip, reachable=reachable)
 
         NodeFactory.logger.info(
             'Creating %s [hostname=%s, host=%s]'
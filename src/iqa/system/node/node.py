@@ -19,21 +19,35 @@ class Node(abc.ABC):
     """Node abstract component"""
 
     def __init__(
-        self, hostname: str, executor: 'ExecutorType', name: str = None, ip: str = ''
+        self,
+        hostname: str,
+        executor: 'ExecutorType',
+        name: str = None,
+        ip: str = '',
+        reachable: Optional[bool] = None,
     ) -> None:
-        logging.getLogger().info('Initialization of Node: %s' % self.hostname)
+        """
+        :param hostname:
+        :param executor:
+        :param name:
+        :param ip:
+        :param reachable: if already known (i.e. from an instance snapshot),
+                          the node address and reachability are not probed
+        """
+        logging.getLogger().info('Initialization of Node: %s' % hostname)
         self.hostname: str = hostname
         self.name: str = name if name else hostname
         self.executor: ExecutorType = executor
         self.ip: Optional[str] = ip
-        self.reachable: bool = False
+        self.reachable: bool = bool(reachable)
 
-        self._get_ip()
-        self._is_reachable()
+        if reachable is None:
+            self._get_ip()
+            self._is_reachable()
 
     def execute(self, command: CommandBase) -> ExecutionBase:
         """Execute command using Node's executor"""
-        return self.executor.execute(command)
+        return self.executor.execute_sync(command)
 
     @abc.abstractmethod
     def ping(self) -> bool:
@@ -4,18 +4,25 @@ Ansible Node implementation of Node Interface.
 
 import logging
 import re
-from typing import Union
+from typing import Optional, Union
 
 from iqa.system.command.command_ansible import CommandBaseAnsible
 from iqa.system.executor import ExecutorBase, ExecutionBase
 from iqa.system.node.node import Node
+from iqa.utils.runtime import resolve
 
 
 class NodeAnsible(Node):
     """Ansible implementation for Node interface."""
 
-    def __init__(self, hostname: str, executor: ExecutorBase, ip: str = None) -> None:
-        super(NodeAnsible, self).__init__(hostname, executor, ip)
+    def __init__(
+        self,
+        hostname: str,
+        executor: ExecutorBase,
+        ip: str = None,
+        reachable: Optional[bool] = None,
+    ) -> None:
+        super(NodeAnsible, self).__init__(hostname, executor, ip=ip, reachable=reachable)
         logging.getLogger().info('Initialization of NodeAnsible: %s' % self.hostname)
 
     def ping(self) -> bool:
@@ -23,11 +30,15 @@ class NodeAnsible(Node):
         cmd_ping: CommandBaseAnsible = CommandBaseAnsible(
             ansible_module='ping', stdout=True, timeout=20
         )
-        execution: ExecutionBase = self.executor.execute(cmd_ping)
+        execution: ExecutionBase = self.executor.execute_sync(cmd_ping)
 
         # True if completed with exit code 0 and stdout has some data
         return execution.completed_successfully() and bool(execution.read_stdout())
 
+    def _get_ip(self) -> Optional[str]:
+        self.ip = self.get_ip()
+        return self.ip
+
     def get_ip(self):
         """Get host of Ansible node"""
         if self.ip:
@@ -40,8 +51,8 @@ class NodeAnsible(Node):
             stderr=True,
             timeout=20,
         )
-        execution: ExecutionBase = self.executor.execute(cmd_ping)
-        execution.wait()
+        execution: ExecutionBase = self.executor.execute_sync(cmd_ping)
+        resolve(execution.wait())
 
         if not execution.completed_successfully() or not execution.read_stdout():
             return None
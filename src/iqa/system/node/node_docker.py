@@ -4,6 +4,7 @@ Ansible Node implementation of Node Interface.
 
 import logging
 import time
+from typing import Optional
 
 from timeit import default_timer
 from docker.errors import APIError, NotFound
@@ -24,14 +25,23 @@ class NodeDocker(Node):
             executor: ExecutorDocker,
             docker_host: str = '',
             docker_network: str = '',
-            ip: str = ''
+            ip: str = '',
+            reachable: Optional[bool] = None
     ) -> None:
 
         logger.info('Initialization of NodeDocker: %s' % hostname)
         self.hostname: str = hostname
+        self.docker_host: str = docker_host
         self.docker_network: str = docker_network
-        self.container: Container = self._get_container(docker_host=docker_host)
-        super(NodeDocker, self).__init__(hostname, executor, ip)
+        self._container: Optional[Container] = None
+        super(NodeDocker, self).__init__(hostname, executor, ip=ip, reachable=reachable)
+
+    @property
+    def container(self) -> Container:
+        """Container of this node (retrieved on first use)"""
+        if self._container is None:
+            self._container = self._get_container(docker_host=self.docker_host)
+        return self._container
 
     def ping(self) -> bool:
         """Send ping to Docker node"""
@@ -4,7 +4,7 @@ Basic concrete implementation of Node interface.
 
 import logging
 import re
-from typing import Union
+from typing import Optional, Union
 
 from iqa.system.command.command_base import CommandBase
 from iqa.system.executor import ExecutorBase
@@ -15,8 +15,14 @@ from iqa.system.node.node import Node
 class NodeLocal(Node):
     """Node component."""
 
-    def __init__(self, hostname: str, executor: ExecutorBase, ip: str = None) -> None:
-        super(NodeLocal, self).__init__(hostname, executor, ip)
+    def __init__(
+        self,
+        hostname: str,
+        executor: ExecutorBase,
+        ip: str = None,
+        reachable: Optional[bool] = None,
+    ) -> None:
+        super(NodeLocal, self).__init__(hostname, executor, ip=ip, reachable=reachable)
         logging.getLogger().info('Initialization of NodeLocal: %s' % self.hostname)
 
     def ping(self) -> bool:
@@ -28,11 +34,15 @@ class NodeLocal(Node):
             return False
         cmd_ping.args = ['ping', '-c', '1', self.get_ip()]
 
-        execution: ExecutionBase = self.executor.execute(cmd_ping)
+        execution: ExecutionBase = self.executor.execute_sync(cmd_ping)
 
         # True if completed with exit code 0 and stdout has some data
         return execution.completed_successfully() and bool(execution.read_stdout())
 
+    def _get_ip(self) -> Optional[str]:
+        self.ip = self.get_ip()
+        return self.ip
+
     def get_ip(self):
         """Get host of node"""
         if self.ip is not None:
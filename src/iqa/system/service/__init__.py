@@ -1,19 +1,36 @@
 import logging
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 
 from iqa.system.command.command_base import CommandBase
 from iqa.system.executor.docker.executor_docker import ExecutorDocker
 from iqa.system.executor.ansible.executor_ansible import ExecutorAnsible
 from iqa.system.executor import ExecutionBase
-from iqa.system.service.service import Service
+from iqa.system.service.service import SERVICES, Service
 from .service_artemis import ServiceFakeArtemis
-from .service_docker import ServiceDocker
+from .service_group import ServiceGroup
 from .service_system_init import ServiceSystemInit
 from .service_systemd import ServiceSystemD
 
 if TYPE_CHECKING:
     from iqa.utils.types import ExecutorType
 
+# Built-in service implementations, only imported when first used
+SERVICES.update(
+    {
+        'artemis': 'iqa.system.service.service_artemis:ServiceFakeArtemis',
+        'docker': 'iqa.system.service.service_docker:ServiceDocker',
+        'system_init': 'iqa.system.service.service_system_init:ServiceSystemInit',
+        'systemd': 'iqa.system.service.service_systemd:ServiceSystemD',
+    },
+)
+
+
+def __getattr__(name: str) -> Any:
+    # ServiceDocker depends on the docker library, so it is only imported when needed
+    if name == 'ServiceDocker':
+        return SERVICES.get('docker')
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
 
 class ServiceFactory(object):
     """
@@ -31,26 +48,42 @@ class ServiceFactory(object):
 
     @staticmethod
     def create_service(
-        executor: 'ExecutorType', service_name: Optional[str] = None, **kwargs
+        executor: 'ExecutorType',
+        service_name: Optional[str] = None,
+        implementation: Optional[str] = None,
+        **kwargs
     ) -> Service:
+        """
+        Creates the Service used to manage the server component.
+        :param executor:
+        :param service_name:
+        :param implementation: service implementation already known (i.e. from an
+                               instance snapshot), so that it does not need to be probed
+        :param kwargs:
+        :return:
+        """
         if service_name:
-            # Validate if systemd is available
-            svc_cmd_exec: ExecutionBase = executor.execute(
-                CommandBase(['pidof', 'systemd'], stdout=True, timeout=30)
-            )
-            if svc_cmd_exec.completed_successfully():
+            if implementation not in ('systemd', 'system_init'):
+                # Validate if systemd is available
+                svc_cmd_exec: ExecutionBase = executor.execute_sync(
+                    CommandBase(['pidof', 'systemd'], stdout=True, timeout=30)
+                )
+                implementation = (
+                    'systemd' if svc_cmd_exec.completed_successfully() else 'system_init'
+                )
+
+            if implementation == 'systemd':
                 # Create ServiceSystemD
                 ServiceFactory._logger.debug(
                     'Creating ServiceSystemD - name: %s - executor: %s'
                     % (service_name, executor.__class__.__name__)
                 )
-                return ServiceSystemD(name=service_name, executor=executor)
             else:
                 ServiceFactory._logger.debug(
                     'Creating ServiceSystemInit - name: %s - executor: %s'
                     % (service_name, executor.__class__.__name__)
                 )
-                return ServiceSystemInit(name=service_name, executor=executor)
+            return SERVICES.get(implementation)(name=service_name, executor=executor)
         else:
             container_name: Optional[str] = None
             if isinstance(executor, ExecutorDocker):
@@ -65,7 +98,7 @@ class ServiceFactory(object):
                     'Creating ServiceArtemis - name: %s - executor: %s'
                     % (service_name, executor.__class__.__name__)
                 )
-                return ServiceFakeArtemis(
+                return SERVICES.get('artemis')(
                     name=service_name, executor=executor, **kwargs
                 )
 
@@ -74,7 +107,7 @@ class ServiceFactory(object):
                     'Creating ServiceDocker - name: %s - executor: %s'
                     % (container_name, executor.__class__.__name__)
                 )
-                return ServiceDocker(name=container_name, executor=executor)  # type: ignore
+                return SERVICES.get('docker')(name=container_name, executor=executor)  # type: ignore
 
         ServiceFactory._logger.debug('Unable to determine Service')
         raise ValueError('Unable to determine service for server component')
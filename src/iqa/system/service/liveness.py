@@ -0,0 +1,275 @@
+"""
+Liveness watch of the main process of a service.
+
+Instead of polling the service status, the watcher blocks on the exit of the
+main process of the service (pidfd for local processes, "tail --pid" through
+the executor for remote ones, container events for docker services), so
+a crash is detected as soon as it happens. Deaths are notified to the
+registered callbacks and downtime windows are recorded until the service
+is running again (i.e. restarted by the test or by its supervisor).
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, Optional, TYPE_CHECKING
+
+from iqa.system.command.command_base import CommandBase
+from iqa.utils.runtime import get_loop, in_runtime_thread, maybe_await
+
+if TYPE_CHECKING:
+    from iqa.system.service.service import Service
+    from iqa.utils.types import ExecutorType
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Executors running commands on the local machine
+LOCAL_EXECUTORS: tuple = ('local', 'asyncio')
+
+
+async def wait_pid_exit(executor: 'ExecutorType', pid: int) -> None:
+    """
+    Waits for the process with the given pid to exit, on the machine
+    the executor runs commands on.
+    :param executor:
+    :param pid:
+    :return:
+    """
+    if getattr(executor, 'implementation', None) in LOCAL_EXECUTORS:
+        await wait_local_pid_exit(pid)
+        return
+
+    # Remote wait: tail exits as soon as the process dies
+    execution = await executor.execute(
+        CommandBase(
+            ['tail', '--pid=%d' % pid, '-f', '/dev/null'], stdout=False, stderr=False
+        )
+    )
+    try:
+        await maybe_await(execution.wait())
+    except asyncio.CancelledError:
+        execution.terminate()
+        raise
+
+
+async def wait_local_pid_exit(pid: int, interval: float = 0.05) -> None:
+    """
+    Waits for a local process to exit, using a pidfd when supported
+    (woken up by the kernel), otherwise checking the pid periodically.
+    :param pid:
+    :param interval:
+    :return:
+    """
+    try:
+        pidfd: int = os.pidfd_open(pid)  # type: ignore
+    except (AttributeError, OSError):
+        while _pid_exists(pid):
+            await asyncio.sleep(interval)
+        return
+
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    exited: asyncio.Future = loop.create_future()
+    loop.add_reader(pidfd, lambda: exited.done() or exited.set_result(None))
+    try:
+        await exited
+    finally:
+        loop.remove_reader(pidfd)
+        os.close(pidfd)
+
+
+def _pid_exists(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class DowntimeWindow(object):
+    """
+    Period of time in which the main process of a service was not running.
+    """
+
+    def __init__(self, started_at: float) -> None:
+        self.started_at: float = started_at
+        self.ended_at: Optional[float] = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.ended_at is None:
+            return None
+        return self.ended_at - self.started_at
+
+    def __repr__(self) -> str:
+        return 'DowntimeWindow(%s - %s)' % (self.started_at, self.ended_at)
+
+
+class LivenessWatcher(object):
+    """
+    Watches the main process of a service in the shared runtime loop.
+    """
+
+    def __init__(self, service: 'Service', interval: float = 0.5) -> None:
+        """
+        :param service:
+        :param interval: seconds between checks while the service is not running
+        """
+        self.service: 'Service' = service
+        self.interval: float = interval
+        self.windows: List[DowntimeWindow] = []
+        self.deaths: List[float] = []
+        self._callbacks: List[Callable[['LivenessWatcher'], None]] = []
+        self._condition: threading.Condition = threading.Condition()
+        self._task: Optional[Future] = None
+        self._resolved: threading.Event = threading.Event()
+
+        # main_pid blocks on execute_sync, whose blocking executors use the
+        # default executor of the loop, so it must not run in that pool
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def on_death(self, callback: Callable[['LivenessWatcher'], None]) -> None:
+        """
+        Registers a callback called (from the runtime thread) when the process dies.
+        :param callback:
+        :return:
+        """
+        self._callbacks.append(callback)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def alive(self) -> bool:
+        """
+        True if the main process is running (as far as the watcher knows).
+        """
+        with self._condition:
+            return not self.windows or self.windows[-1].ended_at is not None
+
+    def start(self, timeout: Optional[float] = None) -> 'LivenessWatcher':
+        """
+        Starts watching and blocks until the pid of the main process has been
+        resolved, so the process dying right after this call is a death.
+        :param timeout: max seconds to wait for the pid (defaults to the service TIMEOUT)
+        :return:
+        """
+        if in_runtime_thread():
+            raise RuntimeError('LivenessWatcher cannot be started from the runtime loop')
+
+        if not self.running:
+            self._resolved.clear()
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='iqa-liveness'
+                )
+            self._task = asyncio.run_coroutine_threadsafe(
+                self._watch(self._pool), get_loop()
+            )
+
+        if not self._resolved.wait(
+            timeout if timeout is not None else self.service.TIMEOUT
+        ):
+            logger.warning('Unable to resolve the pid of %s' % self.service.name)
+        return self
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    def wait_for_death(
+        self, timeout: Optional[float] = None, since: Optional[float] = None
+    ) -> bool:
+        """
+        Blocks until the main process dies (a new death after this call).
+        :param timeout:
+        :param since: time (time.time()) from which deaths count, including the
+                      ones already recorded (i.e. taken before killing the process)
+        :return: True if the process died before timeout
+        """
+        with self._condition:
+            if since is not None:
+                return self._condition.wait_for(
+                    lambda: any(death >= since for death in self.deaths), timeout
+                )
+            deaths: int = len(self.deaths)
+            return self._condition.wait_for(lambda: len(self.deaths) > deaths, timeout)
+
+    async def _watch(self, pool: ThreadPoolExecutor) -> None:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        dead_pid: Optional[int] = None
+        # Pid seen running whose exit has not been recorded yet
+        watched_pid: Optional[int] = None
+        while True:
+            try:
+                pid: Optional[int] = await loop.run_in_executor(
+                    pool, lambda: self.service.main_pid
+                )
+            except Exception as ex:
+                logger.debug('Unable to get pid of %s: %s' % (self.service.name, ex))
+                pid = None
+
+            # The pid that just died may still be reported for a while
+            if pid is None or pid == dead_pid:
+                if watched_pid is not None:
+                    # Died while its exit was not being waited for
+                    dead_pid, watched_pid = watched_pid, None
+                    self._died(time.time())
+                else:
+                    self._down(time.time())
+                self._resolved.set()
+                await asyncio.sleep(self.interval)
+                continue
+
+            if watched_pid is not None and pid != watched_pid:
+                # Replaced by a new process between two checks
+                self._died(time.time())
+            watched_pid = pid
+            self._up(time.time())
+            self._resolved.set()
+            try:
+                await self.service.wait_for_exit(pid)
+            except asyncio.CancelledError:
+                raise
+            except Exception as ex:
+                logger.debug('Liveness watch of %s failed: %s' % (self.service.name, ex))
+                await asyncio.sleep(self.interval)
+                continue
+
+            dead_pid, watched_pid = pid, None
+            self._died(time.time())
+
+    def _died(self, now: float) -> None:
+        logger.debug('Service %s is down' % self.service.name)
+        with self._condition:
+            self.deaths.append(now)
+            self.windows.append(DowntimeWindow(now))
+            self._condition.notify_all()
+
+        for callback in self._callbacks:
+            try:
+                callback(self)
+            except Exception:
+                logger.exception('Liveness callback failed')
+
+    def _down(self, now: float) -> None:
+        with self._condition:
+            if self.alive:
+                self.windows.append(DowntimeWindow(now))
+
+    def _up(self, now: float) -> None:
+        with self._condition:
+            if not self.alive:
+                self.windows[-1].ended_at = now
+                logger.debug(
+                    'Service %s is up (downtime: %.3fs)'
+                    % (self.service.name, self.windows[-1].duration)
+                )
@@ -0,0 +1,340 @@
+"""
+Readiness probes used to determine when a service is actually serving.
+
+Each probe implements a single check, and Probe.wait retries it with
+exponential backoff (plus jitter) until it succeeds or the overall deadline
+expires. Probes can be composed with & (all of them) and | (any of them),
+in which case the composed probes are waited for concurrently:
+
+    probe = TcpProbe(ip, 8161) & (AmqpProbe(ip, 5672) | TcpProbe(ip, 61616))
+    ready: bool = await probe.wait(timeout=60)
+"""
+import asyncio
+import logging
+import random
+import re
+from abc import ABC, abstractmethod
+from typing import Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+from iqa.system.command.command_base import CommandBase
+from iqa.utils.runtime import maybe_await
+from iqa.utils.tcp_util import is_host_port_open
+
+if TYPE_CHECKING:
+    from iqa.utils.types import ExecutorType
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Protocol header sent by AMQP 1.0 clients (SASL layer)
+AMQP_SASL_HEADER: bytes = b'AMQP\x03\x01\x00\x00'
+
+
+class Backoff(object):
+    """
+    Delays between attempts, growing exponentially up to a maximum.
+    Each delay is randomly spread by +/- jitter (fraction of the delay).
+    """
+
+    def __init__(
+        self,
+        initial: float = 0.05,
+        maximum: float = 2.0,
+        factor: float = 2.0,
+        jitter: float = 0.2,
+    ) -> None:
+        self.initial: float = initial
+        self.maximum: float = maximum
+        self.factor: float = factor
+        self.jitter: float = jitter
+
+    def delays(self) -> Iterator[float]:
+        delay: float = self.initial
+        while True:
+            yield delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+            delay = min(delay * self.factor, self.maximum)
+
+
+class Probe(ABC):
+    """
+    Readiness check of a service.
+    """
+
+    async def prepare(self) -> None:
+        """
+        Called before the service operation (start, restart) is issued,
+        so probes can take a baseline (i.e. current log lines).
+        :return:
+        """
+
+    @abstractmethod
+    async def check(self) -> bool:
+        """
+        Single attempt. Returns True if ready.
+        :return:
+        """
+        raise NotImplementedError
+
+    async def wait(self, timeout: float, backoff: Optional[Backoff] = None) -> bool:
+        """
+        Retries the check until it succeeds or timeout (seconds) expires.
+        :param timeout:
+        :param backoff:
+        :return: True if ready before the deadline, False otherwise
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        deadline: float = loop.time() + timeout
+        delays: Iterator[float] = (backoff or Backoff()).delays()
+
+        while True:
+            remaining: float = deadline - loop.time()
+            if remaining <= 0:
+                break
+
+            try:
+                if await asyncio.wait_for(self.check(), remaining):
+                    logger.debug('%s is ready' % self)
+                    return True
+            except asyncio.TimeoutError:
+                break
+            except Exception as ex:
+                logger.debug('%s check failed: %s' % (self, ex))
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(next(delays), remaining))
+
+        logger.debug('%s not ready after %ss' % (self, timeout))
+        return False
+
+    def __and__(self, other: 'Probe') -> 'AllProbes':
+        return AllProbes(self, other)
+
+    def __or__(self, other: 'Probe') -> 'AnyProbe':
+        return AnyProbe(self, other)
+
+    def __repr__(self) -> str:
+        return self.__class__.__name__
+
+
+class _CompositeProbe(Probe):
+    def __init__(self, *probes: Probe) -> None:
+        self.probes: List[Probe] = []
+        for probe in probes:
+            # Flatten probes composed the same way: (a & b) & c => all(a, b, c)
+            if type(probe) is type(self):
+                self.probes.extend(probe.probes)  # type: ignore
+            else:
+                self.probes.append(probe)
+
+    async def prepare(self) -> None:
+        await asyncio.gather(*[probe.prepare() for probe in self.probes])
+
+    async def _wait_all(
+        self, timeout: float, backoff: Optional[Backoff], stop_on: bool
+    ) -> Optional[bool]:
+        """
+        Waits for all probes concurrently, returning as soon as one of them
+        returns stop_on (remaining ones are cancelled) or None otherwise.
+        """
+        tasks: list = [
+            asyncio.ensure_future(probe.wait(timeout, backoff)) for probe in self.probes
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                if await task is stop_on:
+                    return stop_on
+        finally:
+            for task in tasks:
+                task.cancel()
+        return None
+
+    def __repr__(self) -> str:
+        return '%s(%s)' % (
+            self.__class__.__name__,
+            ', '.join(repr(probe) for probe in self.probes),
+        )
+
+
+class AllProbes(_CompositeProbe):
+    """
+    Ready when all of the given probes are ready.
+    """
+
+    async def check(self) -> bool:
+        return all(await asyncio.gather(*[probe.check() for probe in self.probes]))
+
+    async def wait(self, timeout: float, backoff: Optional[Backoff] = None) -> bool:
+        return await self._wait_all(timeout, backoff, stop_on=False) is None
+
+    def __and__(self, other: Probe) -> 'AllProbes':
+        return AllProbes(self, other)
+
+
+class AnyProbe(_CompositeProbe):
+    """
+    Ready when any of the given probes is ready.
+    """
+
+    async def check(self) -> bool:
+        return any(await asyncio.gather(*[probe.check() for probe in self.probes]))
+
+    async def wait(self, timeout: float, backoff: Optional[Backoff] = None) -> bool:
+        return bool(await self._wait_all(timeout, backoff, stop_on=True))
+
+
+class TcpProbe(Probe):
+    """
+    Ready when a TCP connection can be established to host:port.
+    """
+
+    def __init__(self, host: str, port: int, connect_timeout: float = 2.0) -> None:
+        self.host: str = host
+        self.port: int = int(port)
+        self.connect_timeout: float = connect_timeout
+
+    async def check(self) -> bool:
+        return await is_host_port_open(self.host, self.port, self.connect_timeout)
+
+    def __repr__(self) -> str:
+        return 'TcpProbe(%s:%s)' % (self.host, self.port)
+
+
+class AmqpProbe(TcpProbe):
+    """
+    Ready when the AMQP 1.0 endpoint at host:port answers the protocol
+    header with its own header. The connection is closed right after.
+    """
+
+    async def check(self) -> bool:
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.connect_timeout
+            )
+        except (OSError, asyncio.TimeoutError):
+            return False
+
+        try:
+            writer.write(AMQP_SASL_HEADER)
+            await writer.drain()
+            header: bytes = await asyncio.wait_for(
+                reader.readexactly(len(AMQP_SASL_HEADER)), self.connect_timeout
+            )
+            return header.startswith(b'AMQP')
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+            return False
+        finally:
+            writer.close()
+
+    def __repr__(self) -> str:
+        return 'AmqpProbe(%s:%s)' % (self.host, self.port)
+
+
+class HttpProbe(Probe):
+    """
+    Ready when a GET request to url returns the expected status code.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        auth: Optional[Tuple[str, str]] = None,
+        status: int = 200,
+        request_timeout: float = 2.0,
+    ) -> None:
+        self.url: str = url
+        self.auth: Optional[Tuple[str, str]] = auth
+        self.status: int = status
+        self.request_timeout: float = request_timeout
+
+    async def check(self) -> bool:
+        # requests is blocking, so it runs in a worker thread
+        return await asyncio.get_running_loop().run_in_executor(None, self._check)
+
+    def _check(self) -> bool:
+        import requests
+
+        try:
+            response = requests.get(
+                self.url, auth=self.auth, timeout=self.request_timeout
+            )
+        except requests.RequestException:
+            return False
+        return response.status_code == self.status and self.is_ready(response)
+
+    def is_ready(self, response) -> bool:
+        return True
+
+    def __repr__(self) -> str:
+        return '%s(%s)' % (self.__class__.__name__, self.url)
+
+
+class JolokiaProbe(HttpProbe):
+    """
+    Ready when the Jolokia API exposed by the broker answers. If a broker
+    name is given, the broker must also report it has been started.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        broker_name: Optional[str] = None,
+        request_timeout: float = 2.0,
+    ) -> None:
+        path: str = 'version'
+        if broker_name:
+            path = 'read/org.apache.activemq.artemis:broker="%s"/Started' % broker_name
+
+        super(JolokiaProbe, self).__init__(
+            'http://%s:%s/console/jolokia/%s' % (host, port, path),
+            auth=(user, password) if user else None,
+            request_timeout=request_timeout,
+        )
+        self.broker_name: Optional[str] = broker_name
+
+    def is_ready(self, response) -> bool:
+        try:
+            result: dict = response.json()
+        except ValueError:
+            return False
+
+        if result.get('status') != 200:
+            return False
+        return result.get('value') is True if self.broker_name else True
+
+
+class LogLineProbe(Probe):
+    """
+    Ready when a line matching the given pattern is logged to the given file,
+    using the executor of the service. Lines logged before prepare()
+    (i.e. from a previous start) are not taken into account.
+    """
+
+    def __init__(self, executor: 'ExecutorType', path: str, pattern: str) -> None:
+        self.executor: 'ExecutorType' = executor
+        self.path: str = path
+        self.pattern: str = pattern
+        self._baseline: int = 0
+
+    async def prepare(self) -> None:
+        self._baseline = await self._count()
+
+    async def check(self) -> bool:
+        return await self._count() > self._baseline
+
+    async def _count(self) -> int:
+        execution = await self.executor.execute(
+            CommandBase(
+                ['grep', '-c', '-E', self.pattern, self.path], stdout=True, timeout=10
+            )
+        )
+        await maybe_await(execution.wait())
+        output: Optional[str] = execution.read_stdout()
+        match = re.search(r'\d+', output or '')
+        return int(match.group()) if match else 0
+
+    def __repr__(self) -> str:
+        return 'LogLineProbe(%s: %s)' % (self.path, self.pattern)
@@ -1,9 +1,26 @@
+import logging
+import time
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Optional
+from typing import Callable, Optional
 
 from iqa.system.executor import ExecutorBase
 from iqa.system.executor import ExecutionBase
+from iqa.system.service.liveness import wait_pid_exit
+from iqa.system.service.probe import Probe
+from iqa.system.service.timing import (
+    CONFIRMED,
+    EXITED,
+    ISSUED,
+    READY,
+    TIMINGS,
+    TransitionTiming,
+)
+from iqa.utils.plugins import PluginRegistry
+from iqa.utils.runtime import resolve, run_sync
+
+# Service implementations by name (built-in ones are listed in iqa.system.service)
+SERVICES: PluginRegistry = PluginRegistry('iqa.services')
 
 
 class ServiceStatus(Enum):
@@ -19,11 +36,142 @@ class Service(ABC):
     """
 
     TIMEOUT: int = 30
+    STATUS_INTERVAL: float = 0.5
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        SERVICES.register_class(cls)
 
     def __init__(self, name: Optional[str], executor: ExecutorBase) -> None:
         self.name: Optional[str] = name
         self.executor: ExecutorBase = executor
 
+        # Readiness probe used by start/restart when wait is requested
+        self.probe: Optional[Probe] = None
+
+        # Component type (i.e. router, broker) used to summarize transition timings
+        self.component_type: Optional[str] = None
+
+    async def wait_ready(
+        self, timeout: Optional[float] = None, probe: Optional[Probe] = None
+    ) -> bool:
+        """
+        Waits until the readiness probe succeeds (no probe means ready).
+        :param timeout: max seconds to wait (defaults to TIMEOUT)
+        :param probe: probe to use instead of the one defined for the service
+        :return: True if the service is ready
+        """
+        probe = probe or self.probe
+        if probe is None:
+            return True
+
+        ready: bool = await probe.wait(timeout if timeout is not None else self.TIMEOUT)
+        if not ready:
+            logging.getLogger(__name__).warning(
+                'Service %s is not ready (%s)' % (self.name, probe)
+            )
+        return ready
+
+    def wait_until_ready(
+        self, timeout: Optional[float] = None, probe: Optional[Probe] = None
+    ) -> bool:
+        """
+        Blocking version of wait_ready.
+        :param timeout: max seconds to wait (defaults to TIMEOUT)
+        :param probe: probe to use instead of the one defined for the service
+        :return: True if the service is ready
+        """
+        return run_sync(self.wait_ready(timeout, probe))
+
+    def wait_for_status(
+        self, status: ServiceStatus, timeout: Optional[float] = None
+    ) -> bool:
+        """
+        Waits until the service reaches the given status, polling it
+        (implementations may be notified of state changes instead).
+        :param status: expected status
+        :param timeout: max seconds to wait (defaults to TIMEOUT)
+        :return: True if the status has been reached
+        """
+        deadline: float = time.monotonic() + (
+            timeout if timeout is not None else self.TIMEOUT
+        )
+        while self.status() != status:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(self.STATUS_INTERVAL)
+        return True
+
+    @property
+    def main_pid(self) -> Optional[int]:
+        """
+        PID of the main process of the service, on the machine the executor
+        runs commands on (None if it is not running or not known).
+        """
+        return None
+
+    async def wait_for_exit(self, pid: int) -> None:
+        """
+        Waits for the main process of the service (given pid) to exit.
+        :param pid:
+        :return:
+        """
+        await wait_pid_exit(self.executor, pid)
+
+    def _execute_and_wait(
+        self,
+        operation: Callable[[], ExecutionBase],
+        wait: bool,
+        probe: Optional[Probe] = None,
+        name: str = 'start',
+        status: ServiceStatus = ServiceStatus.RUNNING,
+    ) -> ExecutionBase:
+        """
+        Runs the given service operation and, if requested, waits till the
+        service reaches the expected status and (when running) is ready.
+        Used by start, stop and restart implementations, which are timed
+        and recorded to TIMINGS.
+        :param operation:
+        :param wait:
+        :param probe: probe to use instead of the one defined for the service
+        :param name: name of the operation
+        :param status: status expected once the operation is done
+        :return:
+        """
+        probe = probe or self.probe
+        if status != ServiceStatus.RUNNING:
+            probe = None
+
+        if wait and probe is not None:
+            run_sync(probe.prepare())
+
+        timing: TransitionTiming = TransitionTiming.for_service(self, name)
+        try:
+            timing.mark(ISSUED)
+            execution: ExecutionBase = operation()
+            resolve(execution.wait())
+            timing.mark(EXITED)
+
+            if wait:
+                if self.wait_for_status(status):
+                    timing.mark(CONFIRMED)
+                else:
+                    logging.getLogger(__name__).warning(
+                        'Service %s did not reach status %s' % (self.name, status.name)
+                    )
+
+                # With no probe, the service is only known to be running (not ready)
+                if (
+                    status == ServiceStatus.RUNNING
+                    and probe is not None
+                    and self.wait_until_ready(probe=probe)
+                ):
+                    timing.mark(READY)
+        finally:
+            TIMINGS.record(timing)
+
+        return execution
+
     @abstractmethod
     def status(self) -> ServiceStatus:
         """
@@ -34,15 +182,15 @@ class Service(ABC):
         return NotImplemented
 
     @abstractmethod
-    def start(self) -> ExecutionBase:
+    def start(self, wait: bool = False) -> ExecutionBase:
         return NotImplemented
 
     @abstractmethod
-    def stop(self) -> ExecutionBase:
+    def stop(self, wait: bool = False) -> ExecutionBase:
         return NotImplemented
 
     @abstractmethod
-    def restart(self) -> ExecutionBase:
+    def restart(self, wait: bool = False) -> ExecutionBase:
         return NotImplemented
 
     @abstractmethod
@@ -1,7 +1,6 @@
 import logging
 import posixpath
 import re
-import time
 from enum import Enum
 from typing import Union, Optional
 
@@ -10,9 +9,9 @@ from typing.re import Pattern
 from iqa.system.command.command_ansible import CommandBaseAnsible
 from iqa.system.command.command_base import CommandBase
 from iqa.system.executor import ExecutorBase, ExecutionBase, ExecutorAnsible
+from iqa.system.service.probe import Probe, TcpProbe
 from iqa.system.service.service import ServiceStatus
 from iqa.system.service.service_fake import ServiceFake
-from iqa.utils.tcp_util import is_tcp_port_available
 
 
 class ServiceFakeArtemis(ServiceFake):
@@ -20,8 +19,7 @@ class ServiceFakeArtemis(ServiceFake):
     Implementation of a Artemis pseudo-service to manage a Server component.
     """
 
-    MAX_ATTEMPTS: int = 10
-    DELAY: int = 3
+    implementation: str = 'artemis'
 
     _logger: logging.Logger = logging.getLogger(__name__)
 
@@ -34,6 +32,10 @@ class ServiceFakeArtemis(ServiceFake):
         self.service_web_port: str = kwargs.get('broker_web_port', '8161')
         self.service_path: str = posixpath.join(kwargs.get('broker_path'), 'bin', 'artemis-service')  # type: ignore
         self.service_username: str = kwargs.get('broker_service_user', 'jamq')
+        self.pid_file: str = posixpath.join(kwargs.get('broker_path'), 'data', 'artemis.pid')  # type: ignore
+
+        # Broker is considered ready once its web port is available
+        self.probe: Optional[Probe] = TcpProbe(self.ansible_host, int(self.service_web_port))
 
     class ServiceSystemState(Enum):
         STARTED = ('start', 'started')
@@ -64,7 +66,7 @@ class ServiceFakeArtemis(ServiceFake):
             stdout=True,
             timeout=self.TIMEOUT,
         )
-        execution: ExecutionBase = self.executor.execute(cmd_status)
+        execution: ExecutionBase = self.executor.execute_sync(cmd_status)
 
         service_output: Optional[Union[str, list]] = execution.read_stdout()
 
@@ -88,16 +90,39 @@ class ServiceFakeArtemis(ServiceFake):
         ServiceFakeArtemis._logger.debug('Service: %s - Status: UNKNOWN' % self.name)
         return ServiceStatus.UNKNOWN
 
-    def start(self, wait_for_messaging=False) -> ExecutionBase:
-        execution: ExecutionBase = self.executor.execute(
-            self._create_command(self.ServiceSystemState.STARTED)
+    @property
+    def main_pid(self) -> Optional[int]:
+        """
+        PID of the broker, read from its pid file (if the process exists).
+        """
+        execution: ExecutionBase = self.executor.execute_sync(
+            CommandBase(
+                ['sh', '-c', 'pid=$(cat %s) && kill -0 "$pid" && echo "$pid"' % self.pid_file],
+                stdout=True,
+                timeout=self.TIMEOUT,
+            )
+        )
+        output: str = (execution.read_stdout() or '').strip()
+        return int(output) if output.isdigit() else None
+
+    def start(self, wait: bool = False, wait_for_messaging: bool = False) -> ExecutionBase:
+        return self._execute_and_wait(
+            lambda: self.executor.execute_sync(
+                self._create_command(self.ServiceSystemState.STARTED)
+            ),
+            wait,
+            self._readiness_probe(wait_for_messaging),
+            name='start',
         )
-        self._wait_for_messaging(wait_for_messaging)
-        return execution
 
-    def stop(self) -> ExecutionBase:
-        return self.executor.execute(
-            self._create_command(self.ServiceSystemState.STOPPED)
+    def stop(self, wait: bool = False) -> ExecutionBase:
+        return self._execute_and_wait(
+            lambda: self.executor.execute_sync(
+                self._create_command(self.ServiceSystemState.STOPPED)
+            ),
+            wait,
+            name='stop',
+            status=ServiceStatus.STOPPED,
         )
 
     def enable(self) -> ExecutionBase:
@@ -106,40 +131,25 @@ class ServiceFakeArtemis(ServiceFake):
     def disable(self) -> ExecutionBase:
         return NotImplemented
 
-    def restart(self, wait_for_messaging=False) -> ExecutionBase:
-        execution: ExecutionBase = self.executor.execute(
-            self._create_command(self.ServiceSystemState.RESTARTED)
+    def restart(self, wait: bool = False, wait_for_messaging: bool = False) -> ExecutionBase:
+        return self._execute_and_wait(
+            lambda: self.executor.execute_sync(
+                self._create_command(self.ServiceSystemState.RESTARTED)
+            ),
+            wait,
+            self._readiness_probe(wait_for_messaging),
+            name='restart',
         )
-        self._wait_for_messaging(wait_for_messaging)
-        return execution
-
-    def _wait_for_messaging(self, messaging_wait=False):
-        # Wait until broker web port is available
-        self.__tcp_wait_for_accessible_port(self.service_web_port, self.ansible_host)
 
-        # Or also messaging subsystem goes up
-        if messaging_wait:
-            self.__tcp_wait_for_accessible_port(
-                self.service_default_port, self.ansible_host
-            )
-
-    @staticmethod
-    def __tcp_wait_for_accessible_port(port, host):
-        for attempt in range(ServiceFakeArtemis.MAX_ATTEMPTS):
-            if attempt == ServiceFakeArtemis.MAX_ATTEMPTS - 1:
-                print(
-                    '     broker is not reachable after %d attempts'
-                    % ServiceFakeArtemis.MAX_ATTEMPTS
-                )
-
-            if is_tcp_port_available(int(port), host):
-                return True
-
-            time.sleep(ServiceFakeArtemis.DELAY)
-        ServiceFakeArtemis._logger.warning(
-            'Unable to connect to hostname:port: %s:%s' % (host, port)
-        )
-        return False
+    def _readiness_probe(self, wait_for_messaging: bool = False) -> Optional[Probe]:
+        """
+        Probe for the broker web port, plus the messaging port if requested.
+        :param wait_for_messaging:
+        :return:
+        """
+        if wait_for_messaging and self.probe is not None:
+            return self.probe & TcpProbe(self.ansible_host, int(self.service_default_port))
+        return self.probe
 
     def _create_command(self, service_state: ServiceSystemState):
         """
@@ -1,8 +1,9 @@
+import asyncio
 import logging
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional
 
-from docker.errors import APIError, NotFound
+from docker.errors import APIError, DockerException, NotFound
 
 from iqa.system.command.command_ansible import CommandBaseAnsible
 from iqa.system.command.command_base import CommandBase
@@ -11,7 +12,17 @@ from iqa.system.executor.ansible.executor_ansible import ExecutorAnsible
 from iqa.system.executor.docker.executor_docker import ExecutorDocker
 from iqa.system.executor import ExecutionBase
 from iqa.system.service.service import Service, ServiceStatus
+from iqa.system.service.timing import (
+    CONFIRMED,
+    EXITED,
+    ISSUED,
+    READY,
+    TIMINGS,
+    TransitionTiming,
+)
+from iqa.utils.docker_events import DockerEventMonitor
 from iqa.utils.docker_util import get_container
+from iqa.utils.runtime import maybe_await
 
 
 class ServiceDocker(Service):
@@ -21,6 +32,8 @@ class ServiceDocker(Service):
     docker container name.
     """
 
+    implementation: str = 'docker'
+
     _logger: logging.Logger = logging.getLogger(__name__)
 
     def __init__(self, name: str, executor: ExecutorDocker) -> None:
@@ -36,46 +49,163 @@ class ServiceDocker(Service):
             self.system_state = system_state
             self.ansible_state = ansible_state
 
+    # Service status of each container state (other states are UNKNOWN)
+    CONTAINER_STATUS: Dict[Optional[str], ServiceStatus] = {
+        'running': ServiceStatus.RUNNING,
+        'exited': ServiceStatus.STOPPED,
+        None: ServiceStatus.FAILED,
+    }
+
     def status(self) -> ServiceStatus:
         """
         Returns the status based on status of container name.
+        The container state is read from the events monitor of the docker host,
+        falling back to inspecting the container if the monitor is not available.
         :return: The status of this specific service
         :rtype: ServiceStatus
         """
+        monitor: Optional[DockerEventMonitor] = self._get_monitor()
+        if monitor is not None:
+            state: Optional[str] = monitor.get_state(self.name)
+        else:
+            try:
+                state = get_container(
+                    name=self.name, docker_host=self.docker_host or ''
+                ).status
+            except NotFound:
+                state = None
+            except APIError:
+                ServiceDocker._logger.exception(
+                    'Error retrieving status of docker container'
+                )
+                return ServiceStatus.FAILED
+
+        status: ServiceStatus = self.CONTAINER_STATUS.get(state, ServiceStatus.UNKNOWN)
+        ServiceDocker._logger.debug(
+            'Service: %s - Status: %s' % (self.name, status.name)
+        )
+        return status
+
+    def wait_for_status(
+        self, status: ServiceStatus, timeout: Optional[float] = None
+    ) -> bool:
+        """
+        Waits until the container reaches the given status, which is
+        detected as soon as the related docker event is received.
+        :param status: expected status
+        :param timeout: max seconds to wait (defaults to TIMEOUT)
+        :return: True if the status has been reached
+        """
+        monitor: Optional[DockerEventMonitor] = self._get_monitor()
+        if monitor is None:
+            return super(ServiceDocker, self).wait_for_status(status, timeout)
+
+        timeout = timeout if timeout is not None else self.TIMEOUT
+        if monitor.wait_for(
+            self.name,
+            lambda state: self.CONTAINER_STATUS.get(state, ServiceStatus.UNKNOWN)
+            == status,
+            timeout,
+        ):
+            return True
+
+        # Monitor may have stopped while waiting
+        return not monitor.running and self.status() == status
+
+    @property
+    def main_pid(self) -> Optional[int]:
+        """
+        PID of the container main process (on the docker host).
+        """
+        if self.status() != ServiceStatus.RUNNING:
+            return None
+        try:
+            container = get_container(name=self.name, docker_host=self.docker_host or '')
+        except APIError:
+            return None
+        return container.attrs['State'].get('Pid') or None
+
+    async def wait_for_exit(self, pid: int) -> None:
+        """
+        Waits for the container to stop running (notified by its events).
+        :param pid:
+        :return:
+        """
+        monitor: Optional[DockerEventMonitor] = self._get_monitor()
+        if monitor is None:
+            await super(ServiceDocker, self).wait_for_exit(pid)
+            return
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        while monitor.running and not await loop.run_in_executor(
+            None, monitor.wait_for, self.name, lambda state: state != 'running', 1.0
+        ):
+            pass
+
+    def _get_monitor(self) -> Optional[DockerEventMonitor]:
+        """
+        Returns the events monitor of the docker host related with the service.
+        :return: the monitor or None if it could not be started
+        """
         try:
-            container = get_container(name=self.name)
-            if not container:
-                ServiceDocker._logger.debug('Service: %s - Status: UNKNOWN' % self.name)
-                return ServiceStatus.UNKNOWN
-
-            if container.status == 'running':
-                ServiceDocker._logger.debug('Service: %s - Status: RUNNING' % self.name)
-                return ServiceStatus.RUNNING
-            elif container.status == 'exited':
-                ServiceDocker._logger.debug('Service: %s - Status: STOPPED' % self.name)
-                return ServiceStatus.STOPPED
-        except APIError or NotFound:
-            ServiceDocker._logger.exception(
-                'Error retrieving status of docker container'
+            return DockerEventMonitor.for_host(self.docker_host or '')
+        except DockerException as ex:
+            ServiceDocker._logger.debug(
+                'Docker events not available for %s: %s' % (self.name, ex)
             )
-            return ServiceStatus.FAILED
+            return None
 
-        return ServiceStatus.UNKNOWN
+    async def start(self, wait: bool = False) -> ExecutionBase:
+        return await self._execute_state(self.ServiceDockerState.STARTED, wait)
 
-    async def start(self) -> ExecutionBase:
-        return await self.executor.execute(
-            self._create_command(self.ServiceDockerState.STARTED)
-        )
+    async def stop(self, wait: bool = False) -> ExecutionBase:
+        return await self._execute_state(self.ServiceDockerState.STOPPED, wait)
 
-    async def stop(self) -> ExecutionBase:
-        return await self.executor.execute(
-            self._create_command(self.ServiceDockerState.STOPPED)
-        )
+    async def restart(self, wait: bool = False) -> ExecutionBase:
+        return await self._execute_state(self.ServiceDockerState.RESTARTED, wait)
 
-    async def restart(self) -> ExecutionBase:
-        return await self.executor.execute(
-            self._create_command(self.ServiceDockerState.RESTARTED)
+    async def _execute_state(
+        self, service_state: ServiceDockerState, wait: bool
+    ) -> ExecutionBase:
+        """
+        Changes the container state and, if requested, waits till the container
+        reaches the expected status and the service is ready. The transition
+        is timed and recorded to TIMINGS.
+        :param service_state:
+        :param wait:
+        :return:
+        """
+        running: bool = service_state != self.ServiceDockerState.STOPPED
+        if wait and running and self.probe is not None:
+            await self.probe.prepare()
+
+        timing: TransitionTiming = TransitionTiming.for_service(
+            self, service_state.system_state
         )
+        try:
+            timing.mark(ISSUED)
+            execution: ExecutionBase = await self.executor.execute(
+                self._create_command(service_state)
+            )
+            await maybe_await(execution.wait())
+            timing.mark(EXITED)
+
+            if wait:
+                status: ServiceStatus = (
+                    ServiceStatus.RUNNING if running else ServiceStatus.STOPPED
+                )
+                # Waits for the container event in a worker thread
+                if await asyncio.get_running_loop().run_in_executor(
+                    None, self.wait_for_status, status
+                ):
+                    timing.mark(CONFIRMED)
+
+                if running and self.probe is not None and await self.wait_ready():
+                    timing.mark(READY)
+        finally:
+            TIMINGS.record(timing)
+
+        return execution
 
     def enable(self) -> Optional[ExecutionBase]:
         """
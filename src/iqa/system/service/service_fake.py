@@ -28,15 +28,15 @@ class ServiceFake(Service):
         return NotImplemented
 
     @abc.abstractmethod
-    def start(self, wait_for_messaging: bool = False) -> ExecutionBase:
+    def start(self, wait: bool = False, wait_for_messaging: bool = False) -> ExecutionBase:
         return NotImplemented
 
     @abc.abstractmethod
-    def stop(self) -> ExecutionBase:
+    def stop(self, wait: bool = False) -> ExecutionBase:
         return NotImplemented
 
     @abc.abstractmethod
-    def restart(self, wait_for_messaging: bool = False) -> ExecutionBase:
+    def restart(self, wait: bool = False, wait_for_messaging: bool = False) -> ExecutionBase:
         return NotImplemented
 
     @abc.abstractmethod
@@ -0,0 +1,193 @@
+"""
+Operations over multiple services at once (i.e. all brokers of a cluster).
+"""
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from iqa.system.executor import ExecutionBase
+from iqa.system.service.service import Service
+from iqa.utils.exceptions import IQAServiceNotReadyException
+from iqa.utils.runtime import resolve, run_sync
+
+
+class PhaseTiming(object):
+    """
+    Wall-clock timing of a group operation and of each service involved.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+        self.started_at: float = time.time()
+        self.duration: Optional[float] = None
+        self.services: Dict[str, float] = {}
+        self.ready: Dict[str, bool] = {}
+        self._started: float = time.monotonic()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started
+
+    def finish(self) -> None:
+        self.duration = self.elapsed()
+
+    def __repr__(self) -> str:
+        return 'PhaseTiming(%s: %.3fs)' % (self.name, self.duration or self.elapsed())
+
+
+class ServiceGroup(object):
+    """
+    Starts, stops and restarts a group of services in parallel (or in
+    batches, for rolling restarts), so a cluster operation takes as long
+    as its slowest service instead of the sum of all of them.
+
+    Operations that wait for the services to be ready use their readiness
+    probes and raise IQAServiceNotReadyException if any service is not ready
+    before the deadline. Timings of every operation are kept in timings.
+    """
+
+    _logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(
+        self, services: Iterable[Service], max_workers: Optional[int] = None
+    ) -> None:
+        self.services: List[Service] = list(services)
+        self.max_workers: Optional[int] = max_workers
+        self.timings: List[PhaseTiming] = []
+
+    def start(
+        self, wait: bool = False, timeout: Optional[float] = None, stagger: float = 0.0
+    ) -> List[ExecutionBase]:
+        """
+        Starts all services in parallel.
+        :param wait: wait till all services are ready
+        :param timeout: max seconds to wait for each service to be ready
+        :param stagger: delay in seconds between starting consecutive services
+        :return:
+        """
+        return self._run_phase('start', 'start', self.services, wait, timeout, stagger)
+
+    def stop(self, stagger: float = 0.0) -> List[ExecutionBase]:
+        """
+        Stops all services in parallel.
+        :param stagger: delay in seconds between stopping consecutive services
+        :return:
+        """
+        return self._run_phase('stop', 'stop', self.services, False, None, stagger)
+
+    def restart(
+        self, wait: bool = False, timeout: Optional[float] = None, stagger: float = 0.0
+    ) -> List[ExecutionBase]:
+        """
+        Restarts all services in parallel.
+        :param wait: wait till all services are ready
+        :param timeout: max seconds to wait for each service to be ready
+        :param stagger: delay in seconds between restarting consecutive services
+        :return:
+        """
+        return self._run_phase(
+            'restart', 'restart', self.services, wait, timeout, stagger
+        )
+
+    def rolling_restart(
+        self,
+        batch_size: int = 1,
+        wait: bool = True,
+        timeout: Optional[float] = None,
+        stagger: float = 0.0,
+    ) -> List[ExecutionBase]:
+        """
+        Restarts services in batches of batch_size (in parallel within each batch).
+        When wait is True, next batch is only restarted once all services
+        of the current one are ready, otherwise the rollout is interrupted.
+        :param batch_size:
+        :param wait:
+        :param timeout: max seconds to wait for each service to be ready
+        :param stagger: delay in seconds between restarting consecutive services
+        :return:
+        """
+        if batch_size < 1:
+            raise ValueError('Invalid batch size: %d' % batch_size)
+
+        executions: List[ExecutionBase] = []
+        for index in range(0, len(self.services), batch_size):
+            executions += self._run_phase(
+                'rolling_restart[%d]' % (index // batch_size),
+                'restart',
+                self.services[index:index + batch_size],
+                wait,
+                timeout,
+                stagger,
+            )
+        return executions
+
+    @property
+    def last_timing(self) -> Optional[PhaseTiming]:
+        return self.timings[-1] if self.timings else None
+
+    def _run_phase(
+        self,
+        name: str,
+        operation: str,
+        services: List[Service],
+        wait: bool,
+        timeout: Optional[float],
+        stagger: float,
+    ) -> List[ExecutionBase]:
+        timing: PhaseTiming = PhaseTiming(name)
+        self.timings.append(timing)
+
+        results: List[Tuple[ExecutionBase, bool]] = []
+        if services:
+            futures: List[Future] = []
+            with ThreadPoolExecutor(
+                max_workers=self.max_workers or len(services)
+            ) as pool:
+                for index, service in enumerate(services):
+                    # Operations are spaced from here rather than delayed in
+                    # the workers, which may first wait for a free slot
+                    if index and stagger:
+                        time.sleep(stagger)
+                    futures.append(
+                        pool.submit(
+                            self._operate, service, operation, wait, timeout, timing
+                        )
+                    )
+            results = [future.result() for future in futures]
+
+        timing.finish()
+        ServiceGroup._logger.debug('%s - %s' % (timing, timing.services))
+
+        not_ready: List[str] = [
+            name for name, ready in timing.ready.items() if not ready
+        ]
+        if not_ready:
+            raise IQAServiceNotReadyException(not_ready)
+
+        return [execution for execution, _ready in results]
+
+    @staticmethod
+    def _operate(
+        service: Service,
+        operation: str,
+        wait: bool,
+        timeout: Optional[float],
+        timing: PhaseTiming,
+    ) -> Tuple[ExecutionBase, bool]:
+        """
+        Runs the operation on a single service (in a worker thread).
+        :return: the execution and whether the service is ready
+        """
+        started: float = time.monotonic()
+        if wait and service.probe is not None:
+            run_sync(service.probe.prepare())
+
+        # The group waits for readiness below, the service must not wait
+        # on its own as well (ServiceDocker operations are coroutines)
+        execution: ExecutionBase = resolve(getattr(service, operation)(wait=False))
+        ready: bool = service.wait_until_ready(timeout) if wait else True
+
+        name: str = str(service.name)
+        timing.services[name] = time.monotonic() - started
+        timing.ready[name] = ready
+        return execution, ready
@@ -17,6 +17,8 @@ class ServiceSystemInit(Service):
     Implementation of a systemd or initd service used to manage a Server component.
     """
 
+    implementation: str = 'system_init'
+
     _logger: logging.Logger = logging.getLogger(__name__)
 
     def __init__(self, name: str, executor: ExecutorBase):
@@ -51,7 +53,7 @@ class ServiceSystemInit(Service):
         cmd_status: CommandBase = CommandBase(
             ['service', self.name, 'status'], stdout=True, timeout=self.TIMEOUT
         )
-        execution: ExecutionBase = self.executor.execute(cmd_status)
+        execution: ExecutionBase = self.executor.execute_sync(cmd_status)
 
         service_output: Optional[Union[str, list]] = execution.read_stdout()
 
@@ -71,28 +73,41 @@ class ServiceSystemInit(Service):
         ServiceSystemInit._logger.debug('Service: %s - Status: UNKNOWN' % self.name)
         return ServiceStatus.UNKNOWN
 
-    def start(self) -> ExecutionBase:
-        return self.executor.execute(
-            self._create_command(self.ServiceSystemState.STARTED)
+    def start(self, wait: bool = False) -> ExecutionBase:
+        return self._execute_and_wait(
+            lambda: self.executor.execute_sync(
+                self._create_command(self.ServiceSystemState.STARTED)
+            ),
+            wait,
+            name='start',
         )
 
-    def stop(self) -> ExecutionBase:
-        return self.executor.execute(
-            self._create_command(self.ServiceSystemState.STOPPED)
+    def stop(self, wait: bool = False) -> ExecutionBase:
+        return self._execute_and_wait(
+            lambda: self.executor.execute_sync(
+                self._create_command(self.ServiceSystemState.STOPPED)
+            ),
+            wait,
+            name='stop',
+            status=ServiceStatus.STOPPED,
         )
 
-    def restart(self) -> ExecutionBase:
-        return self.executor.execute(
-            self._create_command(self.ServiceSystemState.RESTARTED)
+    def restart(self, wait: bool = False) -> ExecutionBase:
+        return self._execute_and_wait(
+            lambda: self.executor.execute_sync(
+                self._create_command(self.ServiceSystemState.RESTARTED)
+            ),
+            wait,
+            name='restart',
         )
 
     def enable(self) -> ExecutionBase:
-        return self.executor.execute(
+        return self.executor.execute_sync(
             self._create_command(self.ServiceSystemState.ENABLED)
         )
 
     def disable(self) -> ExecutionBase:
-        return self.executor.execute(
+        return self.executor.execute_sync(
             self._create_command(self.ServiceSystemState.DISABLED)
         )
 
@@ -1,14 +1,12 @@
 import logging
-import re
 from enum import Enum
-from typing import Union, Optional
-
-from typing.re import Pattern
+from typing import Dict, Optional
 
 from iqa.system.command.command_ansible import CommandBaseAnsible
 from iqa.system.command.command_base import CommandBase
 from iqa.system.executor import ExecutorBase, ExecutorAnsible, ExecutionBase
 from iqa.system.service.service import Service, ServiceStatus
+from iqa.system.service.systemd_status import SystemdStatusCache
 
 
 class ServiceSystemD(Service):
@@ -16,10 +14,17 @@ class ServiceSystemD(Service):
     Implementation of a systemd or initd service used to manage a Server component.
     """
 
+    implementation: str = 'systemd'
+
     _logger: logging.Logger = logging.getLogger(__name__)
 
     def __init__(self, name: str, executor: ExecutorBase):
         super().__init__(name, executor)
+        # Status of all systemd services of the same node is queried at once
+        self.status_cache: SystemdStatusCache = SystemdStatusCache.for_executor(
+            executor
+        )
+        self.status_cache.register(name)
 
     class ServiceSystemState(Enum):
         STARTED = ('start', 'started')
@@ -34,69 +39,101 @@ class ServiceSystemD(Service):
 
     def status(self) -> ServiceStatus:
         """
-        Returns the service status based on linux service.
+        Returns the service status based on the systemd unit properties
+        (retrieved along with the other units registered on the same node).
         :return: The status of this specific service
         :rtype: ServiceStatus
         """
-        # service output :
-        # is running
-        # is stopped
-
-        # systemctl output:
-        # (running)
-        # (dead)
-
-        # On RHEL7> service is automatically redirected to systemctl
-        cmd_status: CommandBase = CommandBase(
-            ['systemctl', '--no-pager', 'status', self.name],
-            stdout=True,
-            timeout=self.TIMEOUT,
-        )
-        execution: ExecutionBase = self.executor.execute(cmd_status)
+        properties: Dict[str, str] = self.status_cache.get(self.name)
 
-        service_output: Optional[Union[list, str]] = execution.read_stdout()
+        if not properties:
+            status: ServiceStatus = ServiceStatus.FAILED
+        else:
+            status = self._parse_status(
+                properties.get('ActiveState'), properties.get('SubState')
+            )
 
-        if not service_output:
-            ServiceSystemD._logger.debug('Service: %s - Status: FAILED' % self.name)
-            return ServiceStatus.FAILED
+        ServiceSystemD._logger.debug(
+            'Service: %s - Status: %s' % (self.name, status.name)
+        )
+        return status
 
-        running_pattern: Pattern = r'(is running|\(running\)|Running)'
-        stopped_pattern: Pattern = r'(is stopped|\(dead\)|Stopped)'
-        if re.search(running_pattern, service_output):
-            ServiceSystemD._logger.debug('Service: %s - Status: RUNNING' % self.name)
+    @staticmethod
+    def _parse_status(
+        active_state: Optional[str], sub_state: Optional[str]
+    ) -> ServiceStatus:
+        """
+        Maps the ActiveState and SubState of a systemd unit into a ServiceStatus.
+        :param active_state:
+        :param sub_state:
+        :return:
+        """
+        if active_state == 'active' and sub_state in ('running', 'exited'):
             return ServiceStatus.RUNNING
-        elif re.search(stopped_pattern, service_output):
-            ServiceSystemD._logger.debug('Service: %s - Status: STOPPED' % self.name)
+        elif active_state == 'inactive':
             return ServiceStatus.STOPPED
-
-        ServiceSystemD._logger.debug('Service: %s - Status: UNKNOWN' % self.name)
+        elif active_state == 'failed':
+            return ServiceStatus.FAILED
         return ServiceStatus.UNKNOWN
 
-    def start(self) -> ExecutionBase:
-        return self.executor.execute(
-            self._create_command(self.ServiceSystemState.STARTED)
+    @property
+    def main_pid(self) -> Optional[int]:
+        """
+        PID of the main process of the service (None if it is not running).
+        """
+        pid: str = self.status_cache.get(self.name).get('MainPID', '0')
+        return int(pid) if pid.isdigit() and int(pid) > 0 else None
+
+    @property
+    def started_at(self) -> Optional[str]:
+        """
+        Timestamp of the last start of the service, as reported by systemd.
+        """
+        return self.status_cache.get(self.name).get('ExecMainStartTimestamp') or None
+
+    def start(self, wait: bool = False) -> ExecutionBase:
+        return self._execute_and_wait(
+            lambda: self._execute_state(self.ServiceSystemState.STARTED),
+            wait,
+            name='start',
         )
 
-    def stop(self) -> ExecutionBase:
-        return self.executor.execute(
-            self._create_command(self.ServiceSystemState.STOPPED)
+    def stop(self, wait: bool = False) -> ExecutionBase:
+        return self._execute_and_wait(
+            lambda: self._execute_state(self.ServiceSystemState.STOPPED),
+            wait,
+            name='stop',
+            status=ServiceStatus.STOPPED,
         )
 
-    def restart(self) -> ExecutionBase:
-        return self.executor.execute(
-            self._create_command(self.ServiceSystemState.RESTARTED)
+    def restart(self, wait: bool = False) -> ExecutionBase:
+        return self._execute_and_wait(
+            lambda: self._execute_state(self.ServiceSystemState.RESTARTED),
+            wait,
+            name='restart',
         )
 
     def enable(self) -> ExecutionBase:
-        return self.executor.execute(
+        return self.executor.execute_sync(
             self._create_command(self.ServiceSystemState.ENABLED)
         )
 
     def disable(self) -> ExecutionBase:
-        return self.executor.execute(
+        return self.executor.execute_sync(
             self._create_command(self.ServiceSystemState.DISABLED)
         )
 
+    def _execute_state(self, service_state: ServiceSystemState) -> ExecutionBase:
+        """
+        Changes the state of the service, discarding its cached status.
+        :param service_state:
+        :return:
+        """
+        try:
+            return self.executor.execute_sync(self._create_command(service_state))
+        finally:
+            self.status_cache.invalidate(self.name)
+
     def _create_command(self, service_state: ServiceSystemState):
         """
         Creates a Command instance based on executor type and state
@@ -0,0 +1,178 @@
+"""
+Batched status of systemd units, queried through "systemctl show".
+
+All units registered for the same node are queried with a single command,
+and the parsed properties are cached for a short period, so polling the
+status of many services running on the same host issues one remote command.
+"""
+import logging
+import re
+import threading
+import time
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+from iqa.system.command.command_base import CommandBase
+
+if TYPE_CHECKING:
+    from iqa.utils.types import ExecutorType
+
+SHOW_PROPERTIES: Tuple[str, ...] = (
+    'ActiveState',
+    'SubState',
+    'MainPID',
+    'ExecMainStartTimestamp',
+)
+
+_PROPERTY_LINE = re.compile(r'^(\w+)=(.*)$')
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def parse_systemctl_show(output: str) -> List[Dict[str, str]]:
+    """
+    Parses the key=value output of "systemctl show" for multiple units,
+    returning the properties of each unit (blocks are separated by empty lines).
+    Lines that are not properties (i.e. added by ansible) are ignored.
+    :param output:
+    :return:
+    """
+    units: List[Dict[str, str]] = []
+    current: Dict[str, str] = {}
+    for line in output.splitlines():
+        line = line.strip()
+        if not line:
+            if current:
+                units.append(current)
+                current = {}
+            continue
+
+        match = _PROPERTY_LINE.match(line)
+        if match:
+            current[match.group(1)] = match.group(2)
+
+    if current:
+        units.append(current)
+    return units
+
+
+def _executor_key(executor: 'ExecutorType') -> Hashable:
+    """
+    Key identifying the node an executor runs commands on, so that all
+    services of a node share the same status cache.
+    """
+    for attribute in ('ansible_host', 'container_name', '_host'):
+        target = getattr(executor, attribute, None)
+        if target:
+            return executor.__class__, target
+    return executor.__class__, id(executor)
+
+
+class SystemdStatusCache(object):
+    """
+    Properties of the systemd units of a node, refreshed all at once.
+    """
+
+    TIMEOUT: int = 30
+
+    _caches: Dict[Hashable, 'SystemdStatusCache'] = {}
+    _caches_lock: threading.Lock = threading.Lock()
+
+    def __init__(self, executor: 'ExecutorType', ttl: float = 1.0) -> None:
+        """
+        :param executor: executor used to query the node
+        :param ttl: seconds during which cached properties are served
+        """
+        self.executor: 'ExecutorType' = executor
+        self.ttl: float = ttl
+        self.units: List[str] = []
+        self._properties: Dict[str, Dict[str, str]] = {}
+        self._updated: Dict[str, float] = {}
+        self._lock: threading.RLock = threading.RLock()
+
+    @classmethod
+    def for_executor(cls, executor: 'ExecutorType') -> 'SystemdStatusCache':
+        """
+        Returns the status cache shared by all services of the node
+        related with the given executor.
+        :param executor:
+        :return:
+        """
+        key: Hashable = _executor_key(executor)
+        with cls._caches_lock:
+            if key not in cls._caches:
+                cls._caches[key] = cls(executor)
+            return cls._caches[key]
+
+    def register(self, unit: str) -> None:
+        """
+        Adds a unit to be queried along with the others on every refresh.
+        :param unit:
+        :return:
+        """
+        with self._lock:
+            if unit not in self.units:
+                self.units.append(unit)
+
+    def invalidate(self, unit: Optional[str] = None) -> None:
+        """
+        Discards cached properties (of the given unit or all of them),
+        i.e. after the unit has been started or stopped.
+        :param unit:
+        :return:
+        """
+        with self._lock:
+            if unit is None:
+                self._updated.clear()
+            else:
+                self._updated.pop(unit, None)
+
+    def get(self, unit: str, max_age: Optional[float] = None) -> Dict[str, str]:
+        """
+        Returns the properties of the given unit, refreshing the properties
+        of all registered units if they are older than max_age (or ttl).
+        :param unit:
+        :param max_age:
+        :return: properties of the unit (empty if they could not be retrieved)
+        """
+        max_age = self.ttl if max_age is None else max_age
+        with self._lock:
+            self.register(unit)
+            updated: Optional[float] = self._updated.get(unit)
+            if updated is None or time.monotonic() - updated > max_age:
+                self.refresh()
+            return self._properties.get(unit, {})
+
+    def refresh(self, units: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, str]]:
+        """
+        Queries the properties of the given units (or all registered ones)
+        using a single "systemctl show" command.
+        :param units:
+        :return: properties by unit
+        """
+        with self._lock:
+            units = list(units) if units is not None else list(self.units)
+            if not units:
+                return {}
+
+            command: CommandBase = CommandBase(
+                ['systemctl', '--no-pager', 'show', '-p', ','.join(SHOW_PROPERTIES)]
+                + units,
+                stdout=True,
+                timeout=self.TIMEOUT,
+            )
+            execution = self.executor.execute_sync(command)
+            output: Optional[str] = execution.read_stdout()
+
+            properties: List[Dict[str, str]] = parse_systemctl_show(output or '')
+            if not execution.completed_successfully() or len(properties) != len(units):
+                logger.debug(
+                    'Unable to retrieve status of units %s: %s' % (units, output)
+                )
+                properties = [{} for _ in units]
+
+            now: float = time.monotonic()
+            for unit, unit_properties in zip(units, properties):
+                self._properties[unit] = unit_properties
+                self._updated[unit] = now
+
+            return dict(zip(units, properties))
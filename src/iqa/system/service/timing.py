@@ -0,0 +1,228 @@
+"""
+Timing of service state transitions (start, stop, restart).
+
+Every transition records when its command was issued, when the command
+process exited, when the expected service state was confirmed and when
+the service was confirmed to be ready (phases are only recorded when they
+are reached). Transitions are kept in a per-session store (TIMINGS), which
+summarizes them by component type and operation (percentiles of the time
+taken by each phase), and can be appended to a file to compare runs:
+
+    TIMINGS.summary()['broker']['restart']['ready']['p90']
+"""
+import json
+import logging
+import math
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from iqa.system.service.service import Service
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+ISSUED: str = 'issued'
+EXITED: str = 'exited'
+CONFIRMED: str = 'confirmed'
+READY: str = 'ready'
+
+PHASES: Sequence[str] = (ISSUED, EXITED, CONFIRMED, READY)
+
+DEFAULT_PERCENTILES: Sequence[int] = (50, 90, 99)
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """
+    Returns the given percentile (0-100) of the values, interpolating
+    linearly between the closest ranks.
+    :param values:
+    :param pct:
+    :return:
+    """
+    if not values:
+        raise ValueError('No values to compute the percentile of')
+
+    ordered: List[float] = sorted(values)
+    rank: float = (len(ordered) - 1) * pct / 100.0
+    lower: int = int(math.floor(rank))
+    upper: int = int(math.ceil(rank))
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+class TransitionTiming(object):
+    """
+    Timestamps of a single state transition of a service.
+    """
+
+    def __init__(
+        self,
+        service: str,
+        operation: str,
+        component_type: Optional[str] = None,
+        implementation: Optional[str] = None,
+    ) -> None:
+        self.service: str = service
+        self.operation: str = operation
+        self.component_type: str = component_type or 'unknown'
+        self.implementation: Optional[str] = implementation
+        self.started_at: float = time.time()
+        # Seconds elapsed since the transition began, by phase
+        self.phases: Dict[str, float] = {}
+        self._started: float = time.monotonic()
+
+    @classmethod
+    def for_service(cls, service: 'Service', operation: str) -> 'TransitionTiming':
+        return cls(
+            str(service.name),
+            operation,
+            service.component_type,
+            getattr(service, 'implementation', None),
+        )
+
+    def mark(self, phase: str) -> None:
+        """
+        Records the given phase has been reached now.
+        :param phase:
+        :return:
+        """
+        self.phases[phase] = time.monotonic() - self._started
+
+    def duration(self, phase: str) -> Optional[float]:
+        """
+        Seconds taken from the command being issued until the given phase.
+        :param phase:
+        :return: None if the phase has not been reached
+        """
+        if phase not in self.phases or ISSUED not in self.phases:
+            return None
+        return self.phases[phase] - self.phases[ISSUED]
+
+    def as_dict(self) -> dict:
+        return {
+            'service': self.service,
+            'operation': self.operation,
+            'component_type': self.component_type,
+            'implementation': self.implementation,
+            'started_at': self.started_at,
+            'phases': dict(self.phases),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'TransitionTiming':
+        timing: TransitionTiming = cls(
+            data['service'],
+            data['operation'],
+            data.get('component_type'),
+            data.get('implementation'),
+        )
+        timing.started_at = data.get('started_at', timing.started_at)
+        timing.phases = dict(data.get('phases', {}))
+        return timing
+
+    def __repr__(self) -> str:
+        return 'TransitionTiming(%s %s: %s)' % (
+            self.service,
+            self.operation,
+            ', '.join(
+                '%s=%.3fs' % (phase, self.duration(phase))
+                for phase in PHASES[1:]
+                if phase in self.phases
+            ),
+        )
+
+
+class TimingStore(object):
+    """
+    Transition timings recorded during a session.
+    """
+
+    def __init__(self) -> None:
+        self.timings: List[TransitionTiming] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    def record(self, timing: TransitionTiming) -> None:
+        logger.debug('%s' % timing)
+        with self._lock:
+            self.timings.append(timing)
+
+    def extend(self, timings: Iterable[TransitionTiming]) -> None:
+        with self._lock:
+            self.timings.extend(timings)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.timings = []
+
+    def summary(
+        self, percentiles: Sequence[int] = DEFAULT_PERCENTILES
+    ) -> Dict[str, Dict[str, Dict[str, Dict[str, float]]]]:
+        """
+        Summarizes the seconds taken until each phase, by component type
+        and operation, i.e.:
+        {'broker': {'restart': {'ready': {'count': 3, 'min': .., 'max': .., 'p50': ..}}}}
+        :param percentiles:
+        :return:
+        """
+        durations: Dict[str, Dict[str, Dict[str, List[float]]]] = {}
+        with self._lock:
+            timings: List[TransitionTiming] = list(self.timings)
+
+        for timing in timings:
+            operation: Dict[str, List[float]] = durations.setdefault(
+                timing.component_type, {}
+            ).setdefault(timing.operation, {})
+            for phase in PHASES[1:]:
+                duration: Optional[float] = timing.duration(phase)
+                if duration is not None:
+                    operation.setdefault(phase, []).append(duration)
+
+        summary: Dict[str, Dict[str, Dict[str, Dict[str, float]]]] = {}
+        for component_type, operations in durations.items():
+            for operation_name, phases in operations.items():
+                for phase, values in phases.items():
+                    stats: Dict[str, float] = {
+                        'count': len(values),
+                        'min': min(values),
+                        'max': max(values),
+                    }
+                    for pct in percentiles:
+                        stats['p%d' % pct] = percentile(values, pct)
+                    summary.setdefault(component_type, {}).setdefault(
+                        operation_name, {}
+                    )[phase] = stats
+        return summary
+
+    def save(self, path: str) -> None:
+        """
+        Appends the recorded timings to the given file (one JSON per line),
+        so timings of multiple runs (or workers) can be compared.
+        :param path:
+        :return:
+        """
+        with self._lock:
+            lines: List[str] = [json.dumps(timing.as_dict()) for timing in self.timings]
+
+        if lines:
+            with open(path, 'a') as timings_file:
+                timings_file.write('\n'.join(lines) + '\n')
+
+    @staticmethod
+    def load(path: str) -> 'TimingStore':
+        """
+        Loads timings saved to the given file.
+        :param path:
+        :return:
+        """
+        store: TimingStore = TimingStore()
+        with open(path) as timings_file:
+            store.extend(
+                TransitionTiming.from_dict(json.loads(line))
+                for line in timings_file
+                if line.strip()
+            )
+        return store
+
+
+# Timings recorded by all services of the current session
+TIMINGS: TimingStore = TimingStore()
@@ -0,0 +1,194 @@
+"""
+Container states kept up to date from the docker events stream.
+
+A single DockerEventMonitor is shared by all containers of a docker host.
+It lists all containers once and then applies container events (start, die,
+destroy, ...) to its state table from a background thread, so reading the
+state of a container does not require a request to the docker daemon and
+waiting for a state change wakes up as soon as the event is received.
+"""
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from iqa.utils.docker_util import get_client
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Container state after each (container) event action
+EVENT_STATES: Dict[str, Optional[str]] = {
+    'create': 'created',
+    'start': 'running',
+    'restart': 'running',
+    'unpause': 'running',
+    'pause': 'paused',
+    'die': 'exited',
+    'stop': 'exited',
+    'destroy': None,
+}
+
+
+class DockerEventMonitor(object):
+    """
+    State table of the containers of a docker host, updated from its events.
+    """
+
+    _monitors: Dict[str, 'DockerEventMonitor'] = {}
+    _monitors_lock: threading.Lock = threading.Lock()
+
+    def __init__(self, docker_host: str = '') -> None:
+        self.docker_host: str = docker_host
+        self.states: Dict[str, str] = {}
+        self._condition: threading.Condition = threading.Condition()
+        self._stream = None
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def for_host(cls, docker_host: str = '') -> 'DockerEventMonitor':
+        """
+        Returns the running monitor of the given docker host (started if needed).
+        Raises docker.errors.DockerException if the docker daemon is not available.
+        :param docker_host:
+        :return:
+        """
+        with cls._monitors_lock:
+            if docker_host not in cls._monitors:
+                cls._monitors[docker_host] = cls(docker_host)
+            monitor: DockerEventMonitor = cls._monitors[docker_host]
+
+        monitor.start()
+        return monitor
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """
+        Loads the current state of all containers and starts consuming events.
+        Does nothing if the monitor is already running.
+        :return:
+        """
+        with self._condition:
+            if self.running:
+                return
+
+            client = get_client(docker_host=self.docker_host)
+
+            # Subscribing before listing containers, so no event is missed in between
+            stream = client.events(decode=True, filters={'type': 'container'})
+            try:
+                self.states = {
+                    container.name: container.status
+                    for container in client.containers.list(all=True)
+                }
+            except Exception:
+                stream.close()
+                raise
+
+            self._stream = stream
+            self._thread = threading.Thread(
+                target=self._consume,
+                args=(stream,),
+                name='iqa-docker-events',
+                daemon=True,
+            )
+            self._thread.start()
+            self._condition.notify_all()
+
+    def stop(self) -> None:
+        """
+        Stops consuming events.
+        :return:
+        """
+        with self._condition:
+            stream, thread = self._stream, self._thread
+            self._stream = None
+
+        if stream is not None:
+            stream.close()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _consume(self, stream) -> None:
+        try:
+            for event in stream:
+                self.handle_event(event)
+        except Exception as ex:
+            if self._stream is stream:
+                logger.debug(
+                    'Docker events stream (%s) interrupted: %s'
+                    % (self.docker_host or 'default', ex)
+                )
+        finally:
+            with self._condition:
+                # Waiters must not rely on the state table anymore
+                self._condition.notify_all()
+
+    def handle_event(self, event: dict) -> None:
+        """
+        Applies a container event to the state table.
+        :param event:
+        :return:
+        """
+        action: str = event.get('Action') or event.get('status') or ''
+        if action not in EVENT_STATES and action != 'rename':
+            return
+
+        attributes: dict = event.get('Actor', {}).get('Attributes', {})
+        name: Optional[str] = attributes.get('name')
+        if not name:
+            return
+
+        with self._condition:
+            if action == 'rename':
+                old_name: str = attributes.get('oldName', '').lstrip('/')
+                state: Optional[str] = self.states.pop(old_name, None)
+            else:
+                state = EVENT_STATES[action]
+
+            if state is None:
+                self.states.pop(name, None)
+            else:
+                self.states[name] = state
+            self._condition.notify_all()
+
+    def get_state(self, name: str) -> Optional[str]:
+        """
+        Returns the state of the given container (None if it does not exist).
+        :param name:
+        :return:
+        """
+        with self._condition:
+            return self.states.get(name)
+
+    def wait_for(
+        self,
+        name: str,
+        predicate: Callable[[Optional[str]], bool],
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Waits until the state of the given container satisfies the predicate.
+        Returns as soon as the event is received, or when the monitor stops.
+        :param name:
+        :param predicate: receives the container state (None if it does not exist)
+        :param timeout: max seconds to wait (None waits forever)
+        :return: True if the predicate is satisfied
+        """
+        deadline: Optional[float] = (
+            time.monotonic() + timeout if timeout is not None else None
+        )
+        with self._condition:
+            while not predicate(self.states.get(name)):
+                if not self.running:
+                    return False
+
+                remaining: Optional[float] = (
+                    deadline - time.monotonic() if deadline is not None else None
+                )
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return True
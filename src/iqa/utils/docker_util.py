@@ -4,6 +4,8 @@ Utility classes to retrieve information from local docker environment.
 """
 import logging
 import os
+import threading
+from typing import Dict
 
 import docker
 from docker.errors import APIError, NotFound
@@ -13,15 +15,29 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 _env: dict = os.environ.copy()
 
+# Clients are reused for all requests to the same docker host
+_clients: Dict[str, docker.DockerClient] = {}
+_clients_lock: threading.Lock = threading.Lock()
+
 
 CONTAINER_STATUS_RUNNING: str = 'running'
 CONTAINER_STATUS_EXITED: str = 'exited'
 
 
-def get_client(docker_host: str = ''):
-    if docker_host:
-        _env['DOCKER_HOST'] = docker_host
-    return docker.from_env(environment=_env)
+def get_client(docker_host: str = '') -> docker.DockerClient:
+    """
+    Returns the (cached) docker client for the given docker host,
+    or for the one defined by the environment if no host is given.
+    :param docker_host:
+    :return:
+    """
+    with _clients_lock:
+        if docker_host not in _clients:
+            env: dict = dict(_env)
+            if docker_host:
+                env['DOCKER_HOST'] = docker_host
+            _clients[docker_host] = docker.from_env(environment=env)
+        return _clients[docker_host]
 
 
 def get_container(name: str, docker_host: str = '') -> Container:
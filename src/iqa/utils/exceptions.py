@@ -27,3 +27,12 @@ class IQAHostDisconnectException(IQAException):
         self.reason = reason
         self.msg = "Host {} Disconnect Error: {}".format(ip_address, reason)
         super().__init__(self.msg)
+
+
+class IQAServiceNotReadyException(IQAException):
+    """Services not ready before the deadline"""
+
+    def __init__(self, services):
+        self.services = services
+        self.msg = "Services not ready: {}".format(", ".join(services))
+        super().__init__(self.msg)
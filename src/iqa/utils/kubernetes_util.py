@@ -0,0 +1,101 @@
+"""
+Utility functions to follow the state of pods through the Kubernetes API.
+"""
+import logging
+import time
+from typing import Any, Dict, Optional
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def is_pod_ready(pod: Any) -> bool:
+    """
+    Returns True if the given pod (V1Pod) is ready and not being terminated.
+    :param pod:
+    :return:
+    """
+    if pod.metadata.deletion_timestamp is not None:
+        return False
+
+    conditions: list = (pod.status and pod.status.conditions) or []
+    return any(
+        condition.type == 'Ready' and condition.status == 'True'
+        for condition in conditions
+    )
+
+
+def wait_for_ready_pods(
+    api: Any,
+    namespace: str,
+    label_selector: str,
+    replicas: int,
+    timeout: float = 300,
+) -> Optional[float]:
+    """
+    Waits until exactly the given number of pods matching the label selector
+    exist and are ready (pods being terminated are still counted, so scaling
+    down is only done once they are gone). Pod changes are followed through
+    the watch API, so it returns as soon as the target state is reached.
+    :param api: CoreV1Api instance
+    :param namespace:
+    :param label_selector: i.e. deploymentconfig=amq-interconnect
+    :param replicas:
+    :param timeout: max seconds to wait
+    :return: seconds taken till pods were ready, or None if timed out
+    """
+    from kubernetes import watch
+    from kubernetes.client.rest import ApiException
+
+    started: float = time.monotonic()
+    deadline: float = started + timeout
+
+    def done(pods: Dict[str, bool]) -> bool:
+        return len(pods) == replicas and all(pods.values())
+
+    while time.monotonic() < deadline:
+        # Current state (also after the watch expires or its version is too old)
+        pod_list = api.list_namespaced_pod(namespace, label_selector=label_selector)
+        pods: Dict[str, bool] = {
+            pod.metadata.name: is_pod_ready(pod) for pod in pod_list.items
+        }
+        if done(pods):
+            break
+
+        watcher = watch.Watch()
+        try:
+            for event in watcher.stream(
+                api.list_namespaced_pod,
+                namespace,
+                label_selector=label_selector,
+                resource_version=pod_list.metadata.resource_version,
+                timeout_seconds=max(1, int(deadline - time.monotonic())),
+            ):
+                pod = event['object']
+                if event['type'] == 'DELETED':
+                    pods.pop(pod.metadata.name, None)
+                else:
+                    pods[pod.metadata.name] = is_pod_ready(pod)
+
+                if done(pods):
+                    break
+        except ApiException as ex:
+            # 410 (Gone): resource version is too old, so pods are listed again
+            if ex.status != 410:
+                raise
+        finally:
+            watcher.stop()
+
+        if done(pods):
+            break
+    else:
+        logger.debug(
+            'Pods [%s] not ready after %ss (expected: %d)'
+            % (label_selector, timeout, replicas)
+        )
+        return None
+
+    elapsed: float = time.monotonic() - started
+    logger.debug(
+        'Pods [%s] ready (replicas: %d) in %.3fs' % (label_selector, replicas, elapsed)
+    )
+    return elapsed
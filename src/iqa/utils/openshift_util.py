@@ -21,11 +21,17 @@
 Utility class to help executing OpenShift standard operations
 """
 import logging
-from typing import Any, Callable
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from iqa.system.executor import ExecutorBase
 from iqa.system.executor import ExecutionBase
 from iqa.system.command.command_base import CommandBase
+from iqa.system.executor.kubernetes.executor_kubernetes import ExecutorKubernetes
+from iqa.utils.exceptions import IQAConfigurationException
+from iqa.utils.kubernetes_util import wait_for_ready_pods
+from iqa.utils.runtime import resolve
 
 
 class OpenShiftUtil:
@@ -35,11 +41,70 @@ class OpenShiftUtil:
 
     TIMEOUT: int = 30
 
-    def __init__(self, executor: ExecutorBase, url: str, token: str) -> None:
+    # Seconds a successful login is trusted before validating it (oc whoami)
+    LOGIN_TTL: float = 300.0
+
+    # Kubeconfig used by oc when none is given
+    DEFAULT_KUBECONFIG: str = '~/.kube/config'
+
+    # Current session (url, token) and the time it was validated, by machine
+    # and kubeconfig (oc keeps a single current session in each kubeconfig)
+    _sessions: Dict[Tuple[str, str], Tuple[str, str, float]] = {}
+    _sessions_lock: threading.Lock = threading.Lock()
+
+    def __init__(
+        self,
+        executor: ExecutorBase,
+        url: str,
+        token: str,
+        kubeconfig: Optional[str] = None,
+    ) -> None:
+        """
+        :param executor:
+        :param url:
+        :param token:
+        :param kubeconfig: kubeconfig file used by oc (on the executor machine)
+        """
         self._logger: logging.Logger = logging.getLogger(self.__class__.__module__)
         self.executor: ExecutorBase = executor
         self.url: str = url
         self.token: str = token
+        self.kubeconfig: Optional[str] = kubeconfig
+        self._api: Optional[Any] = None
+
+    @property
+    def session_key(self) -> Tuple[str, str]:
+        """
+        Machine the executor runs oc on and the kubeconfig it uses, which
+        identify the oc session shared by all OpenShiftUtil instances.
+        """
+        return (
+            self._executor_host(self.executor),
+            self.kubeconfig or self.DEFAULT_KUBECONFIG,
+        )
+
+    @staticmethod
+    def _executor_host(executor: ExecutorBase) -> str:
+        host: str = next(
+            (
+                str(getattr(executor, attribute))
+                for attribute in ('ansible_host', 'hostname', 'host', 'docker_host')
+                if getattr(executor, attribute, None)
+            ),
+            'localhost',
+        )
+        container: Optional[str] = getattr(executor, 'container_name', None)
+        return '%s/%s' % (host, container) if container else host
+
+    def _oc(self, *args: str) -> list:
+        """
+        Returns the arguments of an oc command, using the kubeconfig (if any).
+        :param args:
+        :return:
+        """
+        if self.kubeconfig:
+            return ['oc', '--kubeconfig', self.kubeconfig] + list(args)
+        return ['oc'] + list(args)
 
     @staticmethod
     def login_first(func):
@@ -50,7 +115,10 @@ class OpenShiftUtil:
 
         def wrap(*args, **kwargs) -> Callable[..., Any]:
             instance = args[0]
-            assert instance.login().completed_successfully()
+            if not instance.ensure_login():
+                raise IQAConfigurationException(
+                    'Unable to log in to OpenShift at %s' % instance.url
+                )
             return func(*args, **kwargs)
 
         return wrap
@@ -63,46 +131,196 @@ class OpenShiftUtil:
         :return: The execution result.
         """
         cmd_login = CommandBase(
-            args=[
-                'oc',
+            args=self._oc(
                 'login',
                 self.url,
                 '--token',
                 '%s' % self.token,
                 '--insecure-skip-tls-verify=true',
-            ],
+            ),
             timeout=timeout,
             stderr=True,
             stdout=True,
         )
-        execution: ExecutionBase = self.executor.execute(cmd_login)
-        execution.wait()
-        if not execution.completed_successfully():
+        execution: ExecutionBase = self.executor.execute_sync(cmd_login)
+        resolve(execution.wait())
+        if execution.completed_successfully():
+            self._set_session(time.monotonic())
+        else:
+            self._set_session(None)
             self._logger.debug(
                 'Login has failed against %s: %s' % (self.url, execution.read_stdout())
             )
         return execution
 
+    def ensure_login(self, timeout=TIMEOUT) -> bool:
+        """
+        Logs in, unless the current oc session (machine of the executor and
+        kubeconfig) is already logged in
+        to the same url with the same token. Sessions older than LOGIN_TTL
+        are validated through "oc whoami" before being reused.
+        :param timeout:
+        :return: True if logged in
+        """
+        with OpenShiftUtil._sessions_lock:
+            session: Optional[Tuple[str, str, float]] = OpenShiftUtil._sessions.get(
+                self.session_key
+            )
+
+        if session is not None and session[:2] == (self.url, self.token):
+            if time.monotonic() - session[2] < self.LOGIN_TTL:
+                return True
+            if self.whoami(timeout):
+                self._set_session(time.monotonic())
+                return True
+
+        return self.login(timeout).completed_successfully()
+
+    def whoami(self, timeout=TIMEOUT) -> bool:
+        """
+        Returns True if the current session is still valid.
+        :param timeout:
+        :return:
+        """
+        cmd_whoami = CommandBase(
+            args=self._oc('whoami'), timeout=timeout, stderr=True, stdout=True
+        )
+        execution: ExecutionBase = self.executor.execute_sync(cmd_whoami)
+        resolve(execution.wait())
+        return execution.completed_successfully()
+
+    def _set_session(self, validated: Optional[float]) -> None:
+        with OpenShiftUtil._sessions_lock:
+            if validated is None:
+                OpenShiftUtil._sessions.pop(self.session_key, None)
+            else:
+                OpenShiftUtil._sessions[self.session_key] = (
+                    self.url,
+                    self.token,
+                    validated,
+                )
+
     @login_first
-    def scale(self, replicas: int, deployment: str) -> ExecutionBase:
+    def scale(
+        self,
+        replicas: int,
+        deployment: str,
+        wait: bool = False,
+        timeout: int = TIMEOUT,
+    ) -> ExecutionBase:
         """
         Perform oc scale, setting the number of replicas provided for the given deployment name.
         It enforces that the "oc login" is executed first.
         :param replicas:
         :param deployment:
-        :return: The execution result.
+        :param wait: wait for the rollout of the deployment to complete
+        :param timeout: max seconds to wait for the rollout
+        :return: The execution result (of the rollout status, when waiting).
         """
         cmd_scale_up = CommandBase(
-            args=['oc', 'scale', '--replicas=%d' % replicas, 'dc', deployment],
+            args=self._oc('scale', '--replicas=%d' % replicas, 'dc', deployment),
             timeout=30,
             stderr=True,
             stdout=True,
         )
-        execution: ExecutionBase = self.executor.execute(cmd_scale_up)
-        execution.wait()
+        execution: ExecutionBase = self.executor.execute_sync(cmd_scale_up)
+        resolve(execution.wait())
         if not execution.completed_successfully():
             self._logger.debug(
                 'Scaling deployment %s (replicas: %d) failed: %s'
                 % (deployment, replicas, execution.read_stderr())
             )
+            return execution
+
+        if wait:
+            return self.rollout_status(deployment, timeout)
         return execution
+
+    @login_first
+    def rollout_status(self, deployment: str, timeout: int = TIMEOUT) -> ExecutionBase:
+        """
+        Waits for the rollout of the given deployment config to complete,
+        watching it (oc rollout status) instead of polling.
+        :param deployment:
+        :param timeout:
+        :return: The execution result.
+        """
+        cmd_rollout = CommandBase(
+            args=self._oc(
+                'rollout',
+                'status',
+                'dc/%s' % deployment,
+                '--watch=true',
+                '--timeout=%ds' % timeout,
+            ),
+            timeout=timeout,
+            stderr=True,
+            stdout=True,
+        )
+        execution: ExecutionBase = self.executor.execute_sync(cmd_rollout)
+        resolve(execution.wait())
+        if not execution.completed_successfully():
+            self._logger.debug(
+                'Rollout of deployment %s not completed: %s'
+                % (deployment, execution.read_stderr())
+            )
+        return execution
+
+    def wait_for_replicas(
+        self,
+        replicas: int,
+        deployment: str,
+        timeout: float = 300,
+        namespace: Optional[str] = None,
+    ) -> Optional[float]:
+        """
+        Waits until the given deployment config has exactly the given number
+        of ready pods, following pod changes through the Kubernetes watch API.
+        :param replicas:
+        :param deployment:
+        :param timeout: max seconds to wait
+        :param namespace: defaults to the namespace of the executor (or current project)
+        :return: seconds taken till the pods were ready, or None if timed out
+        """
+        return wait_for_ready_pods(
+            self.get_api(),
+            namespace or self._get_namespace(),
+            'deploymentconfig=%s' % deployment,
+            replicas,
+            timeout,
+        )
+
+    def get_api(self) -> Any:
+        """
+        Returns the Kubernetes CoreV1Api of the executor (if it is a kubernetes one),
+        otherwise one authenticated against the url using the token.
+        :return:
+        """
+        if isinstance(self.executor, ExecutorKubernetes):
+            return self.executor.get_api()
+
+        if self._api is None:
+            from kubernetes import client
+
+            client_config = client.Configuration()
+            client_config.host = self.url
+            client_config.verify_ssl = False
+            client_config.api_key = {'authorization': 'Bearer %s' % self.token}
+            self._api = client.CoreV1Api(client.ApiClient(client_config))
+        return self._api
+
+    @login_first
+    def _get_namespace(self) -> str:
+        """
+        Returns the namespace of the executor, or the current oc project.
+        :return:
+        """
+        if isinstance(self.executor, ExecutorKubernetes):
+            return self.executor.namespace
+
+        cmd_project = CommandBase(
+            args=self._oc('project', '-q'), timeout=self.TIMEOUT, stdout=True
+        )
+        execution: ExecutionBase = self.executor.execute_sync(cmd_project)
+        resolve(execution.wait())
+        return (execution.read_stdout() or 'default').strip()
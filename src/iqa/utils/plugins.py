@@ -0,0 +1,166 @@
+"""
+Lazy registry for named implementations (executors, services, brokers, routers
+and clients).
+
+Built-in implementations are registered by name as "module:attribute"
+references and the related module is only imported when the implementation is
+requested for the first time. That way, importing iqa does not pull in heavy
+third party libraries (kubernetes, asyncssh, docker, ...) unless they are used.
+
+Base classes (ExecutorBase, Service, Broker, Router and ClientExternal) register
+their subclasses by implementation name as soon as they are defined, at any
+depth of the class hierarchy, so lookups are plain dictionary accesses.
+
+External packages can provide their own implementations through entry points,
+using the group of the related registry, for example (setup.py):
+
+    entry_points={
+        'iqa.executors': ['my_executor = my_package.executor:MyExecutor'],
+    }
+"""
+import importlib
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Union
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def import_reference(reference: str) -> Any:
+    """
+    Imports and returns the object referenced as "module:attribute"
+    (or simply "module").
+    :param reference:
+    :return:
+    """
+    module_name, _, attribute = reference.partition(':')
+    target: Any = importlib.import_module(module_name)
+    for attr in filter(None, attribute.split('.')):
+        target = getattr(target, attr)
+    return target
+
+
+def _entry_points(group: str) -> list:
+    """
+    Returns all entry points available for the given group.
+    :param group:
+    :return:
+    """
+    try:
+        from importlib import metadata
+    except ImportError:  # pragma: no cover (python < 3.8)
+        return []
+
+    eps: Any = metadata.entry_points()
+    if hasattr(eps, 'select'):
+        return list(eps.select(group=group))
+    return list(eps.get(group, []))
+
+
+class PluginRegistry(object):
+    """
+    Maps implementation names to classes, importing them on first use.
+    """
+
+    def __init__(self, group: str, builtins: Optional[Dict[str, str]] = None) -> None:
+        """
+        :param group: entry point group used to discover external implementations
+        :param builtins: implementations shipped with iqa (name: "module:attribute")
+        """
+        self.group: str = group
+        self._references: Dict[str, str] = dict(builtins or {})
+        self._loaded: Dict[str, Any] = {}
+        self._entry_points_loaded: bool = False
+        self._lock: threading.RLock = threading.RLock()
+
+    def register(self, name: str, implementation: Union[str, Any]) -> None:
+        """
+        Registers an implementation by name, either as a "module:attribute"
+        reference (imported on first use) or as an already loaded class.
+        Loaded classes take precedence over references with the same name.
+        :param name:
+        :param implementation:
+        :return:
+        """
+        with self._lock:
+            if isinstance(implementation, str):
+                self._references[name] = implementation
+            else:
+                self._loaded[name] = implementation
+
+    def register_class(self, cls: type, attribute: str = 'implementation') -> None:
+        """
+        Registers the given class if it defines its own implementation name
+        (subclasses inheriting the name of a parent are not registered).
+        Meant to be called from __init_subclass__ of base classes.
+        :param cls:
+        :param attribute:
+        :return:
+        """
+        name: Any = cls.__dict__.get(attribute)
+        if isinstance(name, str):
+            self.register(name, cls)
+
+    def update(self, references: Dict[str, str]) -> None:
+        """
+        Registers multiple "module:attribute" references at once.
+        :param references:
+        :return:
+        """
+        for name, reference in references.items():
+            self.register(name, reference)
+
+    def get(self, name: str) -> Any:
+        """
+        Returns the implementation registered with the given name, importing it if needed.
+        A ValueError is raised when no implementation is registered with that name.
+        :param name:
+        :return:
+        """
+        with self._lock:
+            if name in self._loaded:
+                return self._loaded[name]
+
+            if name not in self._references:
+                self._load_entry_points()
+
+            if name not in self._references:
+                raise ValueError(
+                    'Implementation "%s" not found in %s registry' % (name, self.group)
+                )
+
+            logger.debug('Loading %s implementation "%s"' % (self.group, name))
+            implementation: Any = import_reference(self._references[name])
+
+            # Classes usually register themselves once their module is imported
+            return self._loaded.setdefault(name, implementation)
+
+    def names(self) -> List[str]:
+        """
+        Returns the names of all known implementations (loaded or not).
+        :return:
+        """
+        with self._lock:
+            self._load_entry_points()
+            return sorted(set(self._references) | set(self._loaded))
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._loaded
+
+    def _load_entry_points(self) -> None:
+        """
+        Adds references from installed entry points (only once). Built-in
+        and explicitly registered names take precedence.
+        :return:
+        """
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+
+        for entry_point in _entry_points(self.group):
+            if entry_point.name in self._references or entry_point.name in self._loaded:
+                continue
+            self._references[entry_point.name] = entry_point.value
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.names()
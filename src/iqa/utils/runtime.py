@@ -0,0 +1,131 @@
+"""
+Shared asyncio runtime used by synchronous callers of asynchronous APIs.
+
+A single event loop runs forever in a daemon thread (created on first use),
+so sync code can submit coroutines to it without creating a new loop on
+every call, and async executors keep their connections bound to one loop.
+"""
+import asyncio
+import inspect
+import logging
+import threading
+from typing import Any, Awaitable, Optional
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+_lock: threading.Lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """
+    Returns the background event loop, starting it if needed.
+    :return:
+    """
+    global _loop, _thread
+
+    with _lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            _thread = threading.Thread(
+                target=_run_forever, args=(_loop,), name='iqa-runtime', daemon=True
+            )
+            _thread.start()
+        return _loop
+
+
+def _run_forever(loop: asyncio.AbstractEventLoop) -> None:
+    asyncio.set_event_loop(loop)
+    loop.run_forever()
+
+
+def in_runtime_thread() -> bool:
+    """
+    Returns True if called from the thread running the background event loop.
+    :return:
+    """
+    return _thread is not None and threading.current_thread() is _thread
+
+
+def run_sync(coro: Awaitable, timeout: Optional[float] = None) -> Any:
+    """
+    Runs the given coroutine in the background event loop, blocking
+    until it is done, and returns its result (or raises its exception).
+
+    If a timeout (in seconds) is given and it expires, the coroutine is cancelled
+    and asyncio.TimeoutError is raised. If the calling thread is interrupted
+    while waiting (i.e. KeyboardInterrupt), the coroutine is cancelled as well.
+    :param coro:
+    :param timeout:
+    :return:
+    """
+    if in_runtime_thread():
+        raise RuntimeError(
+            'run_sync cannot be called from the runtime event loop (use await instead)'
+        )
+
+    if timeout is not None:
+        coro = asyncio.wait_for(coro, timeout)
+    elif not asyncio.iscoroutine(coro):
+        coro = _await(coro)
+
+    future = asyncio.run_coroutine_threadsafe(coro, get_loop())
+    try:
+        return future.result()
+    except BaseException:
+        # Propagates the cancellation to the task running on the loop
+        future.cancel()
+        raise
+
+
+async def _await(awaitable: Awaitable) -> Any:
+    return await awaitable
+
+
+def resolve(value: Any, timeout: Optional[float] = None) -> Any:
+    """
+    Returns the given value, or its result when it is an awaitable
+    (run through run_sync). Allows sync code to handle results of
+    executors and executions that may or may not be asynchronous.
+    :param value:
+    :param timeout:
+    :return:
+    """
+    if inspect.isawaitable(value):
+        return run_sync(value, timeout=timeout)
+    return value
+
+
+async def maybe_await(value: Any) -> Any:
+    """
+    Awaits the given value if it is an awaitable, otherwise returns it
+    (async counterpart of resolve).
+    :param value:
+    :return:
+    """
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+def shutdown() -> None:
+    """
+    Stops the background event loop and waits for its thread to finish.
+    A new loop is started if the runtime is used again afterwards.
+    :return:
+    """
+    global _loop, _thread
+
+    with _lock:
+        loop, thread = _loop, _thread
+        _loop, _thread = None, None
+
+    if loop is None:
+        return
+
+    logger.debug('Stopping runtime event loop')
+    loop.call_soon_threadsafe(loop.stop)
+    if thread is not None:
+        thread.join()
+    loop.close()
@@ -26,6 +26,30 @@ def is_tcp_port_available(port, host) -> bool:
         return False
 
 
+async def is_host_port_open(host, port, timeout=5) -> bool:
+    """Try once to open a TCP connection to the given host and port
+
+    Args:
+        host: host address or hostname
+        port: port number
+        timeout: max seconds to wait for the connection
+
+    Returns:
+        awaitable bool
+    """
+    try:
+        _reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return True
+
+
 async def wait_host_port(host, port, duration=5, delay=0.1):
     """Repeatedly try if a port on a host is open until duration seconds passed
 
@@ -41,12 +65,8 @@ async def wait_host_port(host, port, duration=5, delay=0.1):
 
     tmax = time.time() + duration
     while time.time() < tmax:
-        try:
-            _reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=5)
-            writer.close()
-            await writer.wait_closed()
+        if await is_host_port_open(host, port, timeout=min(5, max(tmax - time.time(), 0.01))):
             return True
-        except:
-            if delay:
-                await asyncio.sleep(delay)
+        if delay:
+            await asyncio.sleep(delay)
     return False
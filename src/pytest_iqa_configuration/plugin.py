@@ -6,9 +6,11 @@ import atexit
 import os
 from logging import Logger
 
+import pytest
 from _pytest.config.argparsing import Parser, OptionGroup
 from _pytest.python import Function
 
+from iqa.instance import snapshot
 from iqa.instance.instance import Instance
 from .logger import get_logger
 
@@ -106,10 +108,14 @@ def pytest_configure(config) -> None:
     }
     os.environ.update(options)
 
-    # Loading the inventory
-    iqa: Instance = Instance(
-        inventory=config.getvalue('inventory'), cli_args=config.option.__dict__
-    )
+    # Loading the inventory (pytest-xdist workers restore the controller's snapshot)
+    workerinput: dict = getattr(config, 'workerinput', {})
+    if 'iqa_snapshot' in workerinput:
+        iqa: Instance = snapshot.loads(workerinput['iqa_snapshot'])
+    else:
+        iqa = Instance(
+            inventory=config.getvalue('inventory'), cli_args=config.option.__dict__
+        )
 
     # Adjusting clients timeout
     for client in iqa.clients:
@@ -121,6 +127,21 @@ def pytest_configure(config) -> None:
     atexit.register(cleanup_files)
 
 
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node) -> None:
+    """
+    pytest-xdist hook (controller side) that shares a snapshot of the IQA
+    instance with each worker, so workers do not parse the inventory
+    and probe nodes and services again.
+    :param node:
+    :return:
+    """
+    config = node.config
+    if not hasattr(config, 'iqa_snapshot'):
+        config.iqa_snapshot = snapshot.dumps(config.iqa)
+    node.workerinput['iqa_snapshot'] = config.iqa_snapshot
+
+
 def pytest_runtest_call(item: Function) -> None:
     """
     Hook that runs before each test method and can iterate through
@@ -5,7 +5,11 @@ Defines mandatory options and configuration that can be applied to all test suit
 import atexit
 import os
 
+import pytest
+
+from iqa.instance import snapshot
 from iqa.instance.instance import Instance
+from iqa.system.service.timing import TIMINGS
 from .logger import get_logger
 
 # Default timeout settings
@@ -30,6 +34,14 @@ def pytest_addoption(parser) -> None:
         metavar='INVENTORY',
         help='Inventory file to use',
     )
+    group.addoption(
+        '--iqa-timings',
+        action='store',
+        dest='iqa_timings',
+        default=None,
+        metavar='TIMINGS',
+        help='File to append service transition timings to (one JSON per line)',
+    )
 
 
 def cleanup_files() -> None:
@@ -69,10 +81,14 @@ def pytest_configure(config) -> None:
     }
     os.environ.update(options)
 
-    # Loading the inventory
-    iqa = Instance(
-        inventory=config.getvalue('inventory'), cli_args=config.option.__dict__
-    )
+    # Loading the inventory (pytest-xdist workers restore the controller's snapshot)
+    workerinput: dict = getattr(config, 'workerinput', {})
+    if 'iqa_snapshot' in workerinput:
+        iqa = snapshot.loads(workerinput['iqa_snapshot'])
+    else:
+        iqa = Instance(
+            inventory=config.getvalue('inventory'), cli_args=config.option.__dict__
+        )
 
     # Adjusting clients timeout
     for client in iqa.clients:
@@ -82,3 +98,36 @@ def pytest_configure(config) -> None:
 
     # Clean up temporary files at exit
     atexit.register(cleanup_files)
+
+
+def pytest_unconfigure(config) -> None:
+    """
+    Saves the service transition timings recorded during the session
+    and releases resources held by the instance components.
+    :param config:
+    :return:
+    """
+    if TIMINGS.timings:
+        log.info('Service transition timings: %s' % TIMINGS.summary())
+
+    timings_file: str = config.getoption('iqa_timings', None)
+    if timings_file:
+        TIMINGS.save(timings_file)
+
+    if hasattr(config, 'iqa'):
+        config.iqa.close()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node) -> None:
+    """
+    pytest-xdist hook (controller side) that shares a snapshot of the IQA
+    instance with each worker, so workers do not parse the inventory
+    and probe nodes and services again.
+    :param node:
+    :return:
+    """
+    config = node.config
+    if not hasattr(config, 'iqa_snapshot'):
+        config.iqa_snapshot = snapshot.dumps(config.iqa)
+    node.workerinput['iqa_snapshot'] = config.iqa_snapshot
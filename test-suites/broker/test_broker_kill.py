@@ -5,6 +5,8 @@ import time
 from iqa.components.brokers.artemis.artemis import Artemis
 from iqa.system.command.command_base import CommandBase
 from iqa.system.executor import Execution
+from iqa.system.service.liveness import LivenessWatcher
+from iqa.system.service.probe import TcpProbe
 
 
 class SendMessage(MessagingHandler):
@@ -35,11 +37,18 @@ def test_node_ip(master1: Artemis, slave1: Artemis, slave2: Artemis) -> None:
     # Client01.start(master1.lister('test_listener'))
     # Client01.send(address=broker2.address('abcd') msg=message)
 
+    liveness: LivenessWatcher = master1.watch_liveness()
+
+    killed: float = time.time()
     cmd: CommandBase = CommandBase(['killall', 'java'])
     execution: Execution = master1.node.execute(cmd)
     assert True if execution.get_ecode() == 0 else False
+    assert liveness.wait_for_death(timeout=30, since=killed)
 
-    time.sleep(15)
+    # Slave takes over once its messaging port accepts connections
+    assert slave1.service.wait_until_ready(
+        timeout=60, probe=TcpProbe(slave1.node.ip, 5672)
+    )
 
     # message = Message(content='Test message')
     # Client01.send(broker2.lister('test_listener'), address=broker2.address('abcd') msg=message)
@@ -3,11 +3,12 @@
 from proton import Message, Event
 from proton.handlers import MessagingHandler
 from proton.reactor import Container
-import time
 
 from iqa.components.brokers.artemis.artemis import Artemis
 from iqa.system.command.command_base import CommandBase
 from iqa.system.executor import Execution
+from iqa.system.service.probe import TcpProbe
+from iqa.system.service.service import ServiceStatus
 
 
 class SendMessage(MessagingHandler):
@@ -42,8 +43,12 @@ def test_node_ip(master1: Artemis, slave1: Artemis, slave2: Artemis) -> None:
     cmd: CommandBase = CommandBase(['killall', 'java'])
     execution: Execution = master1.node.execute(cmd)
     assert True if execution.get_ecode() == 0 else False
+    assert master1.service.wait_for_status(ServiceStatus.STOPPED, timeout=30)
 
-    time.sleep(15)
+    # Slave takes over once its messaging port accepts connections
+    assert slave1.service.wait_until_ready(
+        timeout=60, probe=TcpProbe(slave1.node.ip, 5672)
+    )
 
     # message = Message(content='Test message')
     # Client01.send(broker2.lister('test_listener'), address=broker2.address('abcd') msg=message)
@@ -71,17 +71,17 @@ for cluster in iqa.broker_clusters:  # type: AbstractBrokerCluster
     # If broker "service" is reported as not running, try starting it
     if cluster.service.status() != ServiceStatus.RUNNING:
         print("  -> starting service: %s" % cluster.service.name)
-        cluster.service.start(wait_for_messaging=True)
+        cluster.service.start(wait=True, wait_for_messaging=True)
 
         print("     new status: %s" % cluster.service.status().name)
 
     # query_queues(broker)
     # broker.service.stop()
     # broker.service.status()
-    # broker.service.start(wait_for_messaging=True)
+    # broker.service.start(wait=True, wait_for_messaging=True)
     # broker.service.status()
     #
-    # broker.service.restart(wait_for_messaging=True)
+    # broker.service.restart(wait=True, wait_for_messaging=True)
 
     # If broker is running, then retrieve all queues and message count
     if cluster.service.status() == ServiceStatus.RUNNING:
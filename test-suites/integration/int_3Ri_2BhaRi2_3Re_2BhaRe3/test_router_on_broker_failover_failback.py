@@ -1,10 +1,10 @@
-import time
-
 from iqa.system.service.service import ServiceStatus
+from iqa.system.service.service_group import ServiceGroup
 from iqa.components.routers.dispatch.dispatch import Dispatch
 from iqa.components.brokers.artemis.artemis import Artemis
 from iqa.components.routers.dispatch.management.query import RouterQuery
 from iqa.utils.types import RouterType, BrokerType
+from iqa.utils.wait_until import wait_until
 
 from .receiver import Receiver
 from .sender import Sender
@@ -26,6 +26,7 @@ class TestRouterOnBrokerFailOverFailBack(object):
     MESSAGE_COUNT: int = 10
     MESSAGE_SIZE: int = 1024
     TIMEOUT: int = 30
+    RECOVERY_TIMEOUT: int = 100
 
     @staticmethod
     def _get_router_query(router: Dispatch) -> RouterQuery:
@@ -50,29 +51,22 @@ class TestRouterOnBrokerFailOverFailBack(object):
         # Ensure that a router instance has been provided
         assert isinstance(router, Dispatch)
 
-        # Wait for 30 seconds to router recovered from failover/failback
-        time.sleep(30)
-
         # Creates an instance of the RouterQuery class and retrieve autolinks and connectors
         query: RouterQuery = TestRouterOnBrokerFailOverFailBack._get_router_query(router)
 
-        # Changed to true if at least one connector has been found
-        connector_found: bool = False
-
-        # Retrieving all connectors
-        for connector in query.connector():
+        def connectors_have_failoverurls() -> bool:
             # ignore connectors to other routers
-            if connector.role != 'route-container':
-                continue
-
-            # One route-container connector found
-            connector_found = True
+            connectors: list = [
+                connector for connector in query.connector() if connector.role == 'route-container'
+            ]
 
-            # Connector must have failOverUrls defined and it must have more than 1 url
-            assert connector.failoverUrls
-            assert ',' in connector.failoverUrls
+            # Connectors must have failOverUrls defined and it must have more than 1 url
+            return bool(connectors) and all(
+                connector.failoverUrls and ',' in connector.failoverUrls for connector in connectors
+            )
 
-        assert connector_found is True
+        # Polls till router recovered from failover/failback
+        wait_until(connectors_have_failoverurls, TestRouterOnBrokerFailOverFailBack.TIMEOUT, 1)
 
     @staticmethod
     def validate_autolinks_active(router: RouterType) -> None:
@@ -88,20 +82,10 @@ class TestRouterOnBrokerFailOverFailBack(object):
         query: RouterQuery = TestRouterOnBrokerFailOverFailBack._get_router_query(router)
 
         # Ensure all autolinks are in "active" status
-        max_attempts: int = 10
-        attempt: int = 0
-        all_autolinks_active: bool = False
+        def all_autolinks_active() -> bool:
+            return all(autolink.operStatus == 'active' for autolink in query.config_autolink())
 
-        while not all_autolinks_active and attempt < max_attempts:
-            inactive = 0
-            for autolink in query.config_autolink():
-                if autolink.operStatus != 'active':
-                    inactive += 1
-            all_autolinks_active = inactive == 0
-            attempt += 1
-            time.sleep(10)
-
-        assert all_autolinks_active
+        wait_until(all_autolinks_active, TestRouterOnBrokerFailOverFailBack.RECOVERY_TIMEOUT, 1)
 
     def send_and_receive(self, queue: str, router: RouterType) -> None:
         """
@@ -142,18 +126,11 @@ class TestRouterOnBrokerFailOverFailBack(object):
     def broker_has_queues(self, broker: BrokerType) -> None:
         """
         Assert that the provided broker instance has queues.
-        It attempts to retrieve queues "max_attempts" times with a delay of 1 between attempts.
+        It polls the queues (every second) until RECOVERY_TIMEOUT expires.
         :param broker:
         :return:
         """
-        max_attempts: int = 10
-        attempt: int = 0
-
-        while not broker.queues() and attempt < max_attempts:
-            time.sleep(10)
-            attempt += 1
-
-        assert len(broker.queues()) > 0
+        wait_until(lambda: len(broker.queues()) > 0, self.RECOVERY_TIMEOUT, 1)
 
     def test_initial_state(self, broker_m_internal: Artemis, broker_s_internal: Artemis, broker_m_edge: Artemis,
                            broker_s_edge: Artemis, router_i2: Dispatch, router_e3: Dispatch) -> None:
@@ -210,7 +187,7 @@ class TestRouterOnBrokerFailOverFailBack(object):
         :param broker_master:
         :return:
         """
-        broker_master.service.stop()
+        broker_master.service.stop(wait=True)
         assert broker_master.service.status() == ServiceStatus.STOPPED
 
     def test_broker_slave_active(self, broker_slave: Artemis) -> None:
@@ -248,11 +225,12 @@ class TestRouterOnBrokerFailOverFailBack(object):
 
     def test_broker_failback(self, broker_master: Artemis) -> None:
         """
-        Starts the provided master broker instance and ensure it has been started.
+        Starts the provided master broker instance and ensure it has been started
+        and is ready (IQAServiceNotReadyException is raised otherwise).
         :param broker_master:
         :return:
         """
-        broker_master.service.start()
+        ServiceGroup([broker_master.service]).start(wait=True, timeout=self.RECOVERY_TIMEOUT)
         assert broker_master.service.status() == ServiceStatus.RUNNING
 
     def test_broker_master_active(self, broker_master: Artemis) -> None:
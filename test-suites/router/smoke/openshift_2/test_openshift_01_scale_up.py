@@ -31,6 +31,9 @@ def test_scale_up_router(router_cluster: Tuple[Dispatch, str, str]):
     execution: Execution = ocp.scale(MESH_SIZE, 'amq-interconnect')
     assert execution.completed_successfully()
 
+    # Waiting for pods to be ready (watching them through the Kubernetes API)
+    assert ocp.wait_for_replicas(MESH_SIZE, 'amq-interconnect') is not None
+
 
 def test_router_mesh_after_scale_up(router_cluster: Tuple[Dispatch, str, str], iqa: Instance):
     """
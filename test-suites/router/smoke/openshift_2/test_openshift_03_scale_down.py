@@ -24,6 +24,9 @@ def test_scale_down_router(router_cluster):
     execution: Execution = ocp.scale(1, 'amq-interconnect')
     assert execution.completed_successfully()
 
+    # Waiting for pods to be ready (watching them through the Kubernetes API)
+    assert ocp.wait_for_replicas(1, 'amq-interconnect') is not None
+
 
 def test_mesh_after_scale_down(router_cluster, iqa: Instance):
     """
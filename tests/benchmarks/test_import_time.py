@@ -0,0 +1,65 @@
+"""
+Import time benchmark for the iqa packages that are imported by every suite.
+Heavy third party libraries must only be loaded when the related
+implementation is actually requested through its registry.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+MODULES: list = ['iqa.system.executor', 'iqa.system.node', 'iqa.system.service']
+HEAVY_MODULES: list = ['asyncssh', 'docker', 'kubernetes', 'ansible']
+
+# Import time budget of each module (about 50 ms are expected, while loading
+# any of the heavy modules takes several hundreds)
+IMPORT_BUDGET_MS: float = float(os.environ.get('IQA_IMPORT_BUDGET_MS', '500'))
+
+
+def run_python(code: str, *args) -> subprocess.CompletedProcess:
+    env: dict = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    return subprocess.run(
+        [sys.executable, *args, '-c', code],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+
+def import_time_us(module: str) -> int:
+    """
+    Returns the cumulative import time (in microseconds) reported
+    by "python -X importtime" for the given module.
+    """
+    result: subprocess.CompletedProcess = run_python('import %s' % module, '-X', 'importtime')
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts: list = [part.strip() for part in line.split('|')]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise AssertionError('Import time for %s not reported' % module)
+
+
+@pytest.mark.parametrize('module', MODULES)
+def test_import_time(module: str) -> None:
+    elapsed: int = import_time_us(module)
+    print('import %s: %.1f ms' % (module, elapsed / 1000))
+    assert elapsed / 1000 < IMPORT_BUDGET_MS
+
+
+def test_heavy_modules_not_imported() -> None:
+    code: str = 'import sys, %s; print(",".join(m for m in %r if m in sys.modules))' % (
+        ', '.join(MODULES),
+        HEAVY_MODULES,
+    )
+    assert run_python(code).stdout.strip() == ''
+
+
+def test_heavy_modules_imported_on_first_use() -> None:
+    pytest.importorskip('docker')
+    code: str = 'import sys; from iqa.system.service import SERVICES; SERVICES.get("docker"); ' \
+                'print("docker" in sys.modules)'
+    assert run_python(code).stdout.strip() == 'True'
@@ -0,0 +1,178 @@
+"""
+Client side throughput and latency of the Artemis management operations,
+measured against the local Jolokia stand-in server (no broker needed).
+They only run when the number of queues is given through IQA_BENCHMARK_QUEUES
+(i.e. IQA_BENCHMARK_QUEUES=100000), as populating the server takes a while.
+"""
+import asyncio
+import os
+import time
+from typing import Iterator, List, Optional
+
+import pytest
+
+from iqa.abstract.destination.address import Address
+from iqa.abstract.destination.queue import Queue
+from iqa.abstract.destination.routing_type import RoutingType
+from iqa.components.brokers.artemis.management.jolokia_client import (
+    ArtemisJolokiaClient,
+)
+from iqa.components.brokers.artemis.management.jolokia_client_async import (
+    AsyncArtemisJolokiaClient,
+)
+from iqa.components.brokers.artemis.management.jolokia_server import (
+    ArtemisJolokiaServer,
+)
+from iqa.components.brokers.artemis.provisioning import DestinationProvisioner
+from iqa.components.brokers.artemis.topology import ArtemisTopology
+from iqa.system.service.timing import percentile
+
+QUEUES: int = int(os.environ.get('IQA_BENCHMARK_QUEUES', 0))
+OPERATIONS: int = 500
+
+pytestmark = pytest.mark.skipif(
+    not QUEUES, reason='IQA_BENCHMARK_QUEUES not set (management benchmarks are opt-in)'
+)
+
+
+@pytest.fixture(scope='module')
+def server() -> Iterator[ArtemisJolokiaServer]:
+    with ArtemisJolokiaServer(max_page_size=1000) as jolokia_server:
+        jolokia_server.populate(QUEUES, queues_per_address=4)
+        yield jolokia_server
+
+
+@pytest.fixture
+def client(server: ArtemisJolokiaServer) -> Iterator[ArtemisJolokiaClient]:
+    jolokia_client: ArtemisJolokiaClient = ArtemisJolokiaClient(
+        'amq', server.host, str(server.port), 'admin', 'admin'
+    )
+    yield jolokia_client
+    jolokia_client.close()
+
+
+class StandInBroker(object):
+    """
+    Management facade of a broker backed by the stand-in server, as used
+    by DestinationProvisioner (Artemis itself needs a node to be created).
+    """
+
+    def __init__(self, client: ArtemisJolokiaClient) -> None:
+        self.instance_name: str = 'amq'
+        self.management_client: ArtemisJolokiaClient = client
+        self.topology: ArtemisTopology = ArtemisTopology()
+
+    def _refresh(self) -> None:
+        with self.management_client.batch() as batch:
+            queues = batch.list_queues()
+            addresses = batch.list_addresses()
+        self.topology.update(addresses.data or [], queues.data or [])
+
+    def queues(self, refresh: Optional[bool] = None) -> List[Queue]:
+        if refresh is not False:
+            self._refresh()
+        return self.topology.queues
+
+    def addresses(self, refresh: Optional[bool] = None) -> List[Address]:
+        if refresh is not False:
+            self._refresh()
+        return self.topology.addresses
+
+    def invalidate_topology(self) -> None:
+        self.topology.invalidate()
+
+    @staticmethod
+    def _get_routing_type(routing_type: RoutingType) -> str:
+        return routing_type.name
+
+
+def report(name: str, count: int, elapsed: float) -> None:
+    print('%s: %d in %.3fs (%.0f/s)' % (name, count, elapsed, count / elapsed))
+
+
+def test_list_queues(server: ArtemisJolokiaServer, client: ArtemisJolokiaClient) -> None:
+    http_calls: int = server.http_calls
+    started: float = time.perf_counter()
+    result = client.list_queues()
+    report('list_queues', len(result.data), time.perf_counter() - started)
+
+    assert len(result.data) == QUEUES
+    print('HTTP calls: %d' % (server.http_calls - http_calls))
+
+
+def test_list_queues_async(server: ArtemisJolokiaServer) -> None:
+    async def list_queues() -> int:
+        client: AsyncArtemisJolokiaClient = AsyncArtemisJolokiaClient(
+            'amq', server.host, str(server.port), 'admin', 'admin'
+        )
+        try:
+            return len((await client.list_queues()).data)
+        finally:
+            await client.close()
+
+    started: float = time.perf_counter()
+    count: int = asyncio.run(list_queues())
+    report('list_queues (async)', count, time.perf_counter() - started)
+
+    assert count == QUEUES
+
+
+def test_topology_refresh(client: ArtemisJolokiaClient) -> None:
+    topology: ArtemisTopology = ArtemisTopology()
+    with client.batch() as batch:
+        queues = batch.list_queues()
+        addresses = batch.list_addresses()
+
+    for refresh in ('initial', 'incremental'):
+        started: float = time.perf_counter()
+        topology.update(addresses.data, queues.data)
+        report('topology update (%s)' % refresh, QUEUES, time.perf_counter() - started)
+
+    assert topology.get_queue('queue.%d' % (QUEUES - 1)) is not None
+
+
+def test_read_queue_metrics(client: ArtemisJolokiaClient) -> None:
+    started: float = time.perf_counter()
+    result = client.read_queue_metrics(['MessageCount', 'ConsumerCount'])
+    report('read_queue_metrics', len(result.value), time.perf_counter() - started)
+
+    assert len(result.value) == QUEUES
+
+
+def test_operation_latency(client: ArtemisJolokiaClient) -> None:
+    latencies: List[float] = []
+    for index in range(OPERATIONS):
+        started: float = time.perf_counter()
+        assert client.create_queue('latency', 'latency.%d' % index).success
+        latencies.append(time.perf_counter() - started)
+
+    for index in range(OPERATIONS):
+        started = time.perf_counter()
+        assert client.delete_queue('latency.%d' % index).success
+        latencies.append(time.perf_counter() - started)
+
+    print(
+        'create/delete latency: p50 %.3fms - p99 %.3fms'
+        % (percentile(latencies, 50) * 1000, percentile(latencies, 99) * 1000)
+    )
+
+
+def test_bulk_provisioning(client: ArtemisJolokiaClient) -> None:
+    address: Address = Address('bulk', RoutingType.ANYCAST)
+    queues: List[Queue] = [
+        Queue('bulk.%d' % index, RoutingType.ANYCAST, address) for index in range(10000)
+    ]
+    provisioner: DestinationProvisioner = DestinationProvisioner(
+        StandInBroker(client)  # type: ignore
+    )
+
+    started: float = time.perf_counter()
+    created = provisioner.create(queues)
+    report('create_destinations', created.done, time.perf_counter() - started)
+
+    started = time.perf_counter()
+    deleted = provisioner.delete(queues + [address])
+    report('delete_destinations', deleted.done, time.perf_counter() - started)
+
+    assert created.success and created.done == len(queues) + 1
+    assert deleted.success and deleted.done == len(queues) + 1
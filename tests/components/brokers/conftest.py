@@ -0,0 +1,51 @@
+import threading
+from typing import Any, Callable, List
+
+import pytest
+
+from iqa.components.brokers.artemis.management.jolokia_client import (
+    ArtemisJolokiaClient,
+)
+
+
+class FakeResponse(object):
+    def __init__(self, body) -> None:
+        self.body = body
+
+    def json(self):
+        return self.body
+
+
+class FakeJolokia(object):
+    """
+    Replaces the HTTP post of Jolokia clients, recording the posted requests.
+    Bodies are taken from replies (one per post) while there are any, otherwise
+    reply is called for each request (of a bulk request).
+    """
+
+    def __init__(self) -> None:
+        self.posts: list = []
+        self.replies: List[Any] = []
+        self.reply: Callable[[dict], Any] = lambda request: {'status': 200, 'value': None}
+        self._lock: threading.Lock = threading.Lock()
+
+    def client(self, password: str = 'admin') -> ArtemisJolokiaClient:
+        client: ArtemisJolokiaClient = ArtemisJolokiaClient(
+            'amq', '127.0.0.1', '8161', 'admin', password
+        )
+        client._post = self.post  # type: ignore
+        return client
+
+    def post(self, json_request) -> FakeResponse:
+        with self._lock:
+            self.posts.append(json_request)
+            if self.replies:
+                return FakeResponse(self.replies.pop(0))
+        if isinstance(json_request, list):
+            return FakeResponse([self.reply(request) for request in json_request])
+        return FakeResponse(self.reply(json_request))
+
+
+@pytest.fixture
+def jolokia() -> FakeJolokia:
+    return FakeJolokia()
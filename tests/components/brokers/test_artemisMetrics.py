@@ -0,0 +1,71 @@
+import csv
+import math
+
+from iqa.components.brokers.artemis.management.jolokia_client import (
+    ArtemisJolokiaClient,
+)
+from iqa.components.brokers.artemis.metrics import BrokerMetricsSampler, TimeSeries
+
+
+queue_mbean: str = (
+    'org.apache.activemq.artemis:broker="amq",component=addresses,address="%s",'
+    'subcomponent=queues,routing-type="anycast",queue="%s"'
+)
+
+
+class FakeBroker(object):
+    def __init__(self, management_client: ArtemisJolokiaClient) -> None:
+        self.instance_name = 'amq'
+        self.management_client = management_client
+
+
+def test_ring_buffer() -> None:
+    series: TimeSeries = TimeSeries(('depth',), capacity=3)
+    for second in range(5):
+        series.append(float(second), {'depth': second * 10.0})
+
+    assert len(series) == 3
+    assert list(series.timestamps()) == [2.0, 3.0, 4.0]
+    assert list(series.values('depth')) == [20.0, 30.0, 40.0]
+    assert series.rate('depth') == 10.0
+    assert series.rate('depth', window=1) == 10.0
+    assert series.percentile('depth', 50) == 30.0
+    assert series.last('depth') == 40.0
+
+    series.append(5.0, {})
+    assert math.isnan(series.values('depth')[-1])
+    assert series.last('depth') == 40.0
+
+
+def test_sample(tmpdir, jolokia) -> None:
+    broker: FakeBroker = FakeBroker(jolokia.client())
+    posts: list = jolokia.posts
+    jolokia.replies = [
+        [
+            {'status': 200, 'value': {'AddressMemoryUsage': 1024, 'ConnectionCount': 2}},
+            {'status': 200, 'value': {
+                queue_mbean % ('orders', 'orders'): {'MessageCount': 5, 'MessagesAdded': 7},
+                queue_mbean % ('orders', 'orders.dlq'): {'MessageCount': 1, 'MessagesAdded': 1},
+            }},
+        ]
+    ] * 2
+
+    sampler: BrokerMetricsSampler = BrokerMetricsSampler(broker, queues=['orders'])  # type: ignore
+    sampler.sample()
+    sampler.sample()
+
+    # A single bulk request per sample
+    assert len(posts) == 2
+    assert posts[0][1]['mbean'].endswith(',queue=*')
+    assert sampler.broker_series.last('AddressMemoryUsage') == 1024.0
+    assert math.isnan(sampler.broker_series.values('TotalMessageCount')[0])
+    assert len(sampler.get_queue_series('orders')) == 2
+    assert sampler.get_queue_series('orders.dlq') is None
+    assert sampler.get_queue_series('orders::orders').last('MessageCount') == 5.0
+
+    paths: list = sampler.save(str(tmpdir))
+    assert len(paths) == 2
+    with open(paths[1]) as csv_file:
+        rows: list = list(csv.reader(csv_file))
+    assert rows[0] == ['timestamp', 'MessageCount', 'MessagesAdded', 'MessagesAcknowledged', 'ConsumerCount']
+    assert len(rows) == 3
@@ -0,0 +1,83 @@
+from iqa.abstract.destination.address import Address
+from iqa.abstract.destination.queue import Queue
+from iqa.abstract.destination.routing_type import RoutingType
+from iqa.components.brokers.artemis.management.jolokia_client import (
+    ArtemisJolokiaClient,
+)
+from iqa.components.brokers.artemis.provisioning import DestinationProvisioner
+
+
+class FakeBroker(object):
+    def __init__(self, management_client: ArtemisJolokiaClient) -> None:
+        self.instance_name = 'amq'
+        self.management_client = management_client
+        self.existing = Address('a0', RoutingType.ANYCAST)
+        self.invalidated = 0
+        self.listings: list = []
+
+    def queues(self, refresh=None) -> list:
+        self.listings.append(('queues', refresh))
+        return [Queue('q0', RoutingType.ANYCAST, self.existing)]
+
+    def addresses(self, refresh=None) -> list:
+        self.listings.append(('addresses', refresh))
+        return [self.existing]
+
+    def invalidate_topology(self) -> None:
+        self.invalidated += 1
+
+    @staticmethod
+    def _get_routing_type(routing_type: RoutingType) -> str:
+        return routing_type.name
+
+
+def test_create(jolokia) -> None:
+    broker: FakeBroker = FakeBroker(jolokia.client())
+    addresses: list = [Address('a%d' % index, RoutingType.ANYCAST) for index in range(3)]
+    reports: list = []
+
+    def destinations():
+        for index in range(1200):
+            yield Queue('q%d' % index, RoutingType.ANYCAST, addresses[index % 3])
+
+    provisioner: DestinationProvisioner = DestinationProvisioner(
+        broker, chunk_size=500, concurrency=2, progress=reports.append  # type: ignore
+    )
+    report = provisioner.create(destinations())
+
+    # q0 exists, a1 and a2 created along with their first queue
+    assert report.success
+    assert report.skipped == 1
+    assert report.done == 1199 + 2
+    assert len(jolokia.posts) == 3
+    assert len(reports) == 3
+    assert broker.invalidated == 1
+
+    operations: list = [
+        (request['operation'].split('(')[0], request['arguments'][0]) for request in jolokia.posts[0]
+    ]
+    assert operations[:3] == [
+        ('createAddress', 'a1'),
+        ('createQueue', 'a1'),
+        ('createAddress', 'a2'),
+    ]
+    assert ('createAddress', 'a0') not in operations
+
+    # Addresses are read from the topology loaded along with the queues
+    assert broker.listings == [('queues', None), ('addresses', False)]
+
+
+def test_delete(jolokia) -> None:
+    broker: FakeBroker = FakeBroker(jolokia.client())
+    destinations: list = [
+        Queue('q0', RoutingType.ANYCAST, broker.existing),
+        Queue('q1', RoutingType.ANYCAST, broker.existing),
+        broker.existing,
+    ]
+    report = DestinationProvisioner(broker).delete(destinations)  # type: ignore
+
+    assert report.done == 2 and report.skipped == 1
+    assert [request['operation'] for request in jolokia.posts[0]] == [
+        'destroyQueue(java.lang.String,boolean)',
+        'deleteAddress(java.lang.String,boolean)',
+    ]
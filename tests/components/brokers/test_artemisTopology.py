@@ -0,0 +1,47 @@
+from iqa.abstract.destination.routing_type import RoutingType
+from iqa.components.brokers.artemis.topology import ArtemisTopology
+
+
+def address(name: str, routing_type: str = 'ANYCAST') -> dict:
+    return {'name': name, 'routingTypes': routing_type}
+
+
+def queue(name: str, address_name: str, count: int = 0) -> dict:
+    return {'name': name, 'address': address_name, 'routingType': 'ANYCAST', 'messageCount': count}
+
+
+def test_incremental_update() -> None:
+    topology: ArtemisTopology = ArtemisTopology(ttl=60)
+    assert topology.expired()
+
+    topology.update(
+        [address('a1'), address('a2')], [queue('q1', 'a1'), queue('q2', 'a2')]
+    )
+    assert not topology.expired()
+    q1 = topology.get_queue('q1')
+    a1 = topology.get_address('a1')
+    assert topology.get_queue('a1::q1') is q1
+    assert a1.queues == [q1]
+
+    # q1 kept (updated in place), q2 and a2 removed, q3 added
+    topology.update(
+        [address('a1', 'MULTICAST')], [queue('q1', 'a1', 10), queue('q3', 'a1')]
+    )
+    assert topology.get_queue('q1') is q1
+    assert q1.message_count == 10
+    assert topology.get_address('a1') is a1
+    assert a1.routing_type == RoutingType.MULTICAST
+    assert [q.name for q in a1.queues] == ['q1', 'q3']
+    assert topology.get_queue('q2') is None
+    assert topology.get_queue('a2::q2') is None
+    assert [a.name for a in topology.addresses] == ['a1']
+
+    topology.invalidate()
+    assert topology.expired()
+
+
+def test_no_ttl() -> None:
+    topology: ArtemisTopology = ArtemisTopology()
+    topology.update([], [])
+    assert topology.loaded
+    assert topology.expired()
@@ -0,0 +1,149 @@
+import json
+
+from iqa.components.brokers.artemis.management.jolokia_client import (
+    ArtemisJolokiaClient,
+)
+
+
+def page(count: int, data: list) -> dict:
+    return {'status': 200, 'value': json.dumps({'count': count, 'data': data})}
+
+
+def test_batch(jolokia) -> None:
+    client: ArtemisJolokiaClient = jolokia.client()
+    posts: list = jolokia.posts
+    jolokia.replies = [
+        [
+            page(2, [{'name': 'q1'}]),
+            page(1, [{'name': 'a1'}]),
+            {'status': 404, 'error': 'not found', 'error_type': 'InstanceNotFoundException'},
+        ],
+        [page(2, [{'name': 'q1'}, {'name': 'q2'}])],
+    ]
+
+    with client.batch() as batch:
+        queues = batch.list_queues()
+        addresses = batch.list_addresses()
+        deleted = batch.delete_queue('q3')
+        assert not posts
+
+    # All requests in a single call, plus the remaining page of queues
+    assert len(posts) == 2
+    assert [request['operation'] for request in posts[0]] == [
+        'listQueues(java.lang.String,int,int)',
+        'listAddresses(java.lang.String,int,int)',
+        'destroyQueue(java.lang.String,boolean)',
+    ]
+    assert posts[1][0]['arguments'][1:] == [1, 100]
+
+    assert queues.success and queues.data == [{'name': 'q1'}, {'name': 'q2'}]
+    assert addresses.success and addresses.data == [{'name': 'a1'}]
+    assert not deleted.success and deleted.error_type == 'InstanceNotFoundException'
+
+
+def test_get_all_pages(jolokia) -> None:
+    client: ArtemisJolokiaClient = jolokia.client()
+    queues: list = [{'name': 'q%d' % index} for index in range(2550)]
+    posts: list = jolokia.posts
+
+    def reply(request: dict) -> dict:
+        page_number, page_size = request['arguments'][1:]
+        start: int = (page_number - 1) * page_size
+        return page(len(queues), queues[start:start + page_size])
+
+    jolokia.reply = reply
+    result = client.list_queues()
+
+    assert result.success
+    assert result.data == queues
+    # first page, then 3 pages of 1000 in a single bulk request
+    assert len(posts) == 2
+    assert [request['arguments'][1:] for request in posts[1]] == [[1, 1000], [2, 1000], [3, 1000]]
+
+
+def test_keep_alive() -> None:
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    connections: set = set()
+    authorizations: list = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_POST(self) -> None:
+            connections.add(self.client_address)
+            authorizations.append(self.headers['Authorization'])
+            self.rfile.read(int(self.headers['Content-Length']))
+            body: bytes = json.dumps({'status': 200, 'value': None}).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server: HTTPServer = HTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client: ArtemisJolokiaClient = ArtemisJolokiaClient(
+        'amq', '127.0.0.1', str(server.server_port), 'admin', 'secret'
+    )
+    try:
+        for _ in range(3):
+            assert client.delete_address('a1').success
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+
+    assert len(connections) == 1
+    assert authorizations == ['Basic YWRtaW46c2VjcmV0'] * 3
+
+
+def test_read_queue_metrics(jolokia) -> None:
+    client: ArtemisJolokiaClient = jolokia.client()
+    posts: list = jolokia.posts
+    mbean: str = (
+        'org.apache.activemq.artemis:broker="amq",component=addresses,address="%s",'
+        'subcomponent=queues,routing-type="%s",queue="%s"'
+    )
+
+    jolokia.replies = [{'status': 200, 'value': {
+        mbean % ('a1', 'anycast', 'q1'): {'MessageCount': 3, 'ConsumerCount': 1},
+        mbean % ('a,2', 'multicast', 'q2'): {'MessageCount': 0, 'ConsumerCount': 2},
+    }}]
+    result = client.read_queue_metrics(['MessageCount', 'ConsumerCount'])
+
+    assert len(posts) == 1
+    assert posts[0]['type'] == 'read'
+    assert posts[0]['mbean'] == (
+        'org.apache.activemq.artemis:broker="amq",component=addresses,address=*,'
+        'subcomponent=queues,routing-type=*,queue=*'
+    )
+    assert posts[0]['attribute'] == ['MessageCount', 'ConsumerCount']
+    assert result.value == {
+        'q1': {'MessageCount': 3, 'ConsumerCount': 1},
+        'q2': {'MessageCount': 0, 'ConsumerCount': 2},
+    }
+    assert result.data[1] == {
+        'name': 'q2', 'address': 'a,2', 'routingType': 'MULTICAST', 'MessageCount': 0, 'ConsumerCount': 2
+    }
+
+
+def test_request_payload(jolokia) -> None:
+    client: ArtemisJolokiaClient = jolokia.client(password='secret')
+    posts: list = jolokia.posts
+    jolokia.reply = lambda request: page(0, [])
+    client.list_queues('q1', exact=True)
+    client.create_queue('a1', 'q1')
+
+    assert posts[0] == {
+        'type': 'exec',
+        'mbean': 'org.apache.activemq.artemis:broker="amq"',
+        'operation': 'listQueues(java.lang.String,int,int)',
+        'arguments': ['{"field": "NAME", "operation": "EQUALS", "value": "q1"}', 1, 100],
+    }
+    assert posts[1]['arguments'] == ['a1', 'q1', True, 'ANYCAST']
+    assert 'secret' not in json.dumps(posts)
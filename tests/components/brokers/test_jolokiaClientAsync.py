@@ -0,0 +1,60 @@
+import asyncio
+import json
+
+from iqa.components.brokers.artemis.management.jolokia_client import (
+    ArtemisJolokiaClient,
+)
+from iqa.components.brokers.artemis.management.jolokia_client_async import (
+    AsyncArtemisJolokiaClient,
+)
+
+
+def test_async_client() -> None:
+    queues: list = [{'name': 'q%d' % index} for index in range(250)]
+    posts: list = []
+
+    def reply(request: dict) -> dict:
+        if request['type'] == 'read':
+            return {'status': 200, 'value': '2.11.0'}
+        page_number, page_size = request['arguments'][1:]
+        start: int = (page_number - 1) * page_size
+        return {
+            'status': 200,
+            'value': json.dumps({'count': len(queues), 'data': queues[start:start + page_size]}),
+        }
+
+    async def post(json_request):
+        posts.append(json_request)
+        await asyncio.sleep(0)
+        if isinstance(json_request, list):
+            return [reply(request) for request in json_request]
+        return reply(json_request)
+
+    async def run() -> tuple:
+        clients: list = [
+            AsyncArtemisJolokiaClient('amq%d' % index, '127.0.0.1', '8161', 'admin', 'admin')
+            for index in range(3)
+        ]
+        for client in clients:
+            client._post = post
+        listings = await asyncio.gather(*[client.list_queues() for client in clients])
+        version = await clients[0].read_attribute('Version')
+        return listings, version
+
+    listings, version = asyncio.run(run())
+    assert all(result.success and result.data == queues for result in listings)
+    assert version.value == '2.11.0'
+    assert posts[-1] == {
+        'type': 'read',
+        'mbean': 'org.apache.activemq.artemis:broker="amq0"',
+        'attribute': 'Version',
+    }
+
+
+def test_async_client_is_not_sync() -> None:
+    # Sync only operations (i.e. batch) are not inherited by the async client
+    client = AsyncArtemisJolokiaClient('amq', '127.0.0.1', '8161', 'admin', 'admin')
+    assert not isinstance(client, ArtemisJolokiaClient)
+    assert not hasattr(client, 'batch')
+    assert asyncio.iscoroutinefunction(client.close)
+    assert asyncio.iscoroutinefunction(client.read_queue_metrics)
@@ -0,0 +1,39 @@
+from iqa.components.brokers.artemis.management.jolokia_client import (
+    ArtemisJolokiaClient,
+)
+from iqa.components.brokers.artemis.management.jolokia_server import (
+    ArtemisJolokiaServer,
+)
+
+
+def test_management_operations() -> None:
+    with ArtemisJolokiaServer(max_page_size=500) as server:
+        server.populate(queues=1200, queues_per_address=2)
+        client: ArtemisJolokiaClient = ArtemisJolokiaClient(
+            'amq', server.host, str(server.port), 'admin', 'admin'
+        )
+        try:
+            queues = client.list_queues()
+            assert queues.success and len(queues.data) == 1200
+            assert queues.data[1] == dict(server.queues['queue.1'])
+            assert len(client.list_addresses().data) == 600
+
+            assert client.create_queue('orders', 'orders').success
+            assert client.list_queues('orders', exact=True).data[0]['address'] == 'orders'
+            existing = client.create_queue('orders', 'orders')
+            assert existing.error_type.endswith('ActiveMQQueueExistsException')
+
+            metrics = client.read_queue_metrics(['MessageCount'], address='queue.0')
+            assert metrics.value == {'queue.0': {'MessageCount': 0}, 'queue.1': {'MessageCount': 0}}
+
+            assert not client.delete_address('queue.0').success
+            assert client.delete_address('queue.0', force=True).success
+            assert client.list_queues().data[0]['name'] == 'queue.2'
+        finally:
+            client.close()
+
+        unauthorized: ArtemisJolokiaClient = ArtemisJolokiaClient(
+            'amq', server.host, str(server.port), 'admin', 'wrong'
+        )
+        assert not unauthorized.read_attribute('Version').success
+        unauthorized.close()
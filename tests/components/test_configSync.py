@@ -0,0 +1,45 @@
+import os
+
+from iqa.components.abstract.config_sync import ConfigSync
+
+
+def test_render_and_delta(tmpdir) -> None:
+    local_dir: str = str(tmpdir.mkdir('amq'))
+    profile: str = str(tmpdir.join('profile.yaml'))
+    renders: list = []
+    files: dict = {'broker.xml': '<broker/>', os.path.join('etc', 'login.config'): 'login'}
+
+    def render(output_path: str) -> None:
+        renders.append(output_path)
+        for relative, content in files.items():
+            os.makedirs(os.path.dirname(os.path.join(output_path, relative)), exist_ok=True)
+            with open(os.path.join(output_path, relative), 'w') as f:
+                f.write(content)
+
+    with open(profile, 'w') as f:
+        f.write('render: {}')
+
+    sync: ConfigSync = ConfigSync(local_dir)
+    assert sorted(sync.render(render, profile)) == sorted(files)
+    assert sync.delta() == sorted(files)
+    sync.mark_pushed(sync.delta())
+    assert sync.delta() == []
+
+    # Unchanged profile: nothing rendered
+    assert sync.render(render, profile) == []
+    assert len(renders) == 1
+
+    # Changed profile, single output file changed
+    with open(profile, 'w') as f:
+        f.write('render: {changed: true}')
+    files['broker.xml'] = '<broker><changed/></broker>'
+    mtime: float = os.path.getmtime(os.path.join(local_dir, 'etc', 'login.config'))
+    assert sync.render(render, profile) == ['broker.xml']
+    assert sync.delta() == ['broker.xml']
+    assert os.path.getmtime(os.path.join(local_dir, 'etc', 'login.config')) == mtime
+
+    # Local file modified: rendered again even if profile is unchanged
+    with open(os.path.join(local_dir, 'broker.xml'), 'w') as f:
+        f.write('edited')
+    assert sync.render(render, profile) == ['broker.xml']
+    assert len(renders) == 3
@@ -0,0 +1,133 @@
+import os
+
+import pytest
+import yaml
+
+from iqa.components.abstract import configuration
+from iqa.components.abstract.configuration import Configuration, compile_key_path, load_yaml
+from iqa.system.node import NodeAnsible
+from iqa.utils.exceptions import IQAConfigurationException
+
+
+class Component(object):
+    instance_name = None
+
+
+class FakeExecution(object):
+    def __init__(self, success: bool) -> None:
+        self.success: bool = success
+
+    def wait(self) -> None:
+        pass
+
+    def completed_successfully(self) -> bool:
+        return self.success
+
+    def read_stderr(self) -> str:
+        return 'rsync error'
+
+
+class FakeNode(NodeAnsible):
+    """Ansible node recording the commands instead of running them"""
+
+    def __init__(self) -> None:
+        self.commands: list = []
+        self.success: bool = True
+
+    def execute(self, command) -> FakeExecution:  # type: ignore
+        self.commands.append(command)
+        return FakeExecution(self.success)
+
+
+class SampleConfiguration(Configuration):
+    def create_default_configuration(self, **kwargs) -> None:
+        pass
+
+
+def test_load_yaml(tmpdir, monkeypatch) -> None:
+    path: str = str(tmpdir.join('inventory.yml'))
+    with open(path, 'w') as f:
+        f.write('render:\n  template: artemis\n')
+
+    loads: list = []
+    load = yaml.load
+
+    def counting_load(stream, Loader):
+        loads.append(Loader)
+        return load(stream, Loader=Loader)
+
+    monkeypatch.setattr(yaml, 'load', counting_load)
+    first = load_yaml(path)
+    assert load_yaml(path) is first
+    assert loads == [configuration.YAML_LOADER]
+
+    # Modified file is parsed again
+    with open(path, 'w') as f:
+        f.write('render:\n  template: artemis-2\n')
+    os.utime(path, ns=(0, 10 ** 9))
+    assert load_yaml(path) == {'render': {'template': 'artemis-2'}}
+    assert len(loads) == 2
+
+
+def test_data_getter() -> None:
+    config: SampleConfiguration = SampleConfiguration(Component())
+    config.yaml_data = {
+        'broker_xml': {'acceptors': [{'name': 'amqp', 'port': 5672}], 'name': 'amq'},
+        'bootstrap_xml': {'web': {'bind': {'port': 8161}}},
+    }
+
+    assert compile_key_path('broker_xml/acceptors/0/port') == ('broker_xml', 'acceptors', 0, 'port')
+    assert compile_key_path('broker_xml/*') is None
+    assert config._data_getter('bootstrap_xml/web/bind/port', 1) == 8161
+    assert config._data_getter('broker_xml/acceptors/0/port', 1) == 5672
+    assert config._data_getter('broker_xml/acceptors/1/port', 1) == 1
+    assert config._data_getter('broker_xml/name/first', None) is None
+    assert config._data_getter('broker_xml/missing', 'default') == 'default'
+    assert config._data_getter('bootstrap_xml/*/bind/port', None) == 8161
+
+
+def create_pushed_configuration(tmpdir) -> SampleConfiguration:
+    component: Component = Component()
+    component.node = FakeNode()  # type: ignore
+    component.instance_name = 'amq'  # type: ignore
+    config: SampleConfiguration = SampleConfiguration(
+        component, inventory_dir=str(tmpdir)
+    )
+    config.node_config_dir = '/opt/amq/etc'
+    config.config_sync.rendered = {'broker.xml': 'hash1', 'etc/login.config': 'hash2'}
+    return config
+
+
+def test_push_configuration(tmpdir) -> None:
+    config: SampleConfiguration = create_pushed_configuration(tmpdir)
+    node: FakeNode = config.component.node
+
+    assert config.push_configuration() == ['broker.xml', 'etc/login.config']
+    assert len(node.commands) == 1
+    files_list: str = str(tmpdir.join('amq.files'))
+    assert node.commands[0].args == [
+        'src=%s dest=/opt/amq/etc rsync_opts=--files-from=%s'
+        % (config.local_config_dir, files_list)
+    ]
+    with open(files_list) as f:
+        assert f.read() == 'broker.xml\netc/login.config\n'
+
+    # Node up to date: nothing copied
+    assert config.push_configuration() == []
+    assert len(node.commands) == 1
+
+    # Only the changed file is copied
+    config.config_sync.rendered['broker.xml'] = 'hash3'
+    assert config.push_configuration() == ['broker.xml']
+    assert node.commands[1].args[0].endswith('--files-from=%s' % files_list)
+
+
+def test_push_configuration_failed(tmpdir) -> None:
+    config: SampleConfiguration = create_pushed_configuration(tmpdir)
+    config.component.node.success = False
+
+    with pytest.raises(IQAConfigurationException):
+        config.push_configuration()
+
+    # Files are only marked as pushed once copied
+    assert config.config_sync.delta() == ['broker.xml', 'etc/login.config']
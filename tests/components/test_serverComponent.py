@@ -0,0 +1,52 @@
+from iqa.components.routers.dispatch.dispatch import Dispatch
+from iqa.system.executor.localhost.executor_local import ExecutorLocal
+from iqa.system.service.probe import AllProbes, TcpProbe
+from iqa.system.service.service_systemd import ServiceSystemD
+
+
+class FakeNode(object):
+    def __init__(self, hostname: str, ip: str = '') -> None:
+        self.hostname: str = hostname
+        self.ip: str = ip
+
+
+class FakeListener(object):
+    def __init__(self, port: int) -> None:
+        self.port: int = port
+
+
+def create_router(listeners=None, **kwargs) -> Dispatch:
+    service: ServiceSystemD = ServiceSystemD('qdrouterd', ExecutorLocal())
+    return Dispatch(
+        'router1',
+        FakeNode('router1', '10.0.0.1'),  # type: ignore
+        listeners,
+        service=service,
+        **kwargs
+    )
+
+
+def test_default_probe_from_port():
+    router: Dispatch = create_router(router_port=5673)
+
+    probe = router.service.probe
+    assert isinstance(probe, TcpProbe)
+    assert (probe.host, probe.port) == ('10.0.0.1', 5673)
+
+
+def test_default_probe_composed_from_listeners():
+    router: Dispatch = create_router([FakeListener(5672), FakeListener(5671)])
+
+    probe = router.service.probe
+    assert isinstance(probe, AllProbes)
+    assert [p.port for p in probe.probes] == [5671, 5672]  # type: ignore
+
+
+def test_service_probe_kept():
+    service: ServiceSystemD = ServiceSystemD('qdrouterd', ExecutorLocal())
+    service.probe = TcpProbe('localhost', 8080)
+    router: Dispatch = Dispatch(
+        'router1', FakeNode('router1'), None, service=service  # type: ignore
+    )
+
+    assert router.service.probe is service.probe
@@ -0,0 +1,73 @@
+import os
+import threading
+import time
+
+from iqa.instance import snapshot
+from iqa.instance.instance_async import AsyncInstance, SyncInstance
+from iqa.system.command.command_base import CommandBase
+from iqa.system.executor import ExecutorBase
+from iqa.system.executor.execution import ExecutionBase
+from iqa.system.service.service import ServiceStatus
+from iqa.utils.runtime import run_sync
+
+SNAPSHOT: dict = {
+    'version': snapshot.SNAPSHOT_VERSION,
+    'inventory': 'inventory.yml',
+    'hosts': [],
+}
+
+# Workers of the default executor of the runtime loop
+DEFAULT_WORKERS: int = min(32, (os.cpu_count() or 1) + 4)
+
+
+class BlockingExecutor(ExecutorBase):
+    """
+    Executor whose commands block (run in the default executor of the loop).
+    """
+
+    def __init__(self) -> None:
+        super(BlockingExecutor, self).__init__()
+        self.executed: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    def _execute(self, command: CommandBase) -> ExecutionBase:  # type: ignore
+        time.sleep(0.01)
+        with self._lock:
+            self.executed += 1
+        return None  # type: ignore
+
+
+class FakeService(object):
+    def __init__(self, executor: BlockingExecutor) -> None:
+        self.executor: BlockingExecutor = executor
+
+    def status(self) -> ServiceStatus:
+        self.executor.execute_sync(CommandBase(['status']))
+        return ServiceStatus.RUNNING
+
+
+class FakeComponent(object):
+    def __init__(self, executor: BlockingExecutor) -> None:
+        self.service: FakeService = FakeService(executor)
+
+
+def test_service_operations_outnumber_default_workers():
+    executor: BlockingExecutor = BlockingExecutor()
+    instance: AsyncInstance = AsyncInstance.from_snapshot(SNAPSHOT)
+    components: list = [FakeComponent(executor) for _ in range(DEFAULT_WORKERS + 1)]
+    instance.components.extend(components)
+
+    statuses: list = run_sync(instance.status(), timeout=30)
+
+    assert statuses == [ServiceStatus.RUNNING] * len(components)
+    assert executor.executed == len(components)
+
+
+def test_sync_instance():
+    executor: BlockingExecutor = BlockingExecutor()
+    instance: SyncInstance = SyncInstance.__new__(SyncInstance)
+    instance.instance = AsyncInstance.from_snapshot(SNAPSHOT)
+    instance.components.extend(FakeComponent(executor) for _ in range(3))
+
+    with instance:
+        assert instance.status() == [ServiceStatus.RUNNING] * 3
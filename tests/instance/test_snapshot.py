@@ -0,0 +1,60 @@
+import pytest
+
+from iqa.instance import snapshot
+from iqa.instance.instance import Instance
+from iqa.system.executor.localhost.executor_local import ExecutorLocal
+from iqa.system.service import ServiceFactory
+from iqa.system.service.service_system_init import ServiceSystemInit
+
+SNAPSHOT: dict = {
+    'version': snapshot.SNAPSHOT_VERSION,
+    'inventory': 'inventory.yml',
+    'hosts': [
+        {
+            'name': 'node1',
+            'vars': {'executor': 'local', 'ansible_host': '10.0.0.1'},
+            'facts': {'ip': '10.0.0.1', 'reachable': True},
+        },
+        {
+            'name': 'node2',
+            'vars': {'executor': 'local'},
+            'facts': {'ip': None, 'reachable': False},
+        },
+    ],
+}
+
+
+def test_from_snapshot():
+    instance = Instance.from_snapshot(SNAPSHOT)
+
+    assert instance.inventory == 'inventory.yml'
+    assert [node.hostname for node in instance.nodes] == ['node1', 'node2']
+    assert [node.reachable for node in instance.nodes] == [True, False]
+    assert instance.nodes[0].ip == '10.0.0.1'
+    assert isinstance(instance.nodes[0].executor, ExecutorLocal)
+    assert instance.snapshot() == SNAPSHOT
+
+
+def test_dumps_loads(tmpdir):
+    instance = snapshot.loads(snapshot.dumps(Instance.from_snapshot(SNAPSHOT)))
+    assert instance.snapshot() == SNAPSHOT
+
+    path = str(tmpdir.join('snapshot.json'))
+    snapshot.save(instance, path)
+    assert snapshot.load(path).snapshot() == SNAPSHOT
+
+
+def test_unsupported_version():
+    with pytest.raises(ValueError, match='Unsupported instance snapshot version'):
+        Instance.from_snapshot(dict(SNAPSHOT, version=0))
+
+
+def test_service_implementation_not_probed():
+    class ExecutorNoCommands(ExecutorLocal):
+        async def _execute(self, command):
+            raise AssertionError('Service should not be probed')
+
+    service = ServiceFactory.create_service(
+        ExecutorNoCommands(), service_name='qdrouterd', implementation='system_init'
+    )
+    assert isinstance(service, ServiceSystemInit)
@@ -33,3 +33,21 @@ class TestExecutorContainer:
         await execution.run()
         await execution.wait()
         assert execution.completed_successfully()
+
+    @pytest.mark.asyncio
+    async def test_execute(self, executor: ExecutorAsyncio) -> None:
+        cmd: CommandBase = CommandBase(args=["echo", "iqa"])
+
+        execution: ExecutionAsyncio = await executor.execute(cmd)
+        assert execution.completed_successfully()
+        assert not execution.is_running()
+        assert execution.read_stdout() == 'iqa\n'
+        assert execution.read_stdout(lines=True) == ['iqa\n']
+
+    def test_execute_sync(self, executor: ExecutorAsyncio) -> None:
+        cmd: CommandBase = CommandBase(args=["sh", "-c", "echo failed >&2; exit 3"])
+
+        execution: ExecutionAsyncio = executor.execute_sync(cmd)
+        assert not execution.completed_successfully()
+        assert execution.return_code == 3
+        assert execution.read_stderr() == "failed\n"
@@ -0,0 +1,111 @@
+import subprocess
+import time
+
+from iqa.system.executor.localhost.executor_local import ExecutorLocal
+from iqa.system.service.liveness import LivenessWatcher
+from iqa.system.service.service import Service, ServiceStatus
+
+
+class ProcessService(Service):
+    def __init__(self) -> None:
+        super().__init__('sleep', ExecutorLocal())
+        self.process = None
+
+    @property
+    def main_pid(self):
+        if self.process is None or self.process.poll() is not None:
+            return None
+        return self.process.pid
+
+    def status(self) -> ServiceStatus:
+        return ServiceStatus.RUNNING if self.main_pid else ServiceStatus.STOPPED
+
+    def start(self, wait: bool = False):
+        self.process = subprocess.Popen(['sleep', '60'])
+
+    def stop(self, wait: bool = False):
+        self.process.kill()
+
+    def restart(self, wait: bool = False):
+        self.stop()
+        self.start()
+
+    def enable(self):
+        return None
+
+    def disable(self):
+        return None
+
+
+def test_liveness_watcher() -> None:
+    service: ProcessService = ProcessService()
+    service.start()
+    watcher: LivenessWatcher = LivenessWatcher(service, interval=0.05)
+    deaths: list = []
+    watcher.on_death(deaths.append)
+    watcher.start()
+    try:
+        time.sleep(0.2)
+        assert watcher.alive
+
+        killed: float = time.time()
+        service.stop()
+        assert watcher.wait_for_death(timeout=5)
+        assert watcher.deaths[0] - killed < 0.5
+        assert deaths == [watcher]
+        assert not watcher.alive
+
+        service.start()
+        started: float = time.time()
+        while not watcher.alive and time.time() - started < 5:
+            time.sleep(0.05)
+        assert watcher.alive
+        assert len(watcher.windows) == 1
+        assert watcher.windows[0].duration > 0
+    finally:
+        watcher.stop()
+        service.stop()
+
+
+class FailingWaitService(ProcessService):
+    """Exit of the process can not be waited for (i.e. pid already gone)"""
+
+    async def wait_for_exit(self, pid: int) -> None:
+        raise ProcessLookupError(pid)
+
+
+def test_death_right_after_start() -> None:
+    service: ProcessService = ProcessService()
+    service.start()
+    watcher: LivenessWatcher = LivenessWatcher(service, interval=0.05).start()
+    try:
+        killed: float = time.time()
+        service.stop()
+        assert watcher.wait_for_death(timeout=5, since=killed)
+        assert len(watcher.deaths) == 1
+    finally:
+        watcher.stop()
+
+
+def test_death_without_exit_wait() -> None:
+    service: FailingWaitService = FailingWaitService()
+    service.start()
+    watcher: LivenessWatcher = LivenessWatcher(service, interval=0.05).start()
+    try:
+        assert watcher.alive
+        killed: float = time.time()
+        service.stop()
+        assert watcher.wait_for_death(timeout=5, since=killed)
+        assert not watcher.alive
+    finally:
+        watcher.stop()
+
+
+def test_not_running_at_start() -> None:
+    watcher: LivenessWatcher = LivenessWatcher(ProcessService(), interval=0.05)
+    try:
+        # The first pid is resolved when start returns
+        assert not watcher.start().alive
+        assert watcher.deaths == []
+    finally:
+        watcher.stop()
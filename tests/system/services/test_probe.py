@@ -0,0 +1,112 @@
+import asyncio
+import time
+
+import pytest
+
+from iqa.system.executor.asyncio_localhost.executor import ExecutorAsyncio
+from iqa.system.service.probe import (
+    AllProbes,
+    AmqpProbe,
+    AnyProbe,
+    Backoff,
+    LogLineProbe,
+    Probe,
+    TcpProbe,
+)
+
+
+class ProbeAfter(Probe):
+    """Ready after the given number of checks"""
+
+    def __init__(self, checks: int) -> None:
+        self.checks: int = checks
+        self.attempts: int = 0
+
+    async def check(self) -> bool:
+        self.attempts += 1
+        return self.attempts > self.checks
+
+
+async def start_server(response: bytes = b''):
+    async def handle(reader, writer):
+        if response:
+            await reader.readexactly(8)
+            writer.write(response)
+            await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, '127.0.0.1', 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+def unused_port() -> int:
+    import socket
+
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def test_backoff_delays():
+    delays = Backoff(initial=0.1, maximum=0.4, factor=2, jitter=0).delays()
+    assert [next(delays) for _ in range(4)] == [0.1, 0.2, 0.4, 0.4]
+
+
+@pytest.mark.asyncio
+async def test_wait_retries_until_ready():
+    probe = ProbeAfter(3)
+    assert await probe.wait(timeout=5, backoff=Backoff(initial=0.01))
+    assert probe.attempts == 4
+
+
+@pytest.mark.asyncio
+async def test_wait_deadline():
+    started = time.monotonic()
+    assert not await ProbeAfter(1000).wait(timeout=0.3, backoff=Backoff(initial=0.01))
+    assert time.monotonic() - started < 1
+
+
+@pytest.mark.asyncio
+async def test_tcp_probe():
+    server, port = await start_server()
+    async with server:
+        assert await TcpProbe('127.0.0.1', port).check()
+    assert not await TcpProbe('127.0.0.1', unused_port()).check()
+
+
+@pytest.mark.asyncio
+async def test_amqp_probe():
+    server, port = await start_server(b'AMQP\x03\x01\x00\x00')
+    async with server:
+        assert await AmqpProbe('127.0.0.1', port).check()
+
+    server, port = await start_server(b'HTTP/1.1')
+    async with server:
+        assert not await AmqpProbe('127.0.0.1', port).check()
+
+
+@pytest.mark.asyncio
+async def test_composition():
+    ready, not_ready = ProbeAfter(0), ProbeAfter(1000)
+
+    assert isinstance(ready & not_ready, AllProbes)
+    assert len((ready & not_ready & ready).probes) == 3
+    assert isinstance(ready | not_ready, AnyProbe)
+
+    backoff = Backoff(initial=0.01)
+    assert await (ready | not_ready).wait(timeout=5, backoff=backoff)
+    assert not await (ready & not_ready).wait(timeout=0.2, backoff=backoff)
+    assert await (ProbeAfter(2) & ProbeAfter(3)).wait(timeout=5, backoff=backoff)
+
+
+@pytest.mark.asyncio
+async def test_log_line_probe(tmpdir):
+    log = tmpdir.join('server.log')
+    log.write('Server is now live\n')
+
+    probe = LogLineProbe(ExecutorAsyncio(), str(log), 'now live')
+    await probe.prepare()
+    assert not await probe.check()
+
+    log.write('Server is now live\n', mode='a')
+    assert await probe.check()
@@ -0,0 +1,139 @@
+import threading
+import time
+
+import pytest
+
+from iqa.system.executor.localhost.executor_local import ExecutorLocal
+from iqa.system.service.probe import Probe
+from iqa.system.service.service import Service, ServiceStatus
+from iqa.system.service.service_group import ServiceGroup
+from iqa.utils.exceptions import IQAServiceNotReadyException
+
+DELAY: float = 0.2
+
+
+class ReadyProbe(Probe):
+    def __init__(self, ready: bool) -> None:
+        self.ready: bool = ready
+        self.checks: int = 0
+
+    async def check(self) -> bool:
+        self.checks += 1
+        return self.ready
+
+
+class FakeService(Service):
+    events: list = []
+    started: list = []
+    lock: threading.Lock = threading.Lock()
+
+    def __init__(self, name: str, ready: bool = True) -> None:
+        super().__init__(name, ExecutorLocal())
+        self.probe = ReadyProbe(ready)
+
+    def _operation(self, operation: str) -> str:
+        with self.lock:
+            self.events.append((operation, self.name))
+            self.started.append(time.monotonic())
+        time.sleep(DELAY)
+        return '%s %s' % (operation, self.name)
+
+    def status(self) -> ServiceStatus:
+        return ServiceStatus.RUNNING
+
+    def start(self, wait: bool = False):
+        return self._operation('start')
+
+    def stop(self, wait: bool = False):
+        return self._operation('stop')
+
+    def restart(self, wait: bool = False):
+        return self._operation('restart')
+
+    def enable(self):
+        return None
+
+    def disable(self):
+        return None
+
+
+class WaitingService(FakeService):
+    """Waits for readiness by default (as ServiceFakeArtemis used to)"""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.waits: list = []
+
+    def start(self, wait: bool = True):
+        self.waits.append(wait)
+        execution: str = super().start()
+        if wait:
+            self.wait_until_ready()
+        return execution
+
+
+@pytest.fixture
+def services() -> list:
+    FakeService.events = []
+    FakeService.started = []
+    return [FakeService('broker%d' % index) for index in range(4)]
+
+
+def test_parallel_start(services):
+    group = ServiceGroup(services)
+    assert group.start(wait=True) == ['start broker%d' % index for index in range(4)]
+
+    timing = group.last_timing
+    assert timing.name == 'start'
+    assert timing.duration < DELAY * 2
+    assert sorted(timing.services) == ['broker0', 'broker1', 'broker2', 'broker3']
+    assert all(timing.ready.values())
+
+
+def test_single_readiness_wait():
+    service: WaitingService = WaitingService('broker0')
+    ServiceGroup([service]).start(wait=True)
+
+    # The group waits for the service to be ready, the service does not
+    assert service.waits == [False]
+    assert service.probe.checks == 1  # type: ignore
+
+
+def test_stagger(services):
+    group = ServiceGroup(services)
+    group.stop(stagger=0.1)
+    assert [name for _operation, name in FakeService.events] == [
+        'broker0', 'broker1', 'broker2', 'broker3'
+    ]
+    assert group.last_timing.duration >= 0.3 + DELAY
+
+
+def test_stagger_limited_workers(services):
+    group = ServiceGroup(services, max_workers=2)
+    group.stop(stagger=0.1)
+
+    # Waiting for a free worker does not add up to the stagger delay
+    assert group.last_timing.duration < 2 * DELAY + 0.1 + DELAY / 2
+    gaps = [b - a for a, b in zip(FakeService.started, FakeService.started[1:])]
+    assert all(gap >= 0.09 for gap in gaps)
+
+
+def test_rolling_restart(services):
+    group = ServiceGroup(services)
+    group.rolling_restart(batch_size=2)
+    assert [timing.name for timing in group.timings] == [
+        'rolling_restart[0]', 'rolling_restart[1]'
+    ]
+    assert sorted(group.timings[0].services) == ['broker0', 'broker1']
+
+
+def test_rolling_restart_not_ready(services):
+    services[1].probe = ReadyProbe(False)
+    group = ServiceGroup(services)
+    with pytest.raises(IQAServiceNotReadyException, match='broker1'):
+        group.rolling_restart(batch_size=2, timeout=0.2)
+
+    # Second batch is not restarted
+    assert sorted(name for _operation, name in FakeService.events) == [
+        'broker0', 'broker1'
+    ]
@@ -0,0 +1,85 @@
+from iqa.system.service.service import ServiceStatus
+from iqa.system.service.service_systemd import ServiceSystemD
+from iqa.system.service.systemd_status import SystemdStatusCache, parse_systemctl_show
+
+SHOW_OUTPUT: str = """broker1 | CHANGED | rc=0 >>
+ActiveState=active
+SubState=running
+MainPID=1234
+ExecMainStartTimestamp=Mon 2020-01-06 10:00:00 UTC
+
+ActiveState=inactive
+SubState=dead
+MainPID=0
+ExecMainStartTimestamp=
+
+ActiveState=failed
+SubState=failed
+MainPID=0
+ExecMainStartTimestamp=
+"""
+
+
+class FakeExecution(object):
+    def __init__(self, output: str) -> None:
+        self.output: str = output
+
+    def read_stdout(self) -> str:
+        return self.output
+
+    def completed_successfully(self) -> bool:
+        return True
+
+
+class FakeExecutor(object):
+    def __init__(self, output: str) -> None:
+        self.output: str = output
+        self.commands: list = []
+
+    def execute_sync(self, command) -> FakeExecution:
+        self.commands.append(command.args)
+        return FakeExecution(self.output)
+
+
+def test_parse_systemctl_show() -> None:
+    units = parse_systemctl_show(SHOW_OUTPUT)
+    assert len(units) == 3
+    assert units[0] == {
+        'ActiveState': 'active',
+        'SubState': 'running',
+        'MainPID': '1234',
+        'ExecMainStartTimestamp': 'Mon 2020-01-06 10:00:00 UTC',
+    }
+    assert units[1]['ActiveState'] == 'inactive'
+    assert units[2]['ExecMainStartTimestamp'] == ''
+
+
+def test_status_batched() -> None:
+    executor: FakeExecutor = FakeExecutor(SHOW_OUTPUT)
+    cache: SystemdStatusCache = SystemdStatusCache(executor, ttl=60)
+    services = []
+    for name in ('qdrouterd', 'artemis', 'httpd'):
+        service: ServiceSystemD = ServiceSystemD.__new__(ServiceSystemD)
+        service.name = name
+        service.status_cache = cache
+        cache.register(name)
+        services.append(service)
+
+    assert [service.status() for service in services] == [
+        ServiceStatus.RUNNING,
+        ServiceStatus.STOPPED,
+        ServiceStatus.FAILED,
+    ]
+    assert services[0].main_pid == 1234
+    assert services[1].main_pid is None
+    assert len(executor.commands) == 1
+    assert executor.commands[0][-3:] == ['qdrouterd', 'artemis', 'httpd']
+
+    cache.invalidate('artemis')
+    services[1].status()
+    assert len(executor.commands) == 2
+
+
+def test_status_unavailable() -> None:
+    cache: SystemdStatusCache = SystemdStatusCache(FakeExecutor(''))
+    assert cache.get('qdrouterd') == {}
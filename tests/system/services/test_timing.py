@@ -0,0 +1,102 @@
+import pytest
+
+from iqa.system.executor.localhost.executor_local import ExecutorLocal
+from iqa.system.service.probe import Probe
+from iqa.system.service.service import Service, ServiceStatus
+from iqa.system.service.timing import (
+    CONFIRMED,
+    EXITED,
+    READY,
+    TimingStore,
+    TransitionTiming,
+    percentile,
+)
+
+
+class FakeExecution(object):
+    def wait(self) -> None:
+        pass
+
+
+class ReadyProbe(Probe):
+    async def check(self) -> bool:
+        return True
+
+
+class FakeService(Service):
+    def __init__(self, name: str) -> None:
+        super().__init__(name, ExecutorLocal())
+        self.component_type = 'broker'
+        self.current: ServiceStatus = ServiceStatus.STOPPED
+
+    def _set(self, status: ServiceStatus) -> FakeExecution:
+        self.current = status
+        return FakeExecution()
+
+    def status(self) -> ServiceStatus:
+        return self.current
+
+    def start(self, wait: bool = False):
+        return self._execute_and_wait(
+            lambda: self._set(ServiceStatus.RUNNING), wait, name='start'
+        )
+
+    def stop(self, wait: bool = False):
+        return self._execute_and_wait(
+            lambda: self._set(ServiceStatus.STOPPED),
+            wait,
+            name='stop',
+            status=ServiceStatus.STOPPED,
+        )
+
+    def restart(self, wait: bool = False):
+        return self.start(wait)
+
+    def enable(self):
+        return None
+
+    def disable(self):
+        return None
+
+
+def test_percentile() -> None:
+    assert percentile([3.0, 1.0, 2.0], 50) == 2.0
+    assert percentile([1.0, 2.0], 50) == 1.5
+    assert percentile([5.0], 99) == 5.0
+    with pytest.raises(ValueError):
+        percentile([], 50)
+
+
+def test_service_transitions(monkeypatch, tmpdir) -> None:
+    store: TimingStore = TimingStore()
+    monkeypatch.setattr('iqa.system.service.service.TIMINGS', store)
+
+    service: FakeService = FakeService('broker1')
+    service.probe = ReadyProbe()
+    service.start(wait=True)
+    service.stop(wait=True)
+    service.start()
+
+    start, stop, start_no_wait = store.timings
+    assert set(start.phases) == {'issued', EXITED, CONFIRMED, READY}
+    assert set(stop.phases) == {'issued', EXITED, CONFIRMED}
+    assert set(start_no_wait.phases) == {'issued', EXITED}
+
+    summary = store.summary()
+    assert summary['broker']['start'][EXITED]['count'] == 2
+    assert summary['broker']['start'][READY]['count'] == 1
+    assert 'p90' in summary['broker']['stop'][CONFIRMED]
+
+    # Without probe, the service is only confirmed running
+    service.probe = None
+    service.stop()
+    service.start(wait=True)
+    assert set(store.timings[-1].phases) == {'issued', EXITED, CONFIRMED}
+
+    path: str = str(tmpdir.join('timings.jsonl'))
+    store.save(path)
+    store.save(path)
+    loaded: TimingStore = TimingStore.load(path)
+    assert len(loaded.timings) == 10
+    assert loaded.timings[0].phases == start.phases
+    assert isinstance(loaded.timings[0], TransitionTiming)
@@ -0,0 +1,70 @@
+import queue
+import threading
+import time
+
+from iqa.utils import docker_events
+from iqa.utils.docker_events import DockerEventMonitor
+
+
+class FakeStream(object):
+    def __init__(self) -> None:
+        self.events: queue.Queue = queue.Queue()
+
+    def __iter__(self):
+        while True:
+            event = self.events.get()
+            if event is None:
+                return
+            yield event
+
+    def close(self) -> None:
+        self.events.put(None)
+
+
+class FakeContainer(object):
+    def __init__(self, name: str, status: str) -> None:
+        self.name: str = name
+        self.status: str = status
+
+
+class FakeContainers(object):
+    def list(self, all: bool = False) -> list:
+        return [FakeContainer('broker1', 'exited'), FakeContainer('router1', 'running')]
+
+
+class FakeClient(object):
+    def __init__(self) -> None:
+        self.stream: FakeStream = FakeStream()
+        self.containers: FakeContainers = FakeContainers()
+
+    def events(self, **kwargs) -> FakeStream:
+        return self.stream
+
+
+def event(action: str, name: str) -> dict:
+    return {'Type': 'container', 'Action': action, 'Actor': {'Attributes': {'name': name}}}
+
+
+def test_state_table(monkeypatch) -> None:
+    client: FakeClient = FakeClient()
+    monkeypatch.setattr(docker_events, 'get_client', lambda docker_host: client)
+
+    monitor: DockerEventMonitor = DockerEventMonitor()
+    monitor.start()
+    try:
+        assert monitor.get_state('broker1') == 'exited'
+        assert monitor.get_state('router1') == 'running'
+
+        threading.Timer(0.1, client.stream.events.put, [event('start', 'broker1')]).start()
+        started: float = time.monotonic()
+        assert monitor.wait_for('broker1', lambda state: state == 'running', timeout=5)
+        assert time.monotonic() - started < 1
+
+        client.stream.events.put(event('destroy', 'router1'))
+        assert monitor.wait_for('router1', lambda state: state is None, timeout=5)
+        assert not monitor.wait_for('broker1', lambda state: state == 'paused', timeout=0.1)
+    finally:
+        monitor.stop()
+
+    assert not monitor.running
+    assert not monitor.wait_for('broker1', lambda state: state == 'paused', timeout=5)
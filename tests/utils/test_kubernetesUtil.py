@@ -0,0 +1,60 @@
+from types import SimpleNamespace
+
+import kubernetes.watch
+
+from iqa.utils.kubernetes_util import is_pod_ready, wait_for_ready_pods
+
+
+def pod(name: str, ready: bool, deleting: bool = False) -> SimpleNamespace:
+    return SimpleNamespace(
+        metadata=SimpleNamespace(name=name, deletion_timestamp='now' if deleting else None),
+        status=SimpleNamespace(
+            conditions=[SimpleNamespace(type='Ready', status='True' if ready else 'False')]
+        ),
+    )
+
+
+class FakeApi(object):
+    def list_namespaced_pod(self, namespace: str, label_selector: str = '', **kwargs):
+        return SimpleNamespace(
+            items=[pod('router-1', True), pod('router-2', False)],
+            metadata=SimpleNamespace(resource_version='10'),
+        )
+
+
+class FakeWatch(object):
+    events: list = []
+
+    def stream(self, func, *args, **kwargs):
+        assert kwargs['resource_version'] == '10'
+        for event in self.events:
+            yield event
+        raise AssertionError('Watch should have been interrupted')
+
+    def stop(self) -> None:
+        pass
+
+
+def test_is_pod_ready() -> None:
+    assert is_pod_ready(pod('router-1', True))
+    assert not is_pod_ready(pod('router-1', False))
+    assert not is_pod_ready(pod('router-1', True, deleting=True))
+
+
+def test_wait_for_ready_pods(monkeypatch) -> None:
+    monkeypatch.setattr(kubernetes.watch, 'Watch', FakeWatch)
+
+    # scale up
+    FakeWatch.events = [
+        {'type': 'ADDED', 'object': pod('router-3', False)},
+        {'type': 'MODIFIED', 'object': pod('router-2', True)},
+        {'type': 'MODIFIED', 'object': pod('router-3', True)},
+    ]
+    assert wait_for_ready_pods(FakeApi(), 'default', 'app=router', 3, timeout=5) is not None
+
+    # scale down (terminating pods are expected to be gone)
+    FakeWatch.events = [
+        {'type': 'MODIFIED', 'object': pod('router-2', False, deleting=True)},
+        {'type': 'DELETED', 'object': pod('router-2', False, deleting=True)},
+    ]
+    assert wait_for_ready_pods(FakeApi(), 'default', 'app=router', 1, timeout=5) is not None
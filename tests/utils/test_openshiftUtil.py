@@ -0,0 +1,91 @@
+import pytest
+
+from iqa.utils.exceptions import IQAConfigurationException
+from iqa.utils.openshift_util import OpenShiftUtil
+
+
+class FakeExecution(object):
+    def wait(self) -> None:
+        pass
+
+    def completed_successfully(self) -> bool:
+        return True
+
+
+class FailedExecution(FakeExecution):
+    def completed_successfully(self) -> bool:
+        return False
+
+    def read_stdout(self) -> str:
+        return 'error: invalid token'
+
+
+class FakeExecutor(object):
+    def __init__(self, hostname: str = '') -> None:
+        self.hostname: str = hostname
+        self.commands: list = []
+
+    def execute_sync(self, command) -> FakeExecution:
+        self.commands.append(command.args[:2])
+        return FakeExecution()
+
+
+@pytest.fixture(autouse=True)
+def sessions(monkeypatch) -> dict:
+    sessions: dict = {}
+    monkeypatch.setattr(OpenShiftUtil, '_sessions', sessions)
+    return sessions
+
+
+def test_login_cached(monkeypatch) -> None:
+    executor: FakeExecutor = FakeExecutor()
+    ocp: OpenShiftUtil = OpenShiftUtil(executor, 'https://ocp:8443', 'token')
+    ocp.scale(3, 'amq-interconnect')
+    ocp.scale(1, 'amq-interconnect')
+    assert executor.commands == [['oc', 'login'], ['oc', 'scale'], ['oc', 'scale']]
+
+    # Another token requires a new login
+    OpenShiftUtil(executor, 'https://ocp:8443', 'other').scale(1, 'amq-interconnect')
+    assert executor.commands[-2:] == [['oc', 'login'], ['oc', 'scale']]
+
+    # Expired sessions are validated
+    del executor.commands[:]
+    monkeypatch.setattr(OpenShiftUtil, 'LOGIN_TTL', 0)
+    ocp2: OpenShiftUtil = OpenShiftUtil(executor, 'https://ocp:8443', 'other')
+    ocp2.scale(2, 'amq-interconnect', wait=True)
+    assert executor.commands == [['oc', 'whoami'], ['oc', 'scale'], ['oc', 'whoami'], ['oc', 'rollout']]
+
+
+def test_session_shared_by_machine(sessions) -> None:
+    # Different executor objects running oc on the same machine share its session
+    executor1: FakeExecutor = FakeExecutor('node1')
+    executor2: FakeExecutor = FakeExecutor('node1')
+    OpenShiftUtil(executor1, 'https://ocp:8443', 'token').scale(1, 'router')
+    OpenShiftUtil(executor2, 'https://ocp:8443', 'token').scale(1, 'router')
+    assert executor2.commands == [['oc', 'scale']]
+
+    # A login with another token on that machine replaces the session
+    OpenShiftUtil(executor2, 'https://ocp:8443', 'other').scale(1, 'router')
+    OpenShiftUtil(executor1, 'https://ocp:8443', 'token').scale(1, 'router')
+    assert executor1.commands[-2:] == [['oc', 'login'], ['oc', 'scale']]
+
+    # Other machines and kubeconfig files have their own session
+    executor3: FakeExecutor = FakeExecutor('node2')
+    OpenShiftUtil(executor3, 'https://ocp:8443', 'token').scale(1, 'router')
+    OpenShiftUtil(executor1, 'https://ocp:8443', 'token', '/tmp/kubeconfig').scale(
+        1, 'router'
+    )
+    assert executor3.commands[0] == ['oc', 'login']
+    assert executor1.commands[-2:] == [['oc', '--kubeconfig'], ['oc', '--kubeconfig']]
+    assert set(sessions) == {
+        ('node1', OpenShiftUtil.DEFAULT_KUBECONFIG),
+        ('node1', '/tmp/kubeconfig'),
+        ('node2', OpenShiftUtil.DEFAULT_KUBECONFIG),
+    }
+
+
+def test_login_failed() -> None:
+    executor: FakeExecutor = FakeExecutor()
+    executor.execute_sync = lambda command: FailedExecution()  # type: ignore
+    with pytest.raises(IQAConfigurationException, match='https://ocp:8443'):
+        OpenShiftUtil(executor, 'https://ocp:8443', 'token').scale(1, 'router')
@@ -0,0 +1,84 @@
+import pytest
+
+from iqa.utils.plugins import PluginRegistry, import_reference
+
+
+class SomeImplementation:
+    implementation: str = 'some'
+
+
+def test_import_reference():
+    assert import_reference('os.path:join') is import_reference('os.path').join
+
+
+def test_get_lazy_reference():
+    registry = PluginRegistry('iqa.test', {'some': '%s:SomeImplementation' % __name__})
+    assert not registry.is_loaded('some')
+    assert registry.get('some') is SomeImplementation
+    assert registry.is_loaded('some')
+
+
+def test_register_class():
+    registry = PluginRegistry('iqa.test')
+    registry.register('some', SomeImplementation)
+    assert 'some' in registry
+    assert registry.names() == ['some']
+    assert registry.get('some') is SomeImplementation
+
+
+def test_get_fail():
+    registry = PluginRegistry('iqa.test')
+    with pytest.raises(ValueError, match=r'.* not found in iqa.test registry'):
+        registry.get('none')
+
+
+def test_executors_registry():
+    from iqa.system.executor import EXECUTORS, create_executor
+    from iqa.system.executor.localhost.executor_local import ExecutorLocal
+
+    assert {'ansible', 'docker', 'kubernetes', 'local', 'ssh'} <= set(EXECUTORS.names())
+    assert isinstance(create_executor('local'), ExecutorLocal)
+    assert create_executor('none') is None
+
+
+def test_register_class_ignores_inherited_name():
+    class Child(SomeImplementation):
+        pass
+
+    registry = PluginRegistry('iqa.test')
+    registry.register_class(Child)
+    assert registry.names() == []
+
+
+@pytest.fixture
+def executors(monkeypatch: pytest.MonkeyPatch) -> PluginRegistry:
+    """
+    Executors registry, restored once the test completes (classes defined
+    in tests register themselves and must not leak into other tests).
+    """
+    from iqa.system.executor import EXECUTORS
+
+    monkeypatch.setattr(EXECUTORS, '_loaded', dict(EXECUTORS._loaded))
+    monkeypatch.setattr(EXECUTORS, '_references', dict(EXECUTORS._references))
+    return EXECUTORS
+
+
+def test_executor_subclass_registered_at_any_depth(executors: PluginRegistry):
+    from iqa.system.executor import create_executor
+    from iqa.system.executor.localhost.executor_local import ExecutorLocal
+
+    class ExecutorLocalCustom(ExecutorLocal):
+        implementation: str = 'local-custom'
+
+    class ExecutorLocalDeeper(ExecutorLocalCustom):
+        implementation: str = 'local-deeper'
+
+    assert executors.get('local-custom') is ExecutorLocalCustom
+    assert isinstance(create_executor('local-deeper'), ExecutorLocalDeeper)
+
+
+def test_executor_registry_restored():
+    from iqa.system.executor import EXECUTORS
+
+    assert 'local-custom' not in EXECUTORS.names()
+    assert 'local-deeper' not in EXECUTORS.names()
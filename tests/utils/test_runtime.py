@@ -0,0 +1,71 @@
+import asyncio
+import threading
+
+import pytest
+
+from iqa.system.executor.localhost.executor_local import ExecutorLocal
+from iqa.utils import runtime
+
+
+async def current_loop_and_thread():
+    return asyncio.get_running_loop(), threading.current_thread()
+
+
+def test_run_sync_reuses_loop():
+    loop, thread = runtime.run_sync(current_loop_and_thread())
+    assert runtime.run_sync(current_loop_and_thread()) == (loop, thread)
+    assert loop is runtime.get_loop()
+    assert thread is not threading.current_thread()
+
+
+def test_run_sync_raises():
+    async def fail():
+        raise ValueError('failed')
+
+    with pytest.raises(ValueError, match='failed'):
+        runtime.run_sync(fail())
+
+
+def test_run_sync_from_runtime_thread():
+    async def nested():
+        coro = current_loop_and_thread()
+        try:
+            runtime.run_sync(coro)
+        finally:
+            coro.close()
+
+    with pytest.raises(RuntimeError):
+        runtime.run_sync(nested())
+
+
+def test_run_sync_timeout_cancels():
+    cancelled = threading.Event()
+
+    async def sleep_forever():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(asyncio.TimeoutError):
+        runtime.run_sync(sleep_forever(), timeout=0.1)
+    assert cancelled.wait(5)
+
+
+def test_resolve():
+    assert runtime.resolve('value') == 'value'
+    assert runtime.resolve(current_loop_and_thread())[0] is runtime.get_loop()
+
+
+def test_executor_connect_default():
+    executor = ExecutorLocal()
+    assert runtime.run_sync(executor.connect()) is None
+    assert runtime.run_sync(executor.disconnect()) is None
+
+
+def test_shutdown():
+    loop = runtime.get_loop()
+    runtime.shutdown()
+    assert loop.is_closed()
+    assert runtime.get_loop() is not loop